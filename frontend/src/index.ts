@@ -424,6 +424,21 @@ export function render({ el, model }: AnyWidgetRenderProps): () => void {
 
 		const outputArea = el.closest(".output-area") as HTMLElement | null;
 
+		// Counts model updates that have reached a rendered frame, so tests can
+		// wait for the frame instead of sleeping. Prop changes are digested before
+		// the next frame, so the second frame after an update includes it.
+		const markUpdateRendered = (): void => {
+			requestAnimationFrame(() => {
+				requestAnimationFrame(() => {
+					const scope = globalThis as {
+						__pyglobegl_rendered_updates?: number;
+					};
+					scope.__pyglobegl_rendered_updates =
+						(scope.__pyglobegl_rendered_updates ?? 0) + 1;
+				});
+			});
+		};
+
 		globe.onGlobeReady(() => {
 			(
 				globalThis as { __pyglobegl_globe_ready?: boolean }
@@ -1395,6 +1410,7 @@ export function render({ el, model }: AnyWidgetRenderProps): () => void {
 					applyLayerProp(globeProps, payload?.prop, payload?.value);
 				}
 			}
+			markUpdateRendered();
 		});
 
 		const resize = () => {
@@ -2174,10 +2190,10 @@ export function render({ el, model }: AnyWidgetRenderProps): () => void {
 			applyViewProps(viewConfig);
 		};
 
-		void applyConfig(initialConfig);
+		void applyConfig(initialConfig).then(markUpdateRendered);
 
 		model.on("change:config", () => {
-			void applyConfig(getConfig());
+			void applyConfig(getConfig()).then(markUpdateRendered);
 		});
 	});
 
@@ -2188,11 +2204,13 @@ export function render({ el, model }: AnyWidgetRenderProps): () => void {
 			__pyglobegl_renderer_attributes?: WebGLContextAttributes | null;
 			__pyglobegl_init_config?: GlobeInitConfig;
 			__pyglobegl_pov?: PointOfView;
+			__pyglobegl_rendered_updates?: number;
 		};
 		delete globalScope.__pyglobegl_globe_ready;
 		delete globalScope.__pyglobegl_renderer_attributes;
 		delete globalScope.__pyglobegl_init_config;
 		delete globalScope.__pyglobegl_pov;
+		delete globalScope.__pyglobegl_rendered_updates;
 	};
 }
 
@@ -52,6 +52,7 @@ from pyglobegl.geopandas import (
     hexed_polygons_from_gdf,
     labels_from_gdf,
     particles_from_gdf,
+    points_arrays_from_gdf,
     points_from_gdf,
     polygons_from_gdf,
     rings_from_gdf,
@@ -114,6 +115,7 @@ __all__ = [
     "image_to_data_url",
     "labels_from_gdf",
     "particles_from_gdf",
+    "points_arrays_from_gdf",
     "points_from_gdf",
     "polygons_from_gdf",
     "rings_from_gdf",
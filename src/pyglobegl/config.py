@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Mapping
+from functools import lru_cache
 from typing import Annotated, Any, Literal
 from uuid import uuid4
 
@@ -33,13 +34,32 @@ PathCoordinate = (
 )
 
 
+@lru_cache(maxsize=4096)
+def _parse_color(value: str) -> Color:
+    return Color(value)
+
+
 def _to_color(value: Any) -> Color:
     if isinstance(value, Color):
         return value
+    if isinstance(value, str):
+        # Layers reuse a handful of color strings, so each is parsed only once.
+        return _parse_color(value)
     return Color(value)
 
 
 ColorValue = Annotated[Color | str, BeforeValidator(_to_color)]
+
+
+def _to_path_coordinates(value: Any) -> Any:
+    # NumPy-style (N, 2) / (N, 3) arrays convert to nested lists in one call.
+    tolist = getattr(value, "tolist", None)
+    if callable(tolist) and not isinstance(value, list):
+        return tolist()
+    return value
+
+
+PathCoordinates = Annotated[list[PathCoordinate], BeforeValidator(_to_path_coordinates)]
 FrontendPythonFunctionInput = FrontendPythonFunction | Callable[..., Any]
 
 
@@ -416,7 +436,7 @@ class PathDatum(BaseModel, extra="allow", frozen=True):
     """Data model for a paths layer entry."""
 
     id: Annotated[UUID4, Field(default_factory=uuid4)] = Field(default_factory=uuid4)
-    path: list[PathCoordinate]
+    path: PathCoordinates
     name: StrictStr | None = None
     label: StrictStr | None = None
     color: ColorValue | list[ColorValue] = Color("#ffffaa")
@@ -438,7 +458,7 @@ class PathDatumPatch(BaseModel, extra="allow", frozen=True):
     """Patch model for a paths layer entry."""
 
     id: UUID4
-    path: list[PathCoordinate] | None = None
+    path: PathCoordinates | None = None
     name: StrictStr | None = None
     label: StrictStr | None = None
     color: ColorValue | list[ColorValue] | None = None
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
-from typing import Any, TYPE_CHECKING, TypeGuard
+from collections.abc import Iterable
+from functools import cache, lru_cache
+from itertools import pairwise
+from types import GenericAlias
+from typing import Any, TYPE_CHECKING, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic.types import AllowInfNan
 
 from pyglobegl.config import (
     ArcDatum,
@@ -23,15 +29,20 @@ from pyglobegl.config import (
 
 
 if TYPE_CHECKING:
+    from geojson_pydantic import MultiPolygon, Polygon
     import geopandas as gpd
-    import pandas as pd
-    import pandera.pandas as pa
-    from pandera.typing import Series
-    from pandera.typing.geopandas import Geometry, GeoSeries
-    from pydantic import BaseModel
+    import numpy as np
+    from pydantic_extra_types.color import Color
+    from pyproj import CRS, Transformer
     from shapely.geometry.base import BaseGeometry
 
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Sphere radius used by EPSG:3857 (WGS 84 semi-major axis).
+_WEB_MERCATOR_RADIUS = 6378137.0
+
+
 def _require_geopandas() -> None:
     try:
         import geopandas as gpd  # noqa: F401
@@ -42,16 +53,6 @@ def _require_geopandas() -> None:
         ) from exc
 
 
-def _require_pandera() -> None:
-    try:
-        import pandera.pandas as pa  # noqa: F401
-    except ModuleNotFoundError as exc:
-        raise ModuleNotFoundError(
-            "pandera is required for GeoDataFrame validation. "
-            "Install with `uv add pyglobegl[geopandas]`."
-        ) from exc
-
-
 def _require_pandas() -> None:
     try:
         import pandas as pd  # noqa: F401
@@ -62,113 +63,24 @@ def _require_pandas() -> None:
         ) from exc
 
 
-def _build_points_schema() -> type[pa.DataFrameModel]:
-    import pandera.pandas as pa
-    from pandera.typing import Series
-    from pandera.typing.geopandas import Geometry, GeoSeries
-
-    globals().update({"Series": Series, "GeoSeries": GeoSeries, "Geometry": Geometry})
-
-    class PointsGeoDataFrameModel(pa.DataFrameModel):
-        """Pandera schema for point geometries."""
-
-        geometry: GeoSeries[Geometry] = pa.Field(
-            nullable=False, dtype_kwargs={"crs": "EPSG:4326"}
-        )
-
-        class Config:
-            coerce = False
-            strict = False
-
-        @pa.check("geometry", error="Geometry must be Points.")
-        def _points_only(self, series: GeoSeries[Geometry]) -> Series[bool]:
-            return series.geom_type == "Point"
-
-    return PointsGeoDataFrameModel
-
-
-def _build_polygons_schema() -> type[pa.DataFrameModel]:
-    import pandera.pandas as pa
-    from pandera.typing import Series
-    from pandera.typing.geopandas import Geometry, GeoSeries
-
-    globals().update({"Series": Series, "GeoSeries": GeoSeries, "Geometry": Geometry})
-
-    class PolygonsGeoDataFrameModel(pa.DataFrameModel):
-        """Pandera schema for polygon geometries."""
-
-        geometry: GeoSeries[Geometry] = pa.Field(
-            nullable=False, dtype_kwargs={"crs": "EPSG:4326"}
-        )
-
-        class Config:
-            coerce = False
-            strict = False
-
-        @pa.check("geometry", error="Geometry must be Polygon or MultiPolygon.")
-        def _polygon_only(self, series: GeoSeries[Geometry]) -> Series[bool]:
-            return series.geom_type.isin(["Polygon", "MultiPolygon"])
-
-    return PolygonsGeoDataFrameModel
-
-
-def _build_paths_schema() -> type[pa.DataFrameModel]:
-    import pandera.pandas as pa
-    from pandera.typing import Series
-    from pandera.typing.geopandas import Geometry, GeoSeries
-
-    globals().update({"Series": Series, "GeoSeries": GeoSeries, "Geometry": Geometry})
-
-    class PathsGeoDataFrameModel(pa.DataFrameModel):
-        """Pandera schema for path geometries."""
-
-        geometry: GeoSeries[Geometry] = pa.Field(
-            nullable=False, dtype_kwargs={"crs": "EPSG:4326"}
-        )
-
-        class Config:
-            coerce = False
-            strict = False
-
-        @pa.check("geometry", error="Geometry must be LineString or MultiLineString.")
-        def _line_only(self, series: GeoSeries[Geometry]) -> Series[bool]:
-            return series.geom_type.isin(["LineString", "MultiLineString"])
-
-    return PathsGeoDataFrameModel
-
-
 def _require_columns(gdf: gpd.GeoDataFrame, columns: Iterable[str]) -> None:
     missing = [col for col in columns if col not in gdf.columns]
     if missing:
         raise ValueError(f"GeoDataFrame missing columns: {missing}")
 
 
-def _prepare_point_gdf(
+def _gather_columns(
     gdf: gpd.GeoDataFrame,
-    *,
-    geometry_column: str | None,
-    default_column: str,
-    context: str,
-) -> gpd.GeoDataFrame:
-    if gdf.crs is None:
-        raise ValueError("GeoDataFrame must have a CRS to convert to EPSG:4326.")
-
-    if geometry_column is None and default_column in gdf.columns:
-        resolved_geometry = default_column
-    else:
-        resolved_geometry = geometry_column or gdf.geometry.name
-    geometry_name = str(resolved_geometry)
-    gdf = gdf.set_geometry(geometry_name, inplace=False)
-    if geometry_name != "geometry":
-        gdf = gdf.rename(columns={geometry_name: "geometry"}).set_geometry(
-            "geometry", inplace=False
-        )
-    if not gdf.geometry.geom_type.eq("Point").all():
-        raise ValueError("Geometry column must contain Point geometries.")
-    gdf = gdf.to_crs(4326)
-    return _validate_schema(
-        _build_points_schema(), gdf, f"GeoDataFrame failed {context} schema validation."
-    )
+    include_columns: Iterable[str] | None,
+    optional_columns: Iterable[str] = (),
+) -> tuple[list[str], dict[str, list[Any]]]:
+    columns = list(include_columns) if include_columns is not None else []
+    _require_columns(gdf, columns)
+    names = dict.fromkeys(columns)
+    names.update(dict.fromkeys(col for col in optional_columns if col in gdf.columns))
+    # Each column is boxed once by pandas (native scalars, Timestamps) so the
+    # per-row loop only indexes prebuilt lists.
+    return columns, {col: gdf[col].tolist() for col in names}
 
 
 def polygons_from_gdf(
@@ -193,7 +105,6 @@ def polygons_from_gdf(
     """
     _require_geopandas()
     _require_pandas()
-    _require_pandera()
 
     if gdf.crs is None:
         raise ValueError("GeoDataFrame must have a CRS to convert to EPSG:4326.")
@@ -210,16 +121,6 @@ def polygons_from_gdf(
     if not gdf.geometry.geom_type.isin(["Polygon", "MultiPolygon"]).all():
         raise ValueError("Geometry column must contain Polygon or MultiPolygon.")
 
-    gdf = gdf.to_crs(4326)
-    gdf = _validate_schema(
-        _build_polygons_schema(), gdf, "polygons_from_gdf schema validation failed."
-    )
-
-    columns = list(include_columns) if include_columns is not None else []
-    missing = [col for col in columns if col not in gdf.columns]
-    if missing:
-        raise ValueError(f"GeoDataFrame missing columns: {missing}")
-
     optional_columns = {
         "name",
         "label",
@@ -229,83 +130,294 @@ def polygons_from_gdf(
         "altitude",
         "cap_curvature_resolution",
     }
-    validation_columns = set(columns)
-    validation_columns.update(col for col in optional_columns if col in gdf.columns)
-    # Pandera's PydanticModel schema must only contain model fields, so validate a
-    # subset that matches the Pydantic model.
-    validation = (
-        gdf[list(validation_columns)].copy()
-        if validation_columns
-        else gdf.iloc[:, 0:0].copy()
+    columns, values = _gather_columns(gdf, include_columns, optional_columns)
+    values["geometry"] = _to_geojson_polygon_models(
+        _geometry_to_wgs84(gdf.geometry.to_numpy(), gdf.crs)
+    )
+    return _models_from_columns(
+        PolygonDatum, values, [*columns, "geometry"], "polygons_from_gdf"
     )
-    validation["geometry"] = [_to_geojson_polygon_model(geom) for geom in gdf.geometry]
-    _validate_rows_with_pydantic(validation, PolygonDatum, "polygons_from_gdf")
 
-    data = gdf[columns].copy() if columns else gdf.iloc[:, 0:0].copy()
-    data["geometry"] = [_to_geojson_polygon_model(geom) for geom in gdf.geometry]
-    return [PolygonDatum.model_validate(record) for record in data.to_dict("records")]
 
+def _require_point_geometries(geometry: np.ndarray) -> None:
+    import shapely
 
-def _handle_schema_error(exc: Exception, message: str) -> None:
-    details = str(exc)
-    if "Error while coercing" in details and "float" in details:
-        details = f"column must be numeric. {details}"
-    if "expected series" in details and "type str" in details:
-        details = f"column must be strings. {details}"
-    raise ValueError(f"{message} ({details})") from exc
+    type_ids = shapely.get_type_id(geometry)
+    if not (type_ids == shapely.GeometryType.POINT).all():
+        raise ValueError("Geometry column must contain Point geometries.")
+    if shapely.is_empty(geometry).any():
+        raise ValueError("Geometry column must contain non-empty Point geometries.")
 
 
-def _validate_schema(
-    schema: Any, gdf: gpd.GeoDataFrame, context: str
-) -> gpd.GeoDataFrame:
-    try:
-        validated = schema.validate(gdf)
-    except Exception as exc:
-        _handle_schema_error(exc, context)
-    return validated
+def _point_coordinates(geometry: np.ndarray) -> np.ndarray:
+    import numpy as np
+    import shapely
+
+    # One (N, 2) array of x/y in row order; callers have already rejected
+    # empty and non-point geometries, so rows and coordinates stay aligned.
+    return np.column_stack([shapely.get_x(geometry), shapely.get_y(geometry)])
 
 
-def _validate_rows_with_pydantic(
-    data: pd.DataFrame, model: type[BaseModel], context: str
-) -> None:
-    from pandera.engines.pandas_engine import PydanticModel
-    import pandera.pandas as pa
-    from pydantic import ValidationError
+def _point_lat_lng(geometry: np.ndarray, crs: CRS) -> tuple[list[float], list[float]]:
+    coords = _coordinates_to_wgs84(_point_coordinates(geometry), crs)
+    return coords[:, 1].tolist(), coords[:, 0].tolist()
 
-    schema = pa.DataFrameSchema(dtype=PydanticModel(model), coerce=False)
+
+@lru_cache(maxsize=16)
+def _transformer(source: str, target: str) -> Transformer:
+    from pyproj import Transformer
+
+    return Transformer.from_crs(source, target, always_xy=True)
+
+
+def _web_mercator_to_wgs84(
+    x: np.ndarray, y: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    import numpy as np
+
+    # Closed-form spherical inverse Mercator, matching PROJ's EPSG:3857 inverse
+    # including the longitude wrap for x beyond the projected extent.
+    lng = np.degrees(x / _WEB_MERCATOR_RADIUS)
+    lng = np.where(np.abs(lng) > 180.0, (lng + 180.0) % 360.0 - 180.0, lng)
+    lat = np.degrees(np.arctan(np.sinh(y / _WEB_MERCATOR_RADIUS)))
+    return lng, lat
+
+
+def _coordinates_to_wgs84(coords: np.ndarray, crs: CRS) -> np.ndarray:
+    if crs.equals("EPSG:4326"):
+        return coords
+    transformed = coords.copy()
+    if crs.equals("EPSG:3857"):
+        transformed[:, 0], transformed[:, 1] = _web_mercator_to_wgs84(
+            coords[:, 0], coords[:, 1]
+        )
+        return transformed
+    transformer = _transformer(crs.to_wkt(), "EPSG:4326")
+    transformed[:, 0], transformed[:, 1] = transformer.transform(
+        coords[:, 0], coords[:, 1]
+    )
+    return transformed
+
+
+def _geometry_to_wgs84(geometry: np.ndarray, crs: CRS) -> np.ndarray:
+    import shapely
+
+    if crs.equals("EPSG:4326"):
+        return geometry
+    # shapely.transform hands every vertex to PROJ in one call and rebuilds the
+    # geometries from the transformed coordinate array.
+    return shapely.transform(
+        geometry,
+        lambda coords: _coordinates_to_wgs84(coords, crs),
+        include_z=bool(shapely.has_z(geometry).any()),
+    )
+
+
+@cache
+def _field_list_adapter(model: type[BaseModel], field_name: str) -> TypeAdapter[Any]:
+    field = model.model_fields[field_name]
+    column_type: Any = GenericAlias(list, (field.rebuild_annotation(),))
+    return TypeAdapter(column_type)
+
+
+# Numeric constraints that can be checked as one numpy comparison per column.
+_FLOAT_BOUNDS = ("ge", "gt", "le", "lt")
+
+
+@cache
+def _float_constraints(
+    model: type[BaseModel], field_name: str
+) -> tuple[dict[str, float], bool] | None:
+    field = model.model_fields[field_name]
+    if field.annotation is not float:
+        return None
+    bounds: dict[str, float] = {}
+    allow_inf_nan = True
+    for item in field.metadata:
+        if isinstance(item, AllowInfNan):
+            allow_inf_nan = item.allow_inf_nan
+        elif (name := type(item).__name__.lower()) in _FLOAT_BOUNDS:
+            bounds[name] = float(getattr(item, name))
+        else:
+            # Anything else (multiple_of, custom validators) stays with pydantic.
+            return None
+    return bounds, allow_inf_nan
+
+
+def _fast_float_column(
+    column: list[Any], constraints: tuple[dict[str, float], bool]
+) -> list[float] | None:
+    import numpy as np
+
+    bounds, allow_inf_nan = constraints
+    array = np.asarray(column)
+    if array.dtype.kind not in "fiu":
+        return None
+    array = array.astype(np.float64)
+    valid = np.ones(len(array), dtype=bool) if allow_inf_nan else np.isfinite(array)
+    compare = {
+        "ge": np.greater_equal,
+        "gt": np.greater,
+        "le": np.less_equal,
+        "lt": np.less,
+    }
+    for name, bound in bounds.items():
+        valid &= compare[name](array, bound)
+    # A failing column goes back through pydantic for its error message.
+    return array.tolist() if valid.all() else None
+
+
+def _validate_column(
+    model: type[BaseModel], field_name: str, column: list[Any], context: str
+) -> list[Any]:
+    # Plain numeric columns are checked with one numpy mask per constraint.
+    constraints = _float_constraints(model, field_name)
+    if constraints is not None:
+        checked = _fast_float_column(column, constraints)
+        if checked is not None:
+            return checked
+    adapter = _field_list_adapter(model, field_name)
+    # Repeated strings (colors, labels) are validated once and mapped back.
+    unique = (
+        list(dict.fromkeys(column))
+        if all(isinstance(value, str) for value in column)
+        else column
+    )
     try:
-        schema.validate(data)
-    except Exception as exc:
-        records = data.to_dict("records")
-        for record in records:
-            try:
-                model.model_validate(record)
-            except ValidationError as val_exc:  # noqa: PERF203 - clarity over micro-optimization
-                error = val_exc.errors()[0]
-                location = ".".join(str(item) for item in error.get("loc", []))
-                message = error.get("msg", "Invalid value.")
-                detail = f"{location}: {message}" if location else message
-                raise ValueError(
-                    f"{context} schema validation failed. ({detail})"
-                ) from val_exc
-        raise ValueError(f"{context} schema validation failed.") from exc
-
-
-def _to_geojson_polygon_model(geom: BaseGeometry):
-    from geojson_pydantic import MultiPolygon, Polygon
+        validated = adapter.validate_python(unique)
+    except ValidationError as exc:
+        message = exc.errors()[0].get("msg", "Invalid value.")
+        raise ValueError(
+            f"{context} schema validation failed. ({field_name}: {message})"
+        ) from exc
+    if unique is column:
+        return validated
+    parsed = dict(zip(unique, validated, strict=True))
+    return [parsed[value] for value in column]
+
+
+def _validate_columns(
+    model: type[BaseModel], values: dict[str, list[Any]], context: str
+) -> dict[str, list[Any]]:
+    # Columns that are not model fields pass through, as extra="allow" keeps them.
+    return {
+        name: _validate_column(model, name, column, context)
+        if name in model.model_fields
+        else column
+        for name, column in values.items()
+    }
+
+
+def _construct_models(
+    model: type[ModelT], values: dict[str, list[Any]]
+) -> list[ModelT]:
+    # Columns are already validated, so skip the per-row validators.
+    keys = list(values)
+    return [
+        model.model_construct(**dict(zip(keys, row, strict=True)))
+        for row in zip(*values.values(), strict=True)
+    ]
+
+
+def _models_from_columns(
+    model: type[ModelT], values: dict[str, list[Any]], keep: Iterable[str], context: str
+) -> list[ModelT]:
+    # Optional columns present in the frame are validated but only the requested
+    # ones end up on the models.
+    values = _validate_columns(model, values, context)
+    return _construct_models(model, {col: values[col] for col in keep})
+
+
+def _orient_polygon(geom: BaseGeometry) -> BaseGeometry:
     from shapely.geometry import MultiPolygon as ShapelyMultiPolygon
     from shapely.ops import orient
 
     if geom.geom_type == "Polygon":
-        geom = orient(geom, sign=1.0)
-    elif geom.geom_type == "MultiPolygon":
-        geom = ShapelyMultiPolygon([orient(part, sign=1.0) for part in geom.geoms])
-    mapping = geom.__geo_interface__
-    if mapping.get("type") == "Polygon":
-        return Polygon.model_validate(mapping)
-    if mapping.get("type") == "MultiPolygon":
-        return MultiPolygon.model_validate(mapping)
-    raise ValueError("Geometry column must contain Polygon or MultiPolygon.")
+        return orient(geom, sign=1.0)
+    if geom.geom_type == "MultiPolygon":
+        return ShapelyMultiPolygon([orient(part, sign=1.0) for part in geom.geoms])
+    return geom
+
+
+def _orient_polygons(geometry: np.ndarray) -> np.ndarray:
+    import numpy as np
+    import shapely
+
+    # Exterior rings counter-clockwise, holes clockwise, as GeoJSON expects.
+    if hasattr(shapely, "orient_polygons"):
+        return shapely.orient_polygons(geometry)
+    # shapely < 2.1
+    return np.array([_orient_polygon(geom) for geom in geometry])
+
+
+def _to_geojson_polygon_models(geometry: np.ndarray) -> list[Polygon | MultiPolygon]:
+    from geojson_pydantic import MultiPolygon, Polygon
+    from geojson_pydantic.types import Position2D, Position3D
+    import shapely
+
+    geometry = _orient_polygons(geometry)
+    if len(geometry) == 0:
+        return []
+    has_z = shapely.has_z(geometry)
+    is_multi = shapely.get_type_id(geometry) == shapely.GeometryType.MULTIPOLYGON
+    # One GEOS call yields every vertex plus the ring/polygon/geometry offsets.
+    geom_type, coords, offsets = shapely.to_ragged_array(
+        geometry, include_z=bool(has_z.any())
+    )
+    ring_offsets = offsets[0].tolist()
+    polygon_offsets = offsets[1].tolist()
+    # A Polygon-only array has no geometry level: each row is a single polygon.
+    geom_offsets = (
+        list(range(len(geometry) + 1))
+        if geom_type == shapely.GeometryType.POLYGON
+        else offsets[2].tolist()
+    )
+
+    # Coordinates come straight from GEOS, so build the GeoJSON models without
+    # re-validating every position.
+    sources = {False: (Position2D, coords[:, :2].tolist())}
+    if coords.shape[1] == 3:
+        sources[True] = (Position3D, coords.tolist())
+    models: list[Polygon | MultiPolygon] = []
+    for row, (multi, z) in enumerate(
+        zip(is_multi.tolist(), has_z.tolist(), strict=True)
+    ):
+        position, source = sources[z]
+        polygons = [
+            [
+                list(map(position._make, source[ring_offsets[r] : ring_offsets[r + 1]]))
+                for r in range(polygon_offsets[p], polygon_offsets[p + 1])
+            ]
+            for p in range(geom_offsets[row], geom_offsets[row + 1])
+        ]
+        if multi:
+            models.append(
+                MultiPolygon.model_construct(type="MultiPolygon", coordinates=polygons)
+            )
+        else:
+            models.append(
+                Polygon.model_construct(
+                    type="Polygon", coordinates=polygons[0] if polygons else []
+                )
+            )
+    return models
+
+
+def _prepare_points(
+    gdf: gpd.GeoDataFrame, point_geometry: str | None
+) -> gpd.GeoDataFrame:
+    if point_geometry is None and "point" in gdf.columns:
+        resolved_geometry = "point"
+    else:
+        resolved_geometry = point_geometry or gdf.geometry.name
+    geometry_name = str(resolved_geometry)
+    gdf = gdf.set_geometry(geometry_name, inplace=False)
+    if geometry_name != "geometry":
+        gdf = gdf.rename(columns={geometry_name: "geometry"}).set_geometry(
+            "geometry", inplace=False
+        )
+    _require_point_geometries(gdf.geometry.to_numpy())
+    return gdf
 
 
 def points_from_gdf(
@@ -330,51 +442,96 @@ def points_from_gdf(
     """
     _require_geopandas()
     _require_pandas()
-    _require_pandera()
 
     if gdf.crs is None:
         raise ValueError("GeoDataFrame must have a CRS to convert to EPSG:4326.")
 
-    if point_geometry is None and "point" in gdf.columns:
-        resolved_geometry = "point"
-    else:
-        resolved_geometry = point_geometry or gdf.geometry.name
-    geometry_name = str(resolved_geometry)
-    gdf = gdf.set_geometry(geometry_name, inplace=False)
-    if geometry_name != "geometry":
-        gdf = gdf.rename(columns={geometry_name: "geometry"}).set_geometry(
-            "geometry", inplace=False
-        )
-    if not gdf.geometry.geom_type.eq("Point").all():
-        raise ValueError("Geometry column must contain Point geometries.")
-    gdf = gdf.to_crs(4326)
-    gdf = _validate_schema(
-        _build_points_schema(), gdf, "GeoDataFrame failed point schema validation."
+    gdf = _prepare_points(gdf, point_geometry)
+    optional_columns = {"altitude", "radius", "color", "label"}
+    columns, values = _gather_columns(gdf, include_columns, optional_columns)
+    values["lat"], values["lng"] = _point_lat_lng(gdf.geometry.to_numpy(), gdf.crs)
+    return _models_from_columns(
+        PointDatum, values, [*columns, "lat", "lng"], "points_from_gdf"
     )
 
-    columns = list(include_columns) if include_columns is not None else []
-    missing = [col for col in columns if col not in gdf.columns]
-    if missing:
-        raise ValueError(f"GeoDataFrame missing columns: {missing}")
 
-    optional_columns = {"altitude", "radius", "color", "label"}
-    validation_columns = set(columns)
-    validation_columns.update(col for col in optional_columns if col in gdf.columns)
-    # Pandera's PydanticModel schema must only contain model fields, so validate a
-    # subset that matches the Pydantic model.
-    validation = (
-        gdf[list(validation_columns)].copy()
-        if validation_columns
-        else gdf.iloc[:, 0:0].copy()
-    )
-    validation["lat"] = gdf.geometry.y
-    validation["lng"] = gdf.geometry.x
-    _validate_rows_with_pydantic(validation, PointDatum, "points_from_gdf")
+def _pack_color(color: Color) -> int:
+    red, green, blue, *alpha = color.as_rgb_tuple(alpha=True)
+    opacity = alpha[0] if alpha else 1.0
+    return (red << 24) | (green << 16) | (blue << 8) | round(opacity * 255)
+
+
+def _packed_colors(
+    gdf: gpd.GeoDataFrame, model: type[BaseModel], field_name: str, context: str
+) -> np.ndarray:
+    import numpy as np
+    import pandas as pd
 
-    data = gdf[columns].copy() if columns else gdf.iloc[:, 0:0].copy()
-    data["lat"] = gdf.geometry.y
-    data["lng"] = gdf.geometry.x
-    return [PointDatum.model_validate(record) for record in data.to_dict("records")]
+    if field_name not in gdf.columns:
+        default = _pack_color(model.model_fields[field_name].default)
+        return np.full(len(gdf), default, dtype=np.uint32)
+    # Only the distinct colors are parsed and packed; rows then pick theirs up
+    # with a single take on the factorized codes.
+    codes, uniques = pd.factorize(gdf[field_name].to_numpy(), use_na_sentinel=False)
+    colors = _validate_column(model, field_name, uniques.tolist(), context)
+    table = np.fromiter(map(_pack_color, colors), dtype=np.uint32, count=len(colors))
+    return table.take(codes)
+
+
+def points_arrays_from_gdf(
+    gdf: gpd.GeoDataFrame,
+    *,
+    include_columns: Iterable[str] | None = None,
+    point_geometry: str | None = None,
+) -> dict[str, np.ndarray]:
+    """Convert a GeoDataFrame of point geometries into per-attribute arrays.
+
+    Accepts the same input as ``points_from_gdf`` and applies the same
+    validation, but returns one NumPy array per attribute instead of a
+    ``PointDatum`` per row.
+
+    Args:
+        gdf: GeoDataFrame containing point geometries.
+        include_columns: Optional iterable of column names to add to the result.
+        point_geometry: Optional name of the point geometry column to use.
+
+    Returns:
+        A dict with float32 ``lat``, ``lng``, ``altitude`` and ``radius`` arrays,
+        a uint32 ``color`` array packed as ``0xRRGGBBAA``, a ``label`` array when
+        the GeoDataFrame has a ``label`` column, plus any requested columns.
+
+    Raises:
+        ValueError: If the GeoDataFrame has no CRS or contains no point geometries.
+    """
+    _require_geopandas()
+    _require_pandas()
+    import numpy as np
+
+    if gdf.crs is None:
+        raise ValueError("GeoDataFrame must have a CRS to convert to EPSG:4326.")
+
+    context = "points_arrays_from_gdf"
+    gdf = _prepare_points(gdf, point_geometry)
+    columns, values = _gather_columns(
+        gdf, include_columns, ["altitude", "radius", "label"]
+    )
+    coords = _coordinates_to_wgs84(_point_coordinates(gdf.geometry.to_numpy()), gdf.crs)
+    values["lat"] = coords[:, 1].tolist()
+    values["lng"] = coords[:, 0].tolist()
+    values = _validate_columns(PointDatum, values, context)
+
+    fields = PointDatum.model_fields
+    arrays = {col: gdf[col].to_numpy() for col in columns}
+    for name in ("lat", "lng", "altitude", "radius"):
+        arrays[name] = (
+            np.asarray(values[name], dtype=np.float32)
+            if name in values
+            else np.full(len(gdf), fields[name].default, dtype=np.float32)
+        )
+    arrays["color"] = _packed_colors(gdf, PointDatum, "color", context)
+    if "label" in values:
+        arrays["label"] = np.asarray(values["label"], dtype=object)
+    return arrays
 
 
 def arcs_from_gdf(
@@ -403,7 +560,6 @@ def arcs_from_gdf(
     """
     _require_geopandas()
     _require_pandas()
-    _require_pandera()
     import geopandas as gpd
 
     if gdf.crs is None:
@@ -421,20 +577,6 @@ def arcs_from_gdf(
     if not end_series.geom_type.eq("Point").all():
         raise ValueError("end_geometry column must contain Point geometries.")
 
-    start_series = start_series.to_crs(4326)
-    end_series = end_series.to_crs(4326)
-
-    renamed = gdf.copy()
-    renamed["start_lat"] = start_series.y
-    renamed["start_lng"] = start_series.x
-    renamed["end_lat"] = end_series.y
-    renamed["end_lng"] = end_series.x
-
-    columns = list(include_columns) if include_columns is not None else []
-    missing_extra = [col for col in columns if col not in renamed.columns]
-    if missing_extra:
-        raise ValueError(f"GeoDataFrame missing columns: {missing_extra}")
-
     optional_columns = {
         "start_altitude",
         "end_altitude",
@@ -448,27 +590,19 @@ def arcs_from_gdf(
         "color",
         "label",
     }
-    validation_columns = set(columns)
-    validation_columns.update(col for col in optional_columns if col in renamed.columns)
-    # Pandera's PydanticModel schema must only contain model fields, so validate a
-    # subset that matches the Pydantic model.
-    validation = (
-        renamed[list(validation_columns)].copy()
-        if validation_columns
-        else renamed.iloc[:, 0:0].copy()
+    columns, values = _gather_columns(gdf, include_columns, optional_columns)
+    values["start_lat"], values["start_lng"] = _point_lat_lng(
+        start_series.to_numpy(), gdf.crs
+    )
+    values["end_lat"], values["end_lng"] = _point_lat_lng(
+        end_series.to_numpy(), gdf.crs
+    )
+    return _models_from_columns(
+        ArcDatum,
+        values,
+        [*columns, "start_lat", "start_lng", "end_lat", "end_lng"],
+        "arcs_from_gdf",
     )
-    validation["start_lat"] = renamed["start_lat"]
-    validation["start_lng"] = renamed["start_lng"]
-    validation["end_lat"] = renamed["end_lat"]
-    validation["end_lng"] = renamed["end_lng"]
-    _validate_rows_with_pydantic(validation, ArcDatum, "arcs_from_gdf")
-
-    data = renamed[columns].copy() if columns else renamed.iloc[:, 0:0].copy()
-    data["start_lat"] = renamed["start_lat"]
-    data["start_lng"] = renamed["start_lng"]
-    data["end_lat"] = renamed["end_lat"]
-    data["end_lng"] = renamed["end_lng"]
-    return [ArcDatum.model_validate(record) for record in data.to_dict("records")]
 
 
 def paths_from_gdf(
@@ -493,8 +627,6 @@ def paths_from_gdf(
     """
     _require_geopandas()
     _require_pandas()
-    _require_pandera()
-    import pandas as pd
 
     if gdf.crs is None:
         raise ValueError("GeoDataFrame must have a CRS to convert to EPSG:4326.")
@@ -511,16 +643,6 @@ def paths_from_gdf(
     if not gdf.geometry.geom_type.isin(["LineString", "MultiLineString"]).all():
         raise ValueError("Geometry column must contain LineString or MultiLineString.")
 
-    gdf = gdf.to_crs(4326)
-    gdf = _validate_schema(
-        _build_paths_schema(), gdf, "GeoDataFrame failed path schema validation."
-    )
-
-    columns = list(include_columns) if include_columns is not None else []
-    missing = [col for col in columns if col not in gdf.columns]
-    if missing:
-        raise ValueError(f"GeoDataFrame missing columns: {missing}")
-
     optional_columns = {
         "color",
         "dash_length",
@@ -530,20 +652,13 @@ def paths_from_gdf(
         "label",
         "name",
     }
-    validation_columns = set(columns)
-    validation_columns.update(col for col in optional_columns if col in gdf.columns)
-    # Pandera's PydanticModel schema must only contain model fields, so validate a
-    # subset that matches the Pydantic model.
-    validation_records = _expand_path_records(gdf, list(validation_columns))
-    data_records = _expand_path_records(gdf, columns)
-
-    if validation_records:
-        validation_df = pd.DataFrame(validation_records)
-    else:
-        validation_df = pd.DataFrame(columns=[*validation_columns, "path"])
-    _validate_rows_with_pydantic(validation_df, PathDatum, "paths_from_gdf")
-
-    return [PathDatum.model_validate(record) for record in data_records]
+    columns, values = _gather_columns(gdf, include_columns, optional_columns)
+    paths, index = _path_parts(_geometry_to_wgs84(gdf.geometry.to_numpy(), gdf.crs))
+    # MultiLineString parts repeat their source row's attributes.
+    rows = index.tolist()
+    values = {col: [column[row] for row in rows] for col, column in values.items()}
+    values["path"] = paths
+    return _models_from_columns(PathDatum, values, [*columns, "path"], "paths_from_gdf")
 
 
 def heatmaps_from_gdf(
@@ -570,28 +685,27 @@ def heatmaps_from_gdf(
     Returns:
         A list containing a single HeatmapDatum with a list of points.
 
+    Raises:
+        ValueError: If the GeoDataFrame is missing CRS or point geometry.
     """
     _require_geopandas()
     _require_pandas()
-    _require_pandera()
 
-    gdf = _prepare_point_gdf(
-        gdf, geometry_column=geometry_column, default_column="point", context="heatmap"
-    )
+    if gdf.crs is None:
+        raise ValueError("GeoDataFrame must have a CRS to convert to EPSG:4326.")
+
+    gdf = _prepare_points(gdf, geometry_column)
 
-    weight_series = None
+    lat, lng = _point_lat_lng(gdf.geometry.to_numpy(), gdf.crs)
+    values = {"lat": lat, "lng": lng}
     if weight_column is not None:
         _require_columns(gdf, [weight_column])
-        weight_series = gdf[weight_column]
-
-    validation = gdf.iloc[:, 0:0].copy()
-    validation["lat"] = gdf.geometry.y
-    validation["lng"] = gdf.geometry.x
-    validation["weight"] = weight_series if weight_series is not None else 1.0
-    _validate_rows_with_pydantic(validation, HeatmapPointDatum, "heatmaps_from_gdf")
-
-    point_records = validation[["lat", "lng", "weight"]].to_dict("records")
-    points = [HeatmapPointDatum.model_validate(record) for record in point_records]
+        values["weight"] = gdf[weight_column].tolist()
+    else:
+        values["weight"] = [1.0] * len(gdf)
+    points = _models_from_columns(
+        HeatmapPointDatum, values, ["lat", "lng", "weight"], "heatmaps_from_gdf"
+    )
 
     heatmap_payload: dict[str, object] = {"points": points}
     if bandwidth is not None:
@@ -624,41 +738,30 @@ def hexbin_points_from_gdf(
     Returns:
         A list of HexBinPointDatum models.
 
+    Raises:
+        ValueError: If the GeoDataFrame is missing CRS or point geometry.
     """
     _require_geopandas()
     _require_pandas()
-    _require_pandera()
 
-    gdf = _prepare_point_gdf(
-        gdf, geometry_column=geometry_column, default_column="point", context="hexbin"
-    )
+    if gdf.crs is None:
+        raise ValueError("GeoDataFrame must have a CRS to convert to EPSG:4326.")
 
-    columns = list(include_columns) if include_columns is not None else []
-    _require_columns(gdf, columns)
+    gdf = _prepare_points(gdf, geometry_column)
 
-    weight_series = None
+    columns, values = _gather_columns(gdf, include_columns)
+    values["lat"], values["lng"] = _point_lat_lng(gdf.geometry.to_numpy(), gdf.crs)
     if weight_column is not None:
         _require_columns(gdf, [weight_column])
-        weight_series = gdf[weight_column]
-
-    validation_columns = set(columns)
-    validation = (
-        gdf[list(validation_columns)].copy()
-        if validation_columns
-        else gdf.iloc[:, 0:0].copy()
+        values["weight"] = gdf[weight_column].tolist()
+    else:
+        values["weight"] = [1.0] * len(gdf)
+    return _models_from_columns(
+        HexBinPointDatum,
+        values,
+        [*columns, "lat", "lng", "weight"],
+        "hexbin_points_from_gdf",
     )
-    validation["lat"] = gdf.geometry.y
-    validation["lng"] = gdf.geometry.x
-    validation["weight"] = weight_series if weight_series is not None else 1.0
-    _validate_rows_with_pydantic(validation, HexBinPointDatum, "hexbin_points_from_gdf")
-
-    data = gdf[columns].copy() if columns else gdf.iloc[:, 0:0].copy()
-    data["lat"] = gdf.geometry.y
-    data["lng"] = gdf.geometry.x
-    data["weight"] = weight_series if weight_series is not None else 1.0
-    return [
-        HexBinPointDatum.model_validate(record) for record in data.to_dict("records")
-    ]
 
 
 def hexed_polygons_from_gdf(
@@ -682,7 +785,6 @@ def hexed_polygons_from_gdf(
     """
     _require_geopandas()
     _require_pandas()
-    _require_pandera()
 
     if gdf.crs is None:
         raise ValueError("GeoDataFrame must have a CRS to convert to EPSG:4326.")
@@ -699,18 +801,6 @@ def hexed_polygons_from_gdf(
     if not gdf.geometry.geom_type.isin(["Polygon", "MultiPolygon"]).all():
         raise ValueError("Geometry column must contain Polygon or MultiPolygon.")
 
-    gdf = gdf.to_crs(4326)
-    gdf = _validate_schema(
-        _build_polygons_schema(),
-        gdf,
-        "hexed_polygons_from_gdf schema validation failed.",
-    )
-
-    columns = list(include_columns) if include_columns is not None else []
-    missing = [col for col in columns if col not in gdf.columns]
-    if missing:
-        raise ValueError(f"GeoDataFrame missing columns: {missing}")
-
     optional_columns = {
         "label",
         "color",
@@ -721,21 +811,13 @@ def hexed_polygons_from_gdf(
         "curvature_resolution",
         "dot_resolution",
     }
-    validation_columns = set(columns)
-    validation_columns.update(col for col in optional_columns if col in gdf.columns)
-    validation = (
-        gdf[list(validation_columns)].copy()
-        if validation_columns
-        else gdf.iloc[:, 0:0].copy()
+    columns, values = _gather_columns(gdf, include_columns, optional_columns)
+    values["geometry"] = _to_geojson_polygon_models(
+        _geometry_to_wgs84(gdf.geometry.to_numpy(), gdf.crs)
+    )
+    return _models_from_columns(
+        HexPolygonDatum, values, [*columns, "geometry"], "hexed_polygons_from_gdf"
     )
-    validation["geometry"] = [_to_geojson_polygon_model(geom) for geom in gdf.geometry]
-    _validate_rows_with_pydantic(validation, HexPolygonDatum, "hexed_polygons_from_gdf")
-
-    data = gdf[columns].copy() if columns else gdf.iloc[:, 0:0].copy()
-    data["geometry"] = [_to_geojson_polygon_model(geom) for geom in gdf.geometry]
-    return [
-        HexPolygonDatum.model_validate(record) for record in data.to_dict("records")
-    ]
 
 
 def tiles_from_gdf(
@@ -759,32 +841,11 @@ def tiles_from_gdf(
     """
     _require_geopandas()
     _require_pandas()
-    _require_pandera()
 
     if gdf.crs is None:
         raise ValueError("GeoDataFrame must have a CRS to convert to EPSG:4326.")
 
-    if geometry_column is None and "point" in gdf.columns:
-        resolved_geometry = "point"
-    else:
-        resolved_geometry = geometry_column or gdf.geometry.name
-    geometry_name = str(resolved_geometry)
-    gdf = gdf.set_geometry(geometry_name, inplace=False)
-    if geometry_name != "geometry":
-        gdf = gdf.rename(columns={geometry_name: "geometry"}).set_geometry(
-            "geometry", inplace=False
-        )
-    if not gdf.geometry.geom_type.eq("Point").all():
-        raise ValueError("Geometry column must contain Point geometries.")
-    gdf = gdf.to_crs(4326)
-    gdf = _validate_schema(
-        _build_points_schema(), gdf, "GeoDataFrame failed tiles schema validation."
-    )
-
-    columns = list(include_columns) if include_columns is not None else []
-    missing = [col for col in columns if col not in gdf.columns]
-    if missing:
-        raise ValueError(f"GeoDataFrame missing columns: {missing}")
+    gdf = _prepare_points(gdf, geometry_column)
 
     optional_columns = {
         "altitude",
@@ -794,21 +855,11 @@ def tiles_from_gdf(
         "curvature_resolution",
         "label",
     }
-    validation_columns = set(columns)
-    validation_columns.update(col for col in optional_columns if col in gdf.columns)
-    validation = (
-        gdf[list(validation_columns)].copy()
-        if validation_columns
-        else gdf.iloc[:, 0:0].copy()
+    columns, values = _gather_columns(gdf, include_columns, optional_columns)
+    values["lat"], values["lng"] = _point_lat_lng(gdf.geometry.to_numpy(), gdf.crs)
+    return _models_from_columns(
+        TileDatum, values, [*columns, "lat", "lng"], "tiles_from_gdf"
     )
-    validation["lat"] = gdf.geometry.y
-    validation["lng"] = gdf.geometry.x
-    _validate_rows_with_pydantic(validation, TileDatum, "tiles_from_gdf")
-
-    data = gdf[columns].copy() if columns else gdf.iloc[:, 0:0].copy()
-    data["lat"] = gdf.geometry.y
-    data["lng"] = gdf.geometry.x
-    return [TileDatum.model_validate(record) for record in data.to_dict("records")]
 
 
 def particles_from_gdf(
@@ -839,31 +890,27 @@ def particles_from_gdf(
     Returns:
         A list containing a single ParticleDatum with a list of points.
 
+    Raises:
+        ValueError: If the GeoDataFrame is missing CRS or point geometry.
     """
     _require_geopandas()
     _require_pandas()
-    _require_pandera()
 
-    gdf = _prepare_point_gdf(
-        gdf,
-        geometry_column=geometry_column,
-        default_column="point",
-        context="particles",
-    )
+    if gdf.crs is None:
+        raise ValueError("GeoDataFrame must have a CRS to convert to EPSG:4326.")
 
-    altitude_series = None
+    gdf = _prepare_points(gdf, geometry_column)
+
+    lat, lng = _point_lat_lng(gdf.geometry.to_numpy(), gdf.crs)
+    values = {"lat": lat, "lng": lng}
     if altitude_column is not None:
         _require_columns(gdf, [altitude_column])
-        altitude_series = gdf[altitude_column]
-
-    validation = gdf.iloc[:, 0:0].copy()
-    validation["lat"] = gdf.geometry.y
-    validation["lng"] = gdf.geometry.x
-    validation["altitude"] = altitude_series if altitude_series is not None else 0.01
-    _validate_rows_with_pydantic(validation, ParticlePointDatum, "particles_from_gdf")
-
-    point_records = validation[["lat", "lng", "altitude"]].to_dict("records")
-    points = [ParticlePointDatum.model_validate(record) for record in point_records]
+        values["altitude"] = gdf[altitude_column].tolist()
+    else:
+        values["altitude"] = [0.01] * len(gdf)
+    points = _models_from_columns(
+        ParticlePointDatum, values, ["lat", "lng", "altitude"], "particles_from_gdf"
+    )
 
     payload: dict[str, object] = {"particles": points}
     if size is not None:
@@ -901,32 +948,11 @@ def rings_from_gdf(
     """
     _require_geopandas()
     _require_pandas()
-    _require_pandera()
 
     if gdf.crs is None:
         raise ValueError("GeoDataFrame must have a CRS to convert to EPSG:4326.")
 
-    if geometry_column is None and "point" in gdf.columns:
-        resolved_geometry = "point"
-    else:
-        resolved_geometry = geometry_column or gdf.geometry.name
-    geometry_name = str(resolved_geometry)
-    gdf = gdf.set_geometry(geometry_name, inplace=False)
-    if geometry_name != "geometry":
-        gdf = gdf.rename(columns={geometry_name: "geometry"}).set_geometry(
-            "geometry", inplace=False
-        )
-    if not gdf.geometry.geom_type.eq("Point").all():
-        raise ValueError("Geometry column must contain Point geometries.")
-    gdf = gdf.to_crs(4326)
-    gdf = _validate_schema(
-        _build_points_schema(), gdf, "GeoDataFrame failed rings schema validation."
-    )
-
-    columns = list(include_columns) if include_columns is not None else []
-    missing = [col for col in columns if col not in gdf.columns]
-    if missing:
-        raise ValueError(f"GeoDataFrame missing columns: {missing}")
+    gdf = _prepare_points(gdf, geometry_column)
 
     optional_columns = {
         "altitude",
@@ -935,21 +961,11 @@ def rings_from_gdf(
         "propagation_speed",
         "repeat_period",
     }
-    validation_columns = set(columns)
-    validation_columns.update(col for col in optional_columns if col in gdf.columns)
-    validation = (
-        gdf[list(validation_columns)].copy()
-        if validation_columns
-        else gdf.iloc[:, 0:0].copy()
+    columns, values = _gather_columns(gdf, include_columns, optional_columns)
+    values["lat"], values["lng"] = _point_lat_lng(gdf.geometry.to_numpy(), gdf.crs)
+    return _models_from_columns(
+        RingDatum, values, [*columns, "lat", "lng"], "rings_from_gdf"
     )
-    validation["lat"] = gdf.geometry.y
-    validation["lng"] = gdf.geometry.x
-    _validate_rows_with_pydantic(validation, RingDatum, "rings_from_gdf")
-
-    data = gdf[columns].copy() if columns else gdf.iloc[:, 0:0].copy()
-    data["lat"] = gdf.geometry.y
-    data["lng"] = gdf.geometry.x
-    return [RingDatum.model_validate(record) for record in data.to_dict("records")]
 
 
 def labels_from_gdf(
@@ -975,7 +991,6 @@ def labels_from_gdf(
     """
     _require_geopandas()
     _require_pandas()
-    _require_pandera()
 
     if gdf.crs is None:
         raise ValueError("GeoDataFrame must have a CRS to convert to EPSG:4326.")
@@ -983,27 +998,7 @@ def labels_from_gdf(
     if text_column not in gdf.columns:
         raise ValueError(f"GeoDataFrame missing columns: {[text_column]}")
 
-    if geometry_column is None and "point" in gdf.columns:
-        resolved_geometry = "point"
-    else:
-        resolved_geometry = geometry_column or gdf.geometry.name
-    geometry_name = str(resolved_geometry)
-    gdf = gdf.set_geometry(geometry_name, inplace=False)
-    if geometry_name != "geometry":
-        gdf = gdf.rename(columns={geometry_name: "geometry"}).set_geometry(
-            "geometry", inplace=False
-        )
-    if not gdf.geometry.geom_type.eq("Point").all():
-        raise ValueError("Geometry column must contain Point geometries.")
-    gdf = gdf.to_crs(4326)
-    gdf = _validate_schema(
-        _build_points_schema(), gdf, "GeoDataFrame failed labels schema validation."
-    )
-
-    columns = list(include_columns) if include_columns is not None else []
-    missing = [col for col in columns if col not in gdf.columns]
-    if missing:
-        raise ValueError(f"GeoDataFrame missing columns: {missing}")
+    gdf = _prepare_points(gdf, geometry_column)
 
     optional_columns = {
         "altitude",
@@ -1015,56 +1010,32 @@ def labels_from_gdf(
         "dot_orientation",
         "label",
     }
-    validation_columns = set(columns)
-    validation_columns.add(text_column)
-    validation_columns.update(col for col in optional_columns if col in gdf.columns)
-    validation = (
-        gdf[list(validation_columns)].copy()
-        if validation_columns
-        else gdf.iloc[:, 0:0].copy()
+    columns, values = _gather_columns(gdf, include_columns, optional_columns)
+    values["text"] = gdf[text_column].tolist()
+    values["lat"], values["lng"] = _point_lat_lng(gdf.geometry.to_numpy(), gdf.crs)
+    return _models_from_columns(
+        LabelDatum, values, [*columns, "text", "lat", "lng"], "labels_from_gdf"
     )
-    validation = validation.rename(columns={text_column: "text"})
-    validation["lat"] = gdf.geometry.y
-    validation["lng"] = gdf.geometry.x
-    _validate_rows_with_pydantic(validation, LabelDatum, "labels_from_gdf")
-
-    data = gdf[columns].copy() if columns else gdf.iloc[:, 0:0].copy()
-    data["text"] = gdf[text_column]
-    data["lat"] = gdf.geometry.y
-    data["lng"] = gdf.geometry.x
-    return [LabelDatum.model_validate(record) for record in data.to_dict("records")]
-
-
-def _to_path_coordinate_groups(
-    geom: BaseGeometry,
-) -> list[list[tuple[float, float] | tuple[float, float, float]]]:
-    def _is_xyz(
-        coord: tuple[float, float] | tuple[float, float, float],
-    ) -> TypeGuard[tuple[float, float, float]]:
-        return len(coord) == 3
-
-    def _swap_xy(
-        coord: tuple[float, float] | tuple[float, float, float],
-    ) -> tuple[float, float] | tuple[float, float, float]:
-        if _is_xyz(coord):
-            return (coord[1], coord[0], coord[2])
-        return (coord[1], coord[0])
-
-    if geom.geom_type == "LineString":
-        return [[_swap_xy(coord) for coord in geom.coords]]
-    if geom.geom_type == "MultiLineString":
-        return [[_swap_xy(coord) for coord in part.coords] for part in geom.geoms]
-    raise ValueError("Geometry must be LineString or MultiLineString.")
-
-
-def _expand_path_records(
-    gdf: gpd.GeoDataFrame, columns: Sequence[str]
-) -> list[dict[str, object]]:
-    records: list[dict[str, object]] = []
-    for idx, geom in enumerate(gdf.geometry):
-        base = {col: gdf.iloc[idx][col] for col in columns} if columns else {}
-        for path in _to_path_coordinate_groups(geom):
-            record = dict(base)
-            record["path"] = path
-            records.append(record)
-    return records
+
+
+def _path_parts(geometry: np.ndarray) -> tuple[list[np.ndarray], np.ndarray]:
+    import shapely
+
+    # MultiLineStrings are exploded into LineStrings in one call; the index maps
+    # each part back to its source row.
+    parts, index = shapely.get_parts(geometry, return_index=True)
+    if len(parts) == 0:
+        return [], index
+    # The parts come back in the GeoArrow layout: one contiguous coordinate
+    # buffer plus offsets, so each path is a slice rather than a GEOS walk.
+    _, coords, (offsets,) = shapely.to_ragged_array(parts)
+    swapped = coords[:, [1, 0, *range(2, coords.shape[1])]]
+    # The buffer is 3D if any part has z; 2D parts keep only lat/lng so they are
+    # not padded with NaN altitudes.
+    has_z = shapely.has_z(parts).tolist()
+    return [
+        swapped[start:end] if part_has_z else swapped[start:end, :2]
+        for (start, end), part_has_z in zip(
+            pairwise(offsets.tolist()), has_z, strict=True
+        )
+    ], index
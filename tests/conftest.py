@@ -2,18 +2,24 @@ from __future__ import annotations
 
 import base64
 from collections.abc import Callable, Generator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 import contextlib
 from datetime import datetime, timezone
+from functools import lru_cache
+import hashlib
 import io
+import mimetypes
 import os
 import pathlib
 import shutil
 import socketserver
 import threading
 from typing import Any, Literal, TYPE_CHECKING
+from urllib.parse import urlsplit
 
 import numpy as np
-from PIL import Image, ImageChops
+from PIL import Image
+from playwright.sync_api import Error as PlaywrightError
 from pydantic import AnyUrl, TypeAdapter
 import pytest
 from skimage.metrics import structural_similarity
@@ -121,7 +127,10 @@ def _probe_webgl(browser: Any) -> tuple[bool, str | None, str | None]:
 
 
 if TYPE_CHECKING:
-    from playwright.sync_api import Page as PlaywrightPage
+    import geopandas as gpd
+    from playwright.sync_api import Page as PlaywrightPage, Route
+
+    from pyglobegl import GlobeConfig, GlobeLayerConfig
 
 
 def _ui_artifacts_dir() -> pathlib.Path:
@@ -164,19 +173,51 @@ def _clear_ui_artifacts_dir(request: pytest.FixtureRequest) -> None:
                 entry.unlink()
 
 
-def _capture_canvas_data_url(page: PlaywrightPage) -> bytes:
+def _capture_canvas_data_url(page: PlaywrightPage, max_attempts: int) -> bytes:
     page.wait_for_selector("canvas", timeout=20000)
+    # Poll for a settled frame inside the page so a capture is one round-trip.
+    # Frames are compared as raw pixels read through a 2D copy, and only the
+    # settled frame is encoded as a PNG.
     data_url = page.evaluate(
         """
-        () => {
+        async ({ maxAttempts, delayMs }) => {
           const container = document.querySelector(".scene-container");
           const canvas = container ? container.querySelector("canvas") : null;
           if (!canvas) {
             return null;
           }
+          const copy = document.createElement("canvas");
+          const ctx = copy.getContext("2d", { willReadFrequently: true });
+          const readPixels = () => {
+            copy.width = canvas.width;
+            copy.height = canvas.height;
+            ctx.drawImage(canvas, 0, 0);
+            return ctx.getImageData(0, 0, copy.width, copy.height).data;
+          };
+          const samePixels = (a, b) => {
+            if (a.length !== b.length) {
+              return false;
+            }
+            for (let i = 0; i < a.length; i += 1) {
+              if (a[i] !== b[i]) {
+                return false;
+              }
+            }
+            return true;
+          };
+          let current = readPixels();
+          for (let attempt = 1; attempt < maxAttempts; attempt += 1) {
+            await new Promise((resolve) => setTimeout(resolve, delayMs));
+            const next = readPixels();
+            if (samePixels(next, current)) {
+              break;
+            }
+            current = next;
+          }
           return canvas.toDataURL("image/png");
         }
-        """
+        """,
+        {"maxAttempts": max_attempts, "delayMs": 100},
     )
     if not data_url:
         raise RuntimeError("Canvas data URL not available.")
@@ -186,6 +227,85 @@ def _capture_canvas_data_url(page: PlaywrightPage) -> bytes:
     return base64.b64decode(encoded)
 
 
+def _is_remote_asset(url: str) -> bool:
+    parts = urlsplit(url)
+    return parts.scheme in {"http", "https"} and parts.hostname not in {
+        "localhost",
+        "127.0.0.1",
+    }
+
+
+def _serve_cached_asset(route: Route, cache_dir: pathlib.Path) -> None:
+    request = route.request
+    if request.method != "GET":
+        route.fallback()
+        return
+    url = request.url
+    suffix = pathlib.PurePosixPath(urlsplit(url).path).suffix
+    cached = cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()}{suffix}"
+    if not cached.exists():
+        try:
+            response = route.fetch()
+        except PlaywrightError:
+            # Offline or a flaky host: let the browser make the request itself.
+            route.fallback()
+            return
+        if not response.ok:
+            route.fulfill(response=response)
+            return
+        # Write then rename so parallel workers never read a partial file.
+        partial = cached.with_name(f"{cached.name}.{os.getpid()}.part")
+        partial.write_bytes(response.body())
+        partial.replace(cached)
+    content_type = mimetypes.guess_type(url)[0] or "application/octet-stream"
+    route.fulfill(
+        path=cached,
+        content_type=content_type,
+        headers={"access-control-allow-origin": "*"},
+    )
+
+
+@pytest.fixture(scope="session")
+def page_session(
+    page_session: PlaywrightPage, pytestconfig: pytest.Config
+) -> PlaywrightPage:
+    # One browser context and page serve the whole session (per xdist worker).
+    # Between tests solara_test reloads the page, which drops every
+    # window.__pyglobegl_* global, so tests must not rely on state from earlier
+    # tests and fixtures must not keep references to widgets or JS handles.
+    #
+    # Remote textures and scripts are fetched once into the pytest cache and
+    # served from disk to every later page load, across runs and xdist workers.
+    # Cached files never expire; run `pytest --cache-clear` to refetch them.
+    # Routing turns off the browser's HTTP cache for the whole page; the disk
+    # cache stands in for it on remote hosts, and local assets come from the
+    # in-process test servers, which are cheap to hit on every load.
+    cache_dir = (
+        pytestconfig.cache.mkdir("pyglobegl-assets")
+        if pytestconfig.cache is not None
+        else _ui_artifacts_dir() / "asset-cache"
+    )
+    cache_dir.mkdir(exist_ok=True)
+    page_session.route(
+        _is_remote_asset, lambda route: _serve_cached_asset(route, cache_dir)
+    )
+    return page_session
+
+
+@pytest.fixture(scope="session")
+def globe_capture_config() -> GlobeConfig:
+    from pyglobegl import GlobeConfig, GlobeInitConfig, GlobeLayoutConfig
+
+    # Configs are frozen, so canvas tests share this base and swap in their layers
+    # with model_copy(update=...) instead of re-validating it each time.
+    return GlobeConfig(
+        init=GlobeInitConfig(
+            renderer_config={"preserveDrawingBuffer": True}, animate_in=False
+        ),
+        layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
+    )
+
+
 @pytest.fixture(scope="session")
 def globe_earth_texture_url() -> AnyUrl:
     return TypeAdapter(AnyUrl).validate_python(
@@ -193,6 +313,18 @@ def globe_earth_texture_url() -> AnyUrl:
     )
 
 
+@pytest.fixture(scope="session")
+def globe_earth_layer(globe_earth_texture_url: AnyUrl) -> GlobeLayerConfig:
+    from pyglobegl import GlobeLayerConfig
+
+    # The plain textured globe most layer tests draw on, validated once per session.
+    return GlobeLayerConfig(
+        globe_image_url=globe_earth_texture_url,
+        show_atmosphere=False,
+        show_graticules=False,
+    )
+
+
 @pytest.fixture(scope="session")
 def globe_background_night_sky_data_url() -> str:
     image_path = pathlib.Path(__file__).parent / "assets" / "night-sky.png"
@@ -287,6 +419,207 @@ def globe_hoverer() -> Callable[[PlaywrightPage], None]:
     return _hover
 
 
+# Settle sleeps used while the shipped bundle predates the rendered-update
+# counter in frontend/src/index.ts; drop them once a rebuilt bundle ships it.
+_READY_SETTLE_MS = 250
+_UPDATE_SETTLE_MS = 200
+
+
+@lru_cache(maxsize=1)
+def _bundle_counts_rendered_updates() -> bool:
+    import pyglobegl
+
+    bundle = pathlib.Path(pyglobegl.__file__).with_name("_static") / "index.js"
+    return "__pyglobegl_rendered_updates" in bundle.read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def globe_wait_ready() -> Callable[..., None]:
+    def _wait(
+        page: PlaywrightPage, timeout: int = 20000, *, pov_altitude: float | None = None
+    ) -> None:
+        # One in-page promise checks, once per animation frame, for the ready
+        # flag, the initial config reaching a rendered frame and (optionally) the
+        # camera reaching the expected altitude, so the wait is one round-trip.
+        # Bundles without the rendered-update counter fall back to a short
+        # settle sleep after the ready flag instead.
+        page.evaluate(
+            """
+            ({ timeout, povAltitude, countsUpdates }) =>
+              new Promise((resolve, reject) => {
+                const timer = setTimeout(
+                  () => reject(new Error("Timed out waiting for globe ready.")),
+                  timeout,
+                );
+                const globeReady = () => window.__pyglobegl_globe_ready === true;
+                const configRendered = () =>
+                  !countsUpdates || (window.__pyglobegl_rendered_updates ?? 0) >= 1;
+                const povReady = () =>
+                  povAltitude === null ||
+                  (window.__pyglobegl_pov &&
+                    Math.abs(window.__pyglobegl_pov.altitude - povAltitude) < 0.001);
+                const check = () => {
+                  if (globeReady() && configRendered() && povReady()) {
+                    clearTimeout(timer);
+                    resolve(true);
+                    return;
+                  }
+                  requestAnimationFrame(check);
+                };
+                check();
+              })
+            """,
+            {
+                "timeout": timeout,
+                "povAltitude": pov_altitude,
+                "countsUpdates": _bundle_counts_rendered_updates(),
+            },
+        )
+        if not _bundle_counts_rendered_updates():
+            page.wait_for_timeout(_READY_SETTLE_MS)
+
+    return _wait
+
+
+@pytest.fixture
+def globe_render_update() -> Callable[..., None]:
+    def _render(
+        page: PlaywrightPage, update: Callable[[], None], *, updates: int = 1
+    ) -> None:
+        # The widget counts updates that have reached a rendered frame; wait for
+        # the counter to move past its value from before the update was sent by
+        # the number of setter calls the update makes. Bundles without the
+        # counter fall back to a fixed settle sleep.
+        if not _bundle_counts_rendered_updates():
+            update()
+            page.wait_for_timeout(_UPDATE_SETTLE_MS)
+            return
+        before = page.evaluate("window.__pyglobegl_rendered_updates ?? 0")
+        update()
+        page.wait_for_function(
+            "(target) => (window.__pyglobegl_rendered_updates ?? 0) >= target",
+            arg=before + updates,
+            timeout=5000,
+        )
+
+    return _render
+
+
+@pytest.fixture
+def canvas_wait_center_pixel() -> Callable[..., None]:
+    def _wait(
+        page: PlaywrightPage, color: str | None = None, timeout: int = 20000
+    ) -> None:
+        # Copy only the centre pixel of the WebGL canvas each frame rather than
+        # encoding the whole canvas as a PNG. Without a colour, any painted
+        # (non-black) pixel will do.
+        page.wait_for_function(
+            """
+            ({ targetColor }) => {
+              if (window.__pyglobegl_globe_ready !== true) {
+                return false;
+              }
+              const container = document.querySelector(".scene-container");
+              const canvas = container ? container.querySelector("canvas") : null;
+              if (!canvas || canvas.width === 0 || canvas.height === 0) {
+                return false;
+              }
+              const probe = document.createElement("canvas");
+              probe.width = 1;
+              probe.height = 1;
+              const ctx = probe.getContext("2d", { willReadFrequently: true });
+              if (!ctx) {
+                return false;
+              }
+              const midX = Math.floor(canvas.width / 2);
+              const midY = Math.floor(canvas.height / 2);
+              ctx.drawImage(canvas, midX, midY, 1, 1, 0, 0, 1, 1);
+              const data = ctx.getImageData(0, 0, 1, 1).data;
+              if (targetColor === null) {
+                return data[0] + data[1] + data[2] > 0;
+              }
+              const hex = (value) => value.toString(16).padStart(2, "0");
+              const pixel = `#${hex(data[0])}${hex(data[1])}${hex(data[2])}`;
+              return pixel === targetColor.toLowerCase();
+            }
+            """,
+            arg={"targetColor": color},
+            polling="raf",
+            timeout=timeout,
+        )
+
+    return _wait
+
+
+@pytest.fixture
+def canvas_wait_changed() -> Callable[[PlaywrightPage, Callable[[], None]], None]:
+    def _wait(page: PlaywrightPage, update: Callable[[], None]) -> None:
+        # For updates that finish asynchronously (texture loads, heatmap KDE), the
+        # rendered-update counter fires too early; wait for the pixels to change.
+        page.evaluate(
+            """
+            () => {
+              const canvas = document.querySelector(".scene-container canvas");
+              window.__pyglobegl_canvas_before = canvas ? canvas.toDataURL() : null;
+            }
+            """
+        )
+        update()
+        page.wait_for_function(
+            """
+            () => {
+              const canvas = document.querySelector(".scene-container canvas");
+              return (
+                canvas !== null &&
+                canvas.toDataURL() !== window.__pyglobegl_canvas_before
+              );
+            }
+            """,
+            polling=100,
+            timeout=20000,
+        )
+
+    return _wait
+
+
+@pytest.fixture
+def canvas_wait_settled() -> Callable[..., None]:
+    def _wait(page: PlaywrightPage, frames: int = 10, timeout: int = 20000) -> None:
+        # Transitions run for a fixed time after the update lands; rather than
+        # sleeping past them, wait until the canvas is unchanged for a run of
+        # consecutive animation frames.
+        page.evaluate(
+            """
+            ({ frames, timeout }) =>
+              new Promise((resolve, reject) => {
+                const timer = setTimeout(
+                  () => reject(new Error("Timed out waiting for canvas to settle.")),
+                  timeout,
+                );
+                let previous = null;
+                let unchanged = 0;
+                const check = () => {
+                  const canvas = document.querySelector(".scene-container canvas");
+                  const current = canvas ? canvas.toDataURL() : null;
+                  unchanged =
+                    current !== null && current === previous ? unchanged + 1 : 0;
+                  previous = current;
+                  if (unchanged >= frames) {
+                    clearTimeout(timer);
+                    resolve(true);
+                    return;
+                  }
+                  requestAnimationFrame(check);
+                };
+                check();
+              })
+            """,
+            {"frames": frames, "timeout": timeout},
+        )
+
+    return _wait
+
+
 def _make_bump_test_map(width: int = 360, height: int = 180) -> Image.Image:
     image = Image.new("L", (width, height))
     stripe_width = max(1, width // 12)
@@ -316,8 +649,34 @@ def globe_flat_texture_data_url() -> str:
     return image_to_data_url(image)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def globe_flat_layer(globe_flat_texture_data_url: str) -> GlobeLayerConfig:
+    from pydantic import AnyUrl, TypeAdapter
+
+    from pyglobegl import GlobeLayerConfig
+
+    # The flat texture data URL is long, so validate it once per session.
+    return GlobeLayerConfig(
+        globe_image_url=TypeAdapter(AnyUrl).validate_python(
+            globe_flat_texture_data_url
+        ),
+        show_atmosphere=False,
+        show_graticules=False,
+    )
+
+
+@pytest.fixture(scope="session")
+def point_gdf() -> gpd.GeoDataFrame:
+    import geopandas as gpd
+
+    return gpd.GeoDataFrame(
+        {"point": gpd.GeoSeries.from_xy([10], [5], crs="EPSG:4326")}, geometry="point"
+    )
+
+
+@pytest.fixture(scope="session")
 def globe_tile_server() -> Generator[tuple[str, Callable[[bytes], None]], None, None]:
+    # One server per session; tests set the tile bytes they expect before use.
     class TileData:
         def __init__(self) -> None:
             self._lock = threading.Lock()
@@ -404,26 +763,11 @@ def _timestamp_local() -> str:
     return _safe_name(datetime.now().astimezone().isoformat(timespec="seconds"))
 
 
-def _images_identical(first: Image.Image, second: Image.Image) -> bool:
-    if first.size != second.size:
-        return False
-    diff = ImageChops.difference(first, second)
-    return diff.getbbox() is None
-
-
 @pytest.fixture
 def canvas_capture() -> Callable[[PlaywrightPage, int], Image.Image]:
     def _capture(page: PlaywrightPage, max_attempts: int = 3) -> Image.Image:
-        png_bytes = _capture_canvas_data_url(page)
-        current = Image.open(io.BytesIO(png_bytes)).convert("RGBA")
-        for _ in range(max_attempts - 1):
-            page.wait_for_timeout(100)
-            next_bytes = _capture_canvas_data_url(page)
-            next_image = Image.open(io.BytesIO(next_bytes)).convert("RGBA")
-            if _images_identical(current, next_image):
-                return current
-            current = next_image
-        return current
+        png_bytes = _capture_canvas_data_url(page, max_attempts)
+        return Image.open(io.BytesIO(png_bytes)).convert("RGBA")
 
     return _capture
 
@@ -450,8 +794,13 @@ def canvas_reference_path() -> Callable[[str], pathlib.Path]:
 
 
 @pytest.fixture
-def canvas_save_capture() -> Callable[[Image.Image, str, bool], pathlib.Path]:
-    def _save(image: Image.Image, label: str, passed: bool) -> pathlib.Path:
+def canvas_save_capture() -> Callable[[Image.Image, str, bool], pathlib.Path | None]:
+    save_passing = _is_truthy_env(os.environ.get("PYGLOBEGL_SAVE_PASSING_CAPTURES"))
+
+    def _save(image: Image.Image, label: str, passed: bool) -> pathlib.Path | None:
+        # Only failures are needed for debugging; skip the PNG encode otherwise.
+        if passed and not save_passing:
+            return None
         status = "pass" if passed else "fail"
         filename = f"{_safe_name(label)}-{status}-{_timestamp_local()}.png"
         path = pathlib.Path("ui-artifacts") / filename
@@ -461,17 +810,38 @@ def canvas_save_capture() -> Callable[[Image.Image, str, bool], pathlib.Path]:
     return _save
 
 
+@lru_cache(maxsize=64)
+def _load_reference_array(reference_path: pathlib.Path) -> np.ndarray:
+    # References are read-only during a run, so decode each PNG once per worker.
+    with Image.open(reference_path) as reference:
+        array = np.asarray(reference.convert("RGBA"))
+    array.setflags(write=False)
+    return array
+
+
 @pytest.fixture
-def canvas_compare_images() -> Callable[[Image.Image, pathlib.Path], float]:
-    def _compare(captured: Image.Image, reference_path: pathlib.Path) -> float:
-        reference = Image.open(reference_path).convert("RGBA")
-        if captured.size != reference.size:
+def canvas_compare_images() -> Callable[
+    [Image.Image, pathlib.Path | Image.Image], float
+]:
+    def _compare(captured: Image.Image, reference: pathlib.Path | Image.Image) -> float:
+        # A reference may also be an earlier capture from the same test.
+        reference_array = (
+            np.asarray(reference.convert("RGBA"))
+            if isinstance(reference, Image.Image)
+            else _load_reference_array(reference)
+        )
+        reference_size = (reference_array.shape[1], reference_array.shape[0])
+        if captured.size != reference_size:
             raise AssertionError(
-                f"Reference size {reference.size} does not match capture size "
+                f"Reference size {reference_size} does not match capture size "
                 f"{captured.size}."
             )
-        captured_array = np.asarray(captured.convert("RGBA"))
-        reference_array = np.asarray(reference)
+        # canvas_capture already returns RGBA; convert() would copy it again.
+        rgba = captured if captured.mode == "RGBA" else captured.convert("RGBA")
+        captured_array = np.asarray(rgba)
+        # Deterministic renders often match their reference exactly; skip SSIM.
+        if np.array_equal(captured_array, reference_array):
+            return 1.0
         score = structural_similarity(
             captured_array, reference_array, channel_axis=2, data_range=255
         )
@@ -480,14 +850,66 @@ def canvas_compare_images() -> Callable[[Image.Image, pathlib.Path], float]:
     return _compare
 
 
+# Canvas comparisons submitted by the running test, resolved once its body ends.
+_PENDING_COMPARES = pytest.StashKey[list[Future[None]]]()
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item) -> Generator[None, None, None]:
+    try:
+        yield
+    finally:
+        # Let every comparison finish even when the test body raised, so each one
+        # still saves its capture artifact; the body's failure takes precedence.
+        pending = item.stash.get(_PENDING_COMPARES, [])
+        wait(pending)
+    # Raise comparison failures from the test call so they report as failures of
+    # the test that captured them.
+    for future in pending:
+        future.result()
+
+
+@pytest.fixture(scope="session")
+def canvas_compare_pool() -> Generator[ThreadPoolExecutor, None, None]:
+    # SSIM runs in scikit-image/scipy kernels that release the GIL, so threads
+    # overlap comparisons with the next browser step without pickling captures.
+    pool = ThreadPoolExecutor(max_workers=2)
+    try:
+        yield pool
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
 @pytest.fixture
 def canvas_assert_capture(
+    request: pytest.FixtureRequest,
+    canvas_compare_pool,
     canvas_capture,
     canvas_label,
     canvas_reference_path,
     canvas_compare_images,
     canvas_save_capture,
 ) -> Callable[[PlaywrightPage, str, float], None]:
+    pending = request.node.stash.setdefault(_PENDING_COMPARES, [])
+
+    def _check(
+        captured_image: Image.Image,
+        reference_path: pathlib.Path,
+        label: str,
+        threshold: float,
+    ) -> None:
+        try:
+            score = canvas_compare_images(captured_image, reference_path)
+            passed = score >= threshold
+        except Exception:
+            canvas_save_capture(captured_image, label, False)
+            raise
+        canvas_save_capture(captured_image, label, passed)
+        assert passed, (
+            f"Captured image similarity below threshold for {label}. "
+            f"Score: {score:.4f} (threshold {threshold:.4f})."
+        )
+
     def _assert(page: PlaywrightPage, capture_label: str, threshold: float) -> None:
         if not capture_label:
             raise ValueError("capture_label must be non-empty.")
@@ -508,16 +930,10 @@ def canvas_assert_capture(
                 "Reference image missing. Saved capture to "
                 f"{reference_path}; verify and re-run."
             )
-        try:
-            score = canvas_compare_images(captured_image, reference_path)
-            passed = score >= threshold
-        except Exception:
-            canvas_save_capture(captured_image, label, False)
-            raise
-        canvas_save_capture(captured_image, label, passed)
-        assert passed, (
-            "Captured image similarity below threshold. "
-            f"Score: {score:.4f} (threshold {threshold:.4f})."
+        pending.append(
+            canvas_compare_pool.submit(
+                _check, captured_image, reference_path, label, threshold
+            )
         )
 
     return _assert
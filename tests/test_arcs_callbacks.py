@@ -11,7 +11,6 @@ from pyglobegl import (
     ArcsLayerConfig,
     GlobeConfig,
     GlobeInitConfig,
-    GlobeLayerConfig,
     GlobeLayoutConfig,
     GlobeViewConfig,
     GlobeWidget,
@@ -25,7 +24,7 @@ if TYPE_CHECKING:
 
 @pytest.mark.usefixtures("solara_test")
 def test_on_arc_click_callback(
-    page_session: Page, globe_clicker, globe_earth_texture_url
+    page_session: Page, globe_clicker, globe_earth_layer
 ) -> None:
     click_event = Event()
     payload: dict[str, Any] = {}
@@ -52,11 +51,7 @@ def test_on_arc_click_callback(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         arcs=ArcsLayerConfig(arcs_data=arcs_data, arcs_transition_duration=0),
         view=GlobeViewConfig(
             point_of_view=PointOfView(lat=0, lng=0, altitude=1.7), transition_ms=0
@@ -91,7 +86,7 @@ def test_on_arc_click_callback(
 
 @pytest.mark.usefixtures("solara_test")
 def test_on_arc_right_click_callback(
-    page_session: Page, globe_clicker, globe_earth_texture_url
+    page_session: Page, globe_clicker, globe_earth_layer
 ) -> None:
     click_event = Event()
     payload: dict[str, Any] = {}
@@ -118,11 +113,7 @@ def test_on_arc_right_click_callback(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         arcs=ArcsLayerConfig(arcs_data=arcs_data, arcs_transition_duration=0),
         view=GlobeViewConfig(
             point_of_view=PointOfView(lat=0, lng=0, altitude=1.7), transition_ms=0
@@ -157,7 +148,7 @@ def test_on_arc_right_click_callback(
 
 @pytest.mark.usefixtures("solara_test")
 def test_on_arc_hover_callback(
-    page_session: Page, globe_hoverer, globe_earth_texture_url
+    page_session: Page, globe_hoverer, globe_earth_layer
 ) -> None:
     hover_event = Event()
     payload: dict[str, Any] = {}
@@ -184,11 +175,7 @@ def test_on_arc_hover_callback(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         arcs=ArcsLayerConfig(arcs_data=arcs_data, arcs_transition_duration=0),
         view=GlobeViewConfig(
             point_of_view=PointOfView(lat=0, lng=0, altitude=1.7), transition_ms=0
@@ -13,7 +13,6 @@ from pyglobegl import (
     ArcsLayerConfig,
     GlobeConfig,
     GlobeInitConfig,
-    GlobeLayerConfig,
     GlobeLayoutConfig,
     GlobeViewConfig,
     GlobeWidget,
@@ -27,7 +26,7 @@ if TYPE_CHECKING:
 
 @pytest.mark.usefixtures("solara_test")
 def test_arcs_accessors(
-    page_session: Page, canvas_assert_capture, globe_earth_texture_url
+    page_session: Page, canvas_assert_capture, globe_earth_layer
 ) -> None:
     canvas_similarity_threshold = 0.975
     arcs_data = [
@@ -67,11 +66,7 @@ def test_arcs_accessors(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         arcs=ArcsLayerConfig(arcs_data=arcs_data, arcs_transition_duration=0),
         view=GlobeViewConfig(
             point_of_view=PointOfView(lat=0, lng=0, altitude=1.7), transition_ms=0
@@ -108,7 +103,7 @@ def test_arcs_accessors(
 
 @pytest.mark.usefixtures("solara_test")
 def test_arcs_default_accessors(
-    page_session: Page, canvas_assert_capture, globe_earth_texture_url
+    page_session: Page, canvas_assert_capture, globe_earth_layer
 ) -> None:
     canvas_similarity_threshold = 0.97
     arcs_data = [
@@ -148,11 +143,7 @@ def test_arcs_default_accessors(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         arcs=ArcsLayerConfig(arcs_data=arcs_data, arcs_transition_duration=0),
         view=GlobeViewConfig(
             point_of_view=PointOfView(lat=0, lng=0, altitude=1.7), transition_ms=0
@@ -176,7 +167,7 @@ def test_arcs_default_accessors(
 
 @pytest.mark.usefixtures("solara_test")
 def test_arc_dashes(
-    page_session: Page, canvas_assert_capture, globe_earth_texture_url
+    page_session: Page, canvas_assert_capture, globe_earth_layer
 ) -> None:
     canvas_similarity_threshold = 0.98
     initial_dash_length = 1.0
@@ -205,11 +196,7 @@ def test_arc_dashes(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         arcs=ArcsLayerConfig(arcs_data=arcs_data, arcs_transition_duration=0),
         view=GlobeViewConfig(
             point_of_view=PointOfView(lat=0, lng=0, altitude=1.7), transition_ms=0
@@ -235,7 +222,7 @@ def test_arc_dashes(
 
 @pytest.mark.usefixtures("solara_test")
 def test_arc_runtime_update(
-    page_session: Page, canvas_assert_capture, globe_earth_texture_url
+    page_session: Page, canvas_assert_capture, globe_earth_layer
 ) -> None:
     canvas_similarity_threshold = 0.96
     initial_colors = ["#ffcc00", "#00ffaa"]
@@ -267,11 +254,7 @@ def test_arc_runtime_update(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         arcs=ArcsLayerConfig(arcs_data=arcs_data, arcs_transition_duration=0),
         view=GlobeViewConfig(
             point_of_view=PointOfView(lat=0, lng=0, altitude=1.7), transition_ms=0
@@ -312,7 +295,7 @@ def test_arc_runtime_update(
 
 @pytest.mark.usefixtures("solara_test")
 def test_arc_stroke(
-    page_session: Page, canvas_assert_capture, globe_earth_texture_url
+    page_session: Page, canvas_assert_capture, globe_earth_layer
 ) -> None:
     canvas_similarity_threshold = 0.97
     initial_stroke = 0.4
@@ -335,11 +318,7 @@ def test_arc_stroke(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         arcs=ArcsLayerConfig(arcs_data=arcs_data, arcs_transition_duration=0),
         view=GlobeViewConfig(
             point_of_view=PointOfView(lat=0, lng=0, altitude=1.7), transition_ms=0
@@ -363,7 +342,7 @@ def test_arc_stroke(
 
 @pytest.mark.usefixtures("solara_test")
 def test_arc_start_end_altitude(
-    page_session: Page, canvas_assert_capture, globe_earth_texture_url
+    page_session: Page, canvas_assert_capture, globe_earth_layer
 ) -> None:
     canvas_similarity_threshold = 0.98
     arc_id = uuid4()
@@ -386,11 +365,7 @@ def test_arc_start_end_altitude(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         arcs=ArcsLayerConfig(arcs_data=arcs_data, arcs_transition_duration=0),
         view=GlobeViewConfig(
             point_of_view=PointOfView(lat=0, lng=0, altitude=1.8), transition_ms=0
@@ -423,7 +398,7 @@ def test_arc_start_end_altitude(
 
 @pytest.mark.usefixtures("solara_test")
 def test_arc_curve_resolution(
-    page_session: Page, canvas_assert_capture, globe_earth_texture_url
+    page_session: Page, canvas_assert_capture, globe_earth_layer
 ) -> None:
     canvas_similarity_threshold = 0.96
     initial_curve_resolution = 2
@@ -445,11 +420,7 @@ def test_arc_curve_resolution(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         arcs=ArcsLayerConfig(
             arcs_data=arcs_data,
             arc_curve_resolution=initial_curve_resolution,
@@ -477,7 +448,7 @@ def test_arc_curve_resolution(
 
 @pytest.mark.usefixtures("solara_test")
 def test_arc_circular_resolution(
-    page_session: Page, canvas_assert_capture, globe_earth_texture_url
+    page_session: Page, canvas_assert_capture, globe_earth_layer
 ) -> None:
     canvas_similarity_threshold = 0.98
     initial_circular_resolution = 2
@@ -499,11 +470,7 @@ def test_arc_circular_resolution(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         arcs=ArcsLayerConfig(
             arcs_data=arcs_data,
             arc_circular_resolution=initial_circular_resolution,
@@ -531,7 +498,7 @@ def test_arc_circular_resolution(
 
 @pytest.mark.usefixtures("solara_test")
 def test_arc_dash_initial_gap(
-    page_session: Page, canvas_assert_capture, globe_earth_texture_url
+    page_session: Page, canvas_assert_capture, globe_earth_layer
 ) -> None:
     canvas_similarity_threshold = 0.99
     initial_gap = 0.0
@@ -558,11 +525,7 @@ def test_arc_dash_initial_gap(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         arcs=ArcsLayerConfig(arcs_data=arcs_data, arcs_transition_duration=0),
         view=GlobeViewConfig(
             point_of_view=PointOfView(lat=0, lng=0, altitude=1.7), transition_ms=0
@@ -590,7 +553,7 @@ def test_arc_dash_animation_changes(
     canvas_capture,
     canvas_label,
     canvas_save_capture,
-    globe_earth_texture_url,
+    globe_earth_layer,
 ) -> None:
     arcs_data = [
         ArcDatum(
@@ -611,11 +574,7 @@ def test_arc_dash_animation_changes(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         arcs=ArcsLayerConfig(arcs_data=arcs_data, arcs_transition_duration=0),
         view=GlobeViewConfig(
             point_of_view=PointOfView(lat=0, lng=0, altitude=1.7), transition_ms=0
@@ -664,7 +623,7 @@ def test_arc_dash_animate_time_setter(
     canvas_capture,
     canvas_label,
     canvas_save_capture,
-    globe_earth_texture_url,
+    globe_earth_layer,
 ) -> None:
     canvas_similarity_threshold = 0.98
     arc_id = uuid4()
@@ -688,11 +647,7 @@ def test_arc_dash_animate_time_setter(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         arcs=ArcsLayerConfig(arcs_data=arcs_data, arcs_transition_duration=0),
         view=GlobeViewConfig(
             point_of_view=PointOfView(lat=0, lng=0, altitude=1.7), transition_ms=0
@@ -740,7 +695,7 @@ def test_arc_dash_animate_time_setter(
 
 @pytest.mark.usefixtures("solara_test")
 def test_arcs_transition_duration(
-    page_session: Page, canvas_assert_capture, globe_earth_texture_url
+    page_session: Page, canvas_assert_capture, globe_earth_layer
 ) -> None:
     canvas_similarity_threshold = 0.99
     initial_arcs = [
@@ -769,11 +724,7 @@ def test_arcs_transition_duration(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         arcs=ArcsLayerConfig(arcs_data=initial_arcs, arcs_transition_duration=0),
         view=GlobeViewConfig(
             point_of_view=PointOfView(lat=0, lng=0, altitude=1.7), transition_ms=0
@@ -797,7 +748,7 @@ def test_arcs_transition_duration(
 
 
 @pytest.mark.usefixtures("solara_test")
-def test_arc_label_tooltip(page_session: Page, globe_earth_texture_url) -> None:
+def test_arc_label_tooltip(page_session: Page, globe_earth_layer) -> None:
     arcs_data = [
         ArcDatum(
             start_lat=0,
@@ -828,11 +779,7 @@ def test_arc_label_tooltip(page_session: Page, globe_earth_texture_url) -> None:
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         arcs=ArcsLayerConfig(arcs_data=arcs_data, arcs_transition_duration=0),
         view=GlobeViewConfig(
             point_of_view=PointOfView(lat=0, lng=0, altitude=1.7), transition_ms=0
@@ -905,7 +852,7 @@ def test_arc_label_tooltip(page_session: Page, globe_earth_texture_url) -> None:
 
 @pytest.mark.usefixtures("solara_test")
 def test_arc_altitude_modes(
-    page_session: Page, canvas_assert_capture, globe_earth_texture_url
+    page_session: Page, canvas_assert_capture, globe_earth_layer
 ) -> None:
     canvas_similarity_threshold = 0.99
     initial_altitude = 0.15
@@ -930,11 +877,7 @@ def test_arc_altitude_modes(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         arcs=ArcsLayerConfig(arcs_data=arcs_data, arcs_transition_duration=0),
         view=GlobeViewConfig(
             point_of_view=PointOfView(lat=0, lng=0, altitude=1.8), transition_ms=0
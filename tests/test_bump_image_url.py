@@ -22,6 +22,7 @@ if TYPE_CHECKING:
 def test_bump_image_url(
     page_session: Page,
     canvas_assert_capture,
+    canvas_wait_changed,
     globe_bump_test_data_url,
     globe_flat_texture_data_url,
 ) -> None:
@@ -50,6 +51,7 @@ def test_bump_image_url(
     )
 
     canvas_assert_capture(page_session, "initial", canvas_similarity_threshold)
-    widget.set_bump_image_url(updated_bump_image_url)
-    page_session.wait_for_timeout(200)
+    canvas_wait_changed(
+        page_session, lambda: widget.set_bump_image_url(updated_bump_image_url)
+    )
     canvas_assert_capture(page_session, "updated", canvas_similarity_threshold)
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from typing import Any
 
+import geopandas as gpd
 import pytest
+from shapely.geometry import Point
 
 from pyglobegl import ArcDatum, arcs_from_gdf
 
@@ -26,16 +28,14 @@ from pyglobegl import ArcDatum, arcs_from_gdf
 def test_arcs_from_gdf_valid(
     rows: list[dict[str, tuple[float, float]]], expected: list[ArcDatum]
 ) -> None:
-    geopandas = pytest.importorskip("geopandas")
-    from shapely.geometry import Point
-
-    gdf = geopandas.GeoDataFrame(
+    start_xs, start_ys = zip(*(row["start"] for row in rows), strict=True)
+    end_xs, end_ys = zip(*(row["end"] for row in rows), strict=True)
+    gdf = gpd.GeoDataFrame(
         {
-            "start": [Point(*row["start"]) for row in rows],
-            "end": [Point(*row["end"]) for row in rows],
+            "start": gpd.GeoSeries.from_xy(start_xs, start_ys, crs=4326),
+            "end": gpd.GeoSeries.from_xy(end_xs, end_ys, crs=4326),
         },
         geometry="start",
-        crs=4326,
     )
     arcs = arcs_from_gdf(gdf)
     assert len(arcs) == len(expected)
@@ -48,20 +48,14 @@ def test_arcs_from_gdf_valid(
 
 
 def test_arcs_from_gdf_missing_columns() -> None:
-    geopandas = pytest.importorskip("geopandas")
-    from shapely.geometry import Point
-
-    gdf = geopandas.GeoDataFrame({"start": [Point(0, 0)]}, geometry="start", crs=4326)
+    gdf = gpd.GeoDataFrame({"start": [Point(0, 0)]}, geometry="start", crs=4326)
 
     with pytest.raises(ValueError, match="missing columns"):
         arcs_from_gdf(gdf)
 
 
 def test_arcs_from_gdf_invalid_ranges() -> None:
-    geopandas = pytest.importorskip("geopandas")
-    from shapely.geometry import Point
-
-    gdf = geopandas.GeoDataFrame(
+    gdf = gpd.GeoDataFrame(
         {"start": [Point(0, 100)], "end": [Point(0, 0)]}, geometry="start", crs=4326
     )
 
@@ -70,10 +64,7 @@ def test_arcs_from_gdf_invalid_ranges() -> None:
 
 
 def test_arcs_from_gdf_include_columns() -> None:
-    geopandas = pytest.importorskip("geopandas")
-    from shapely.geometry import Point
-
-    gdf = geopandas.GeoDataFrame(
+    gdf = gpd.GeoDataFrame(
         {"start": [Point(0, 0)], "end": [Point(10, 0)], "name": ["Arc"]},
         geometry="start",
         crs=4326,
@@ -143,10 +134,7 @@ def test_arcs_from_gdf_include_columns() -> None:
 def test_arcs_from_gdf_invalid_optional_column_types(
     column: str, value: Any, match: str
 ) -> None:
-    geopandas = pytest.importorskip("geopandas")
-    from shapely.geometry import Point
-
-    gdf = geopandas.GeoDataFrame(
+    gdf = gpd.GeoDataFrame(
         {"start": [Point(0, 0)], "end": [Point(10, 0)], column: [value]},
         geometry="start",
         crs=4326,
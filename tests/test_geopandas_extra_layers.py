@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import geopandas as gpd
 import pytest
+from shapely.geometry import Point, Polygon
 
 from pyglobegl import (
     HeatmapDatum,
@@ -21,10 +23,7 @@ from pyglobegl import (
 
 
 def test_heatmaps_from_gdf_builds_single_heatmap() -> None:
-    geopandas = pytest.importorskip("geopandas")
-    from shapely.geometry import Point
-
-    gdf = geopandas.GeoDataFrame(
+    gdf = gpd.GeoDataFrame(
         {"weight": [1.5, 2.0], "point": [Point(10, 5), Point(-20, 40)]},
         geometry="point",
         crs="EPSG:4326",
@@ -41,11 +40,8 @@ def test_heatmaps_from_gdf_builds_single_heatmap() -> None:
 
 
 def test_hexed_polygons_from_gdf_builds_polygons() -> None:
-    geopandas = pytest.importorskip("geopandas")
-    from shapely.geometry import Polygon
-
     geom = Polygon([(0, 0), (0, 2), (2, 2), (2, 0), (0, 0)])
-    gdf = geopandas.GeoDataFrame(
+    gdf = gpd.GeoDataFrame(
         {"geometry": [geom], "label": ["A"]}, geometry="geometry", crs="EPSG:4326"
     )
 
@@ -55,13 +51,9 @@ def test_hexed_polygons_from_gdf_builds_polygons() -> None:
     assert polygons[0].label == "A"
 
 
-def test_hexbin_points_from_gdf_builds_points() -> None:
-    geopandas = pytest.importorskip("geopandas")
-    from shapely.geometry import Point
-
-    gdf = geopandas.GeoDataFrame(
-        {"weight": [2.0], "point": [Point(10, 5)]}, geometry="point", crs="EPSG:4326"
-    )
+def test_hexbin_points_from_gdf_builds_points(point_gdf: gpd.GeoDataFrame) -> None:
+    gdf = point_gdf.copy()
+    gdf["weight"] = [2.0]
 
     points = hexbin_points_from_gdf(gdf, weight_column="weight")
     assert len(points) == 1
@@ -71,15 +63,10 @@ def test_hexbin_points_from_gdf_builds_points() -> None:
     assert points[0].weight == pytest.approx(2.0)
 
 
-def test_tiles_from_gdf_builds_tiles() -> None:
-    geopandas = pytest.importorskip("geopandas")
-    from shapely.geometry import Point
-
-    gdf = geopandas.GeoDataFrame(
-        {"width": [10], "height": [20], "point": [Point(10, 5)]},
-        geometry="point",
-        crs="EPSG:4326",
-    )
+def test_tiles_from_gdf_builds_tiles(point_gdf: gpd.GeoDataFrame) -> None:
+    gdf = point_gdf.copy()
+    gdf["width"] = [10]
+    gdf["height"] = [20]
 
     tiles = tiles_from_gdf(gdf, include_columns=["width", "height"])
     assert len(tiles) == 1
@@ -89,10 +76,7 @@ def test_tiles_from_gdf_builds_tiles() -> None:
 
 
 def test_particles_from_gdf_builds_particle_group() -> None:
-    geopandas = pytest.importorskip("geopandas")
-    from shapely.geometry import Point
-
-    gdf = geopandas.GeoDataFrame(
+    gdf = gpd.GeoDataFrame(
         {"point": [Point(10, 5), Point(-20, 40)]}, geometry="point", crs="EPSG:4326"
     )
 
@@ -102,28 +86,17 @@ def test_particles_from_gdf_builds_particle_group() -> None:
     assert len(particles[0].particles) == 2
 
 
-def test_rings_from_gdf_builds_rings() -> None:
-    geopandas = pytest.importorskip("geopandas")
-    from shapely.geometry import Point
-
-    gdf = geopandas.GeoDataFrame(
-        {"point": [Point(10, 5)]}, geometry="point", crs="EPSG:4326"
-    )
-
-    rings = rings_from_gdf(gdf)
+def test_rings_from_gdf_builds_rings(point_gdf: gpd.GeoDataFrame) -> None:
+    rings = rings_from_gdf(point_gdf)
     assert len(rings) == 1
     assert isinstance(rings[0], RingDatum)
     assert rings[0].lat == pytest.approx(5.0)
     assert rings[0].lng == pytest.approx(10.0)
 
 
-def test_labels_from_gdf_builds_labels() -> None:
-    geopandas = pytest.importorskip("geopandas")
-    from shapely.geometry import Point
-
-    gdf = geopandas.GeoDataFrame(
-        {"name": ["A"], "point": [Point(10, 5)]}, geometry="point", crs="EPSG:4326"
-    )
+def test_labels_from_gdf_builds_labels(point_gdf: gpd.GeoDataFrame) -> None:
+    gdf = point_gdf.copy()
+    gdf["name"] = ["A"]
 
     labels = labels_from_gdf(gdf, text_column="name")
     assert len(labels) == 1
@@ -131,13 +104,6 @@ def test_labels_from_gdf_builds_labels() -> None:
     assert labels[0].text == "A"
 
 
-def test_labels_from_gdf_requires_text_column() -> None:
-    geopandas = pytest.importorskip("geopandas")
-    from shapely.geometry import Point
-
-    gdf = geopandas.GeoDataFrame(
-        {"point": [Point(10, 5)]}, geometry="point", crs="EPSG:4326"
-    )
-
+def test_labels_from_gdf_requires_text_column(point_gdf: gpd.GeoDataFrame) -> None:
     with pytest.raises(ValueError, match="missing columns"):
-        labels_from_gdf(gdf, text_column="name")
+        labels_from_gdf(point_gdf, text_column="name")
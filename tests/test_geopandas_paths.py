@@ -1,17 +1,17 @@
 from __future__ import annotations
 
+import geopandas as gpd
+import numpy as np
+import pandas as pd
 from pydantic_extra_types.color import Color
 import pytest
+from shapely.geometry import LineString, MultiLineString
 
 from pyglobegl import PathDatum
 from pyglobegl.geopandas import paths_from_gdf
 
 
 def test_paths_from_gdf_linestring() -> None:
-    import geopandas as gpd
-    import pandas as pd
-    from shapely.geometry import LineString
-
     df = pd.DataFrame(
         {
             "geometry": [
@@ -41,10 +41,6 @@ def test_paths_from_gdf_linestring() -> None:
 
 
 def test_paths_from_gdf_multilinestring() -> None:
-    import geopandas as gpd
-    import pandas as pd
-    from shapely.geometry import MultiLineString
-
     df = pd.DataFrame(
         {
             "geometry": [MultiLineString([[(0, 0), (1, 1)], [(2, 2), (3, 3)]])],
@@ -59,3 +55,27 @@ def test_paths_from_gdf_multilinestring() -> None:
     assert paths[0].path == [(0.0, 0.0), (1.0, 1.0)]
     assert paths[1].path == [(2.0, 2.0), (3.0, 3.0)]
     assert all(path.label == "Multi Path" for path in paths)
+
+
+def test_paths_from_gdf_mixed_2d_and_3d() -> None:
+    gdf = gpd.GeoDataFrame(
+        {
+            "geometry": [
+                LineString([(0, 0), (1, 1)]),
+                LineString([(0, 0, 5), (1, 1, 6)]),
+            ]
+        },
+        crs="EPSG:4326",
+    )
+
+    paths = paths_from_gdf(gdf)
+
+    assert paths[0].path == [(0.0, 0.0), (1.0, 1.0)]
+    assert paths[1].path == [(0.0, 0.0, 5.0), (1.0, 1.0, 6.0)]
+
+
+def test_path_datum_accepts_numpy_coordinates() -> None:
+    path = PathDatum(path=np.array([[0.0, 0.0], [1.0, 1.0], [0.0, 2.0]]))
+
+    assert path.path == [(0.0, 0.0), (1.0, 1.0), (0.0, 2.0)]
+    assert path.model_dump(mode="json")["path"] == [[0.0, 0.0], [1.0, 1.0], [0.0, 2.0]]
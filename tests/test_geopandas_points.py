@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-from itertools import starmap
 from typing import Any
 
+import geopandas as gpd
+import numpy as np
 import pytest
+from shapely.geometry import LineString, Point
 
-from pyglobegl import PointDatum, points_from_gdf
+from pyglobegl import PointDatum, points_arrays_from_gdf, points_from_gdf
 
 
 @pytest.mark.parametrize(
-    ("crs", "geometry", "expected"),
+    ("crs", "geometry", "expected", "rtol"),
     [
         pytest.param(
             "EPSG:4326",
@@ -18,6 +20,7 @@ from pyglobegl import PointDatum, points_from_gdf
                 {"lat": 5.0, "lng": 10.0, "name": "A", "value": 1},
                 {"lat": 40.0, "lng": -20.0, "name": "B", "value": 2},
             ],
+            1e-7,
             id="epsg-4326",
         ),
         pytest.param(
@@ -25,37 +28,38 @@ from pyglobegl import PointDatum, points_from_gdf
             [(0.0, 0.0), (1_000_000.0, 1_000_000.0)],
             [
                 {"lat": 0.0, "lng": 0.0, "name": "A", "value": 1},
-                {
-                    "lat": pytest.approx(8.9466, rel=1e-3),
-                    "lng": pytest.approx(8.9831, rel=1e-3),
-                    "name": "B",
-                    "value": 2,
-                },
+                {"lat": 8.9466, "lng": 8.9831, "name": "B", "value": 2},
             ],
+            1e-3,
             id="epsg-3857",
         ),
     ],
 )
 def test_points_from_gdf_validates_schema(
-    crs: str, geometry: list[tuple[float, float]], expected: list[dict[str, Any]]
+    crs: str,
+    geometry: list[tuple[float, float]],
+    expected: list[dict[str, Any]],
+    rtol: float,
 ) -> None:
-    geopandas = pytest.importorskip("geopandas")
-    from shapely.geometry import Point
-
-    gdf = geopandas.GeoDataFrame(
-        {"name": ["A", "B"], "value": [1, 2], "point": list(starmap(Point, geometry))},
-        geometry="point",
+    xs, ys = zip(*geometry, strict=True)
+    gdf = gpd.GeoDataFrame(
+        {"name": ["A", "B"], "value": [1, 2]},
+        geometry=gpd.points_from_xy(xs, ys),
         crs=crs,
     )
 
     points = points_from_gdf(gdf, include_columns=["name", "value"])
     assert len(points) == len(expected)
+    assert all(isinstance(point, PointDatum) for point in points)
+    np.testing.assert_allclose(
+        [(point.lat, point.lng) for point in points],
+        [(expect["lat"], expect["lng"]) for expect in expected],
+        rtol=rtol,
+    )
+    np.testing.assert_allclose(
+        [(point.altitude, point.radius) for point in points], [(0.1, 0.25)] * 2
+    )
     for point, expect in zip(points, expected, strict=True):
-        assert isinstance(point, PointDatum)
-        assert point.lat == expect["lat"]
-        assert point.lng == expect["lng"]
-        assert point.altitude == pytest.approx(0.1)
-        assert point.radius == pytest.approx(0.25)
         assert point.color.as_hex(format="long") == "#ffffaa"
         assert point.model_dump(
             exclude={"id", "lat", "lng", "altitude", "radius", "color", "label"}
@@ -63,10 +67,7 @@ def test_points_from_gdf_validates_schema(
 
 
 def test_points_from_gdf_requires_crs() -> None:
-    geopandas = pytest.importorskip("geopandas")
-    from shapely.geometry import Point
-
-    gdf = geopandas.GeoDataFrame(
+    gdf = gpd.GeoDataFrame(
         {"name": ["A"], "value": [1], "point": [Point(10, 5)]},
         geometry="point",
         crs=None,
@@ -77,10 +78,7 @@ def test_points_from_gdf_requires_crs() -> None:
 
 
 def test_points_from_gdf_rejects_non_point_geometry() -> None:
-    geopandas = pytest.importorskip("geopandas")
-    from shapely.geometry import LineString
-
-    gdf = geopandas.GeoDataFrame(
+    gdf = gpd.GeoDataFrame(
         {"name": ["A"], "value": [1], "point": [LineString([(0, 0), (1, 1)])]},
         geometry="point",
         crs="EPSG:4326",
@@ -90,13 +88,9 @@ def test_points_from_gdf_rejects_non_point_geometry() -> None:
         points_from_gdf(gdf, include_columns=["name", "value"])
 
 
-def test_points_from_gdf_missing_columns() -> None:
-    geopandas = pytest.importorskip("geopandas")
-    from shapely.geometry import Point
-
-    gdf = geopandas.GeoDataFrame(
-        {"name": ["A"], "point": [Point(10, 5)]}, geometry="point", crs="EPSG:4326"
-    )
+def test_points_from_gdf_missing_columns(point_gdf: gpd.GeoDataFrame) -> None:
+    gdf = point_gdf.copy()
+    gdf["name"] = ["A"]
 
     with pytest.raises(ValueError, match="missing columns"):
         points_from_gdf(gdf, include_columns=["name", "value"])
@@ -117,14 +111,51 @@ def test_points_from_gdf_missing_columns() -> None:
     ],
 )
 def test_points_from_gdf_invalid_optional_column_types(
-    column: str, value: Any, match: str
+    point_gdf: gpd.GeoDataFrame, column: str, value: Any, match: str
 ) -> None:
-    geopandas = pytest.importorskip("geopandas")
-    from shapely.geometry import Point
+    gdf = point_gdf.copy()
+    gdf[column] = [value]
+
+    with pytest.raises(ValueError, match=match):
+        points_from_gdf(gdf)
+
 
-    gdf = geopandas.GeoDataFrame(
-        {"point": [Point(10, 5)], column: [value]}, geometry="point", crs="EPSG:4326"
+def test_points_arrays_from_gdf_returns_columns() -> None:
+    gdf = gpd.GeoDataFrame(
+        {
+            "name": ["A", "B", "C"],
+            "color": ["red", "#00ff0080", "red"],
+            "radius": [1.0, 2.0, 3.0],
+        },
+        geometry=gpd.points_from_xy([10, -20, 0], [5, 40, 0]),
+        crs="EPSG:4326",
     )
 
+    arrays = points_arrays_from_gdf(gdf, include_columns=["name"])
+
+    assert arrays["lat"].dtype == np.float32
+    assert arrays["lat"].tolist() == [5.0, 40.0, 0.0]
+    assert arrays["lng"].tolist() == [10.0, -20.0, 0.0]
+    assert arrays["altitude"].tolist() == pytest.approx([0.1, 0.1, 0.1])
+    assert arrays["radius"].tolist() == [1.0, 2.0, 3.0]
+    assert arrays["color"].dtype == np.uint32
+    assert arrays["color"].tolist() == [0xFF0000FF, 0x00FF0080, 0xFF0000FF]
+    assert arrays["name"].tolist() == ["A", "B", "C"]
+    assert "label" not in arrays
+
+
+@pytest.mark.parametrize(
+    ("column", "value", "match"),
+    [
+        pytest.param("radius", -2.0, "greater than 0", id="radius-negative"),
+        pytest.param("color", "notacolor", "valid color", id="color-invalid"),
+    ],
+)
+def test_points_arrays_from_gdf_invalid_optional_column(
+    point_gdf: gpd.GeoDataFrame, column: str, value: Any, match: str
+) -> None:
+    gdf = point_gdf.copy()
+    gdf[column] = [value]
+
     with pytest.raises(ValueError, match=match):
-        points_from_gdf(gdf)
+        points_arrays_from_gdf(gdf)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import cache
+
 from geojson_pydantic import (
     MultiPolygon as GeoJsonMultiPolygon,
     Polygon as GeoJsonPolygon,
@@ -12,12 +14,24 @@ from shapely.geometry import MultiPolygon, Point, Polygon
 from pyglobegl import PolygonDatum, polygons_from_gdf
 
 
+@cache
 def _square(west: float, south: float, east: float, north: float) -> Polygon:
+    # Shapely geometries are immutable, so tests can share one instance per extent.
     return Polygon(
         [(west, south), (west, north), (east, north), (east, south), (west, south)]
     )
 
 
+@pytest.fixture(scope="module")
+def zone_gdf() -> gpd.GeoDataFrame:
+    # Shared read-only frame; tests that need changes derive a new one from it.
+    return gpd.GeoDataFrame(
+        {"name": ["Zone A"], "polygons": [_square(-10, -5, 10, 5)]},
+        geometry="polygons",
+        crs="EPSG:4326",
+    )
+
+
 def test_polygons_from_gdf_validates_schema() -> None:
     gdf = gpd.GeoDataFrame(
         {
@@ -45,15 +59,8 @@ def test_polygons_from_gdf_validates_schema() -> None:
     assert isinstance(polygon.geometry, GeoJsonPolygon)
 
 
-def test_polygons_from_gdf_reprojects_geometry() -> None:
-    polygon = _square(-10, -5, 10, 5)
-    gdf = gpd.GeoDataFrame(
-        {"name": ["Zone A"], "polygons": [polygon]},
-        geometry="polygons",
-        crs="EPSG:4326",
-    ).to_crs(3857)
-
-    polygons = polygons_from_gdf(gdf, include_columns=["name"])
+def test_polygons_from_gdf_reprojects_geometry(zone_gdf: gpd.GeoDataFrame) -> None:
+    polygons = polygons_from_gdf(zone_gdf.to_crs(3857), include_columns=["name"])
     polygon = polygons[0]
     assert isinstance(polygon, PolygonDatum)
     geometry = polygon.geometry
@@ -83,15 +90,9 @@ def test_polygons_from_gdf_rejects_non_polygon_geometry() -> None:
         polygons_from_gdf(gdf)
 
 
-def test_polygons_from_gdf_missing_columns() -> None:
-    gdf = gpd.GeoDataFrame(
-        {"name": ["Zone A"], "polygons": [_square(-10, -5, 10, 5)]},
-        geometry="polygons",
-        crs="EPSG:4326",
-    )
-
+def test_polygons_from_gdf_missing_columns(zone_gdf: gpd.GeoDataFrame) -> None:
     with pytest.raises(ValueError, match="missing columns"):
-        polygons_from_gdf(gdf, include_columns=["missing"])
+        polygons_from_gdf(zone_gdf, include_columns=["missing"])
 
 
 def test_polygons_from_gdf_invalid_optional_column_types() -> None:
@@ -111,6 +112,29 @@ def test_polygons_from_gdf_invalid_optional_column_types() -> None:
         polygons_from_gdf(gdf)
 
 
+def test_polygons_from_gdf_numeric_columns() -> None:
+    gdf = gpd.GeoDataFrame(
+        {
+            "polygons": [_square(-10, -5, 10, 5), _square(15, -5, 25, 5)],
+            "altitude": [0, 2],
+            "cap_curvature_resolution": [1.5, 3.0],
+        },
+        geometry="polygons",
+        crs="EPSG:4326",
+    )
+
+    polygons = polygons_from_gdf(
+        gdf, include_columns=["altitude", "cap_curvature_resolution"]
+    )
+    assert [polygon.altitude for polygon in polygons] == [0.0, 2.0]
+    assert all(isinstance(polygon.altitude, float) for polygon in polygons)
+    assert [polygon.cap_curvature_resolution for polygon in polygons] == [1.5, 3.0]
+
+    gdf["cap_curvature_resolution"] = [1.5, 0.0]
+    with pytest.raises(ValueError, match="cap_curvature_resolution"):
+        polygons_from_gdf(gdf)
+
+
 def test_polygons_from_gdf_accepts_multipolygon() -> None:
     polygon = _square(-10, -5, 10, 5)
     multipolygon = MultiPolygon([polygon, _square(15, -5, 25, 5)])
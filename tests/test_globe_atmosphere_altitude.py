@@ -3,16 +3,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from IPython.display import display
-import numpy as np
 import pytest
 
-from pyglobegl import (
-    GlobeConfig,
-    GlobeInitConfig,
-    GlobeLayerConfig,
-    GlobeLayoutConfig,
-    GlobeWidget,
-)
+from pyglobegl import GlobeLayerConfig, GlobeWidget
 
 
 if TYPE_CHECKING:
@@ -22,60 +15,33 @@ if TYPE_CHECKING:
 @pytest.mark.usefixtures("solara_test")
 def test_globe_atmosphere_altitude(
     page_session: Page,
+    globe_wait_ready,
     canvas_assert_capture,
-    canvas_capture,
-    canvas_label,
-    canvas_save_capture,
     globe_earth_texture_url,
+    globe_render_update,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.99
     initial_altitude = 0.05
     updated_altitude = 0.25
-    config = GlobeConfig(
-        init=GlobeInitConfig(
-            renderer_config={"preserveDrawingBuffer": True}, animate_in=False
-        ),
-        layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=True,
-            atmosphere_color="#00ffff",
-            atmosphere_altitude=initial_altitude,
-            show_graticules=False,
-        ),
+    config = globe_capture_config.model_copy(
+        update={
+            "globe": GlobeLayerConfig(
+                globe_image_url=globe_earth_texture_url,
+                show_atmosphere=True,
+                atmosphere_color="#00ffff",
+                atmosphere_altitude=initial_altitude,
+                show_graticules=False,
+            )
+        }
     )
     widget = GlobeWidget(config=config)
     display(widget)
 
-    page_session.wait_for_function(
-        "document.querySelector('canvas, .jupyter-widgets') !== null", timeout=20000
-    )
-    page_session.wait_for_function(
-        "window.__pyglobegl_globe_ready === true", timeout=20000
-    )
+    globe_wait_ready(page_session)
 
     canvas_assert_capture(page_session, "altitude-low", canvas_similarity_threshold)
-    low_image = canvas_capture(page_session)
-    low_array = np.asarray(low_image.convert("RGBA"))
-
-    widget.set_atmosphere_altitude(updated_altitude)
-    page_session.wait_for_timeout(200)
-
-    passed = False
-    changed = 0.0
-    high_image = low_image
-    for _attempt in range(4):
-        page_session.wait_for_timeout(300)
-        high_image = canvas_capture(page_session)
-        high_array = np.asarray(high_image.convert("RGBA"))
-        diff = np.abs(low_array.astype(int) - high_array.astype(int))
-        changed = (diff.max(axis=2) > 5).mean()
-        passed = changed > 0.002
-        if passed:
-            break
-    canvas_save_capture(low_image, f"{canvas_label}-altitude-low", passed)
-    canvas_save_capture(high_image, f"{canvas_label}-altitude-high", passed)
-    assert passed, (
-        "Expected atmosphere altitude update to change rendered frame "
-        f"(changed={changed:.4f})."
+    globe_render_update(
+        page_session, lambda: widget.set_atmosphere_altitude(updated_altitude)
     )
+    canvas_assert_capture(page_session, "altitude-high", canvas_similarity_threshold)
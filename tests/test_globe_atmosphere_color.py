@@ -5,13 +5,7 @@ from typing import TYPE_CHECKING
 from IPython.display import display
 import pytest
 
-from pyglobegl import (
-    GlobeConfig,
-    GlobeInitConfig,
-    GlobeLayerConfig,
-    GlobeLayoutConfig,
-    GlobeWidget,
-)
+from pyglobegl import GlobeLayerConfig, GlobeWidget
 
 
 if TYPE_CHECKING:
@@ -20,35 +14,34 @@ if TYPE_CHECKING:
 
 @pytest.mark.usefixtures("solara_test")
 def test_globe_atmosphere_color(
-    page_session: Page, canvas_assert_capture, globe_earth_texture_url
+    page_session: Page,
+    globe_wait_ready,
+    canvas_assert_capture,
+    globe_earth_texture_url,
+    globe_render_update,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.99
     initial_color = "#00ffff"
     updated_color = "#ff00ff"
-    config = GlobeConfig(
-        init=GlobeInitConfig(
-            renderer_config={"preserveDrawingBuffer": True}, animate_in=False
-        ),
-        layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=True,
-            atmosphere_color=initial_color,
-            atmosphere_altitude=0.15,
-            show_graticules=False,
-        ),
+    config = globe_capture_config.model_copy(
+        update={
+            "globe": GlobeLayerConfig(
+                globe_image_url=globe_earth_texture_url,
+                show_atmosphere=True,
+                atmosphere_color=initial_color,
+                atmosphere_altitude=0.15,
+                show_graticules=False,
+            )
+        }
     )
     widget = GlobeWidget(config=config)
     display(widget)
 
-    page_session.wait_for_function(
-        "document.querySelector('canvas, .jupyter-widgets') !== null", timeout=20000
-    )
-    page_session.wait_for_function(
-        "window.__pyglobegl_globe_ready === true", timeout=20000
-    )
+    globe_wait_ready(page_session)
 
     canvas_assert_capture(page_session, "cyan", canvas_similarity_threshold)
-    widget.set_atmosphere_color(updated_color)
-    page_session.wait_for_timeout(100)
+    globe_render_update(
+        page_session, lambda: widget.set_atmosphere_color(updated_color)
+    )
     canvas_assert_capture(page_session, "magenta", canvas_similarity_threshold)
@@ -5,13 +5,7 @@ from typing import TYPE_CHECKING
 from IPython.display import display
 import pytest
 
-from pyglobegl import (
-    GlobeConfig,
-    GlobeInitConfig,
-    GlobeLayerConfig,
-    GlobeLayoutConfig,
-    GlobeWidget,
-)
+from pyglobegl import GlobeLayerConfig, GlobeWidget
 
 
 if TYPE_CHECKING:
@@ -20,34 +14,33 @@ if TYPE_CHECKING:
 
 @pytest.mark.usefixtures("solara_test")
 def test_globe_curvature_resolution(
-    page_session: Page, canvas_assert_capture, globe_earth_texture_url
+    page_session: Page,
+    globe_wait_ready,
+    canvas_assert_capture,
+    globe_earth_texture_url,
+    globe_render_update,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.99
     initial_resolution = 24
     updated_resolution = 2
-    config = GlobeConfig(
-        init=GlobeInitConfig(
-            renderer_config={"preserveDrawingBuffer": True}, animate_in=False
-        ),
-        layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-            globe_curvature_resolution=initial_resolution,
-        ),
+    config = globe_capture_config.model_copy(
+        update={
+            "globe": GlobeLayerConfig(
+                globe_image_url=globe_earth_texture_url,
+                show_atmosphere=False,
+                show_graticules=False,
+                globe_curvature_resolution=initial_resolution,
+            )
+        }
     )
     widget = GlobeWidget(config=config)
     display(widget)
 
-    page_session.wait_for_function(
-        "document.querySelector('canvas, .jupyter-widgets') !== null", timeout=20000
-    )
-    page_session.wait_for_function(
-        "window.__pyglobegl_globe_ready === true", timeout=20000
-    )
+    globe_wait_ready(page_session)
 
     canvas_assert_capture(page_session, "resolution-low", canvas_similarity_threshold)
-    widget.set_globe_curvature_resolution(updated_resolution)
-    page_session.wait_for_timeout(100)
+    globe_render_update(
+        page_session, lambda: widget.set_globe_curvature_resolution(updated_resolution)
+    )
     canvas_assert_capture(page_session, "resolution-high", canvas_similarity_threshold)
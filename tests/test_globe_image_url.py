@@ -21,7 +21,9 @@ if TYPE_CHECKING:
 @pytest.mark.usefixtures("solara_test")
 def test_globe_image_url(
     page_session: Page,
+    globe_wait_ready,
     canvas_assert_capture,
+    canvas_wait_changed,
     globe_earth_texture_url,
     globe_flat_texture_data_url,
 ) -> None:
@@ -40,14 +42,10 @@ def test_globe_image_url(
     widget = GlobeWidget(config=config)
     display(widget)
 
-    page_session.wait_for_function(
-        "document.querySelector('canvas, .jupyter-widgets') !== null", timeout=20000
-    )
-    page_session.wait_for_function(
-        "window.__pyglobegl_globe_ready === true", timeout=20000
-    )
+    globe_wait_ready(page_session)
 
     canvas_assert_capture(page_session, "initial", canvas_similarity_threshold)
-    widget.set_globe_image_url(globe_flat_texture_data_url)
-    page_session.wait_for_timeout(200)
+    canvas_wait_changed(
+        page_session, lambda: widget.set_globe_image_url(globe_flat_texture_data_url)
+    )
     canvas_assert_capture(page_session, "updated", canvas_similarity_threshold)
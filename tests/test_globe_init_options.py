@@ -19,7 +19,7 @@ def _wait_for_init_config(page_session: Page) -> None:
 
 
 @pytest.mark.usefixtures("solara_test")
-def test_renderer_config_applied(page_session: Page) -> None:
+def test_renderer_config_applied(page_session: Page, globe_wait_ready) -> None:
     config = GlobeConfig(
         init=GlobeInitConfig(
             renderer_config={"preserveDrawingBuffer": True, "antialias": False},
@@ -30,10 +30,7 @@ def test_renderer_config_applied(page_session: Page) -> None:
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _wait_for_init_config(page_session)
-    page_session.wait_for_function(
-        "window.__pyglobegl_globe_ready === true", timeout=20000
-    )
+    globe_wait_ready(page_session)
     attrs = page_session.evaluate("() => window.__pyglobegl_renderer_attributes")
     assert attrs is not None
     assert attrs.get("preserveDrawingBuffer") is True
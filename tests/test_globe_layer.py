@@ -21,7 +21,9 @@ if TYPE_CHECKING:
 
 
 @pytest.mark.usefixtures("solara_test")
-def test_globe_layer_graticules(page_session: Page, canvas_assert_capture) -> None:
+def test_globe_layer_graticules(
+    page_session: Page, globe_wait_ready, globe_render_update, canvas_assert_capture
+) -> None:
     canvas_similarity_threshold = 0.97
     initial_show_graticules = False
     updated_show_graticules = True
@@ -36,29 +38,22 @@ def test_globe_layer_graticules(page_session: Page, canvas_assert_capture) -> No
     widget = GlobeWidget(config=config)
     display(widget)
 
-    page_session.wait_for_function(
-        "document.querySelector('canvas, .jupyter-widgets') !== null", timeout=20000
-    )
-    page_session.wait_for_function(
-        "window.__pyglobegl_globe_ready === true", timeout=20000
-    )
-    page_session.wait_for_function(
-        (
-            "window.__pyglobegl_pov && "
-            "Math.abs(window.__pyglobegl_pov.altitude - 1.4) < 0.001"
-        ),
-        timeout=20000,
-    )
+    globe_wait_ready(page_session, pov_altitude=1.4)
 
     canvas_assert_capture(page_session, "graticules-off", canvas_similarity_threshold)
-    widget.set_show_graticules(updated_show_graticules)
-    page_session.wait_for_timeout(100)
+    globe_render_update(
+        page_session, lambda: widget.set_show_graticules(updated_show_graticules)
+    )
     canvas_assert_capture(page_session, "graticules-on", canvas_similarity_threshold)
 
 
 @pytest.mark.usefixtures("solara_test")
 def test_globe_layer_show_globe(
-    page_session: Page, canvas_assert_capture, globe_earth_texture_url
+    page_session: Page,
+    globe_wait_ready,
+    globe_render_update,
+    canvas_assert_capture,
+    globe_earth_texture_url,
 ) -> None:
     canvas_similarity_threshold = 0.99
     config = GlobeConfig(
@@ -77,14 +72,8 @@ def test_globe_layer_show_globe(
     widget = GlobeWidget(config=config)
     display(widget)
 
-    page_session.wait_for_function(
-        "document.querySelector('canvas, .jupyter-widgets') !== null", timeout=20000
-    )
-    page_session.wait_for_function(
-        "window.__pyglobegl_globe_ready === true", timeout=20000
-    )
+    globe_wait_ready(page_session)
 
     canvas_assert_capture(page_session, "on", canvas_similarity_threshold)
-    widget.set_show_globe(False)
-    page_session.wait_for_timeout(200)
+    globe_render_update(page_session, lambda: widget.set_show_globe(False))
     canvas_assert_capture(page_session, "off", canvas_similarity_threshold)
@@ -18,37 +18,37 @@ from pyglobegl import (
 if TYPE_CHECKING:
     from playwright.sync_api import Page
 
+# Frozen literals shared by every run, built once at import.
+_MATERIAL = GlobeMaterialSpec(
+    type="MeshPhongMaterial",
+    params={"color": "#ff00ff", "emissive": "#00ff00", "wireframe": True},
+)
+_UPDATED_MATERIAL = GlobeMaterialSpec(
+    type="MeshBasicMaterial", params={"color": "#00ccff"}
+)
+
 
 @pytest.mark.usefixtures("solara_test")
-def test_globe_material_spec(page_session: Page, canvas_assert_capture) -> None:
+def test_globe_material_spec(
+    page_session: Page, globe_wait_ready, globe_render_update, canvas_assert_capture
+) -> None:
     canvas_similarity_threshold = 0.9
-    material = GlobeMaterialSpec(
-        type="MeshPhongMaterial",
-        params={"color": "#ff00ff", "emissive": "#00ff00", "wireframe": True},
-    )
-    updated_material = GlobeMaterialSpec(
-        type="MeshBasicMaterial", params={"color": "#00ccff"}
-    )
     config = GlobeConfig(
         init=GlobeInitConfig(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
         globe=GlobeLayerConfig(
-            globe_material=material, show_atmosphere=False, show_graticules=False
+            globe_material=_MATERIAL, show_atmosphere=False, show_graticules=False
         ),
     )
     widget = GlobeWidget(config=config)
     display(widget)
 
-    page_session.wait_for_function(
-        "document.querySelector('canvas, .jupyter-widgets') !== null", timeout=20000
-    )
-    page_session.wait_for_function(
-        "window.__pyglobegl_globe_ready === true", timeout=20000
-    )
+    globe_wait_ready(page_session)
 
     canvas_assert_capture(page_session, "initial", canvas_similarity_threshold)
-    widget.set_globe_material(updated_material)
-    page_session.wait_for_timeout(200)
+    globe_render_update(
+        page_session, lambda: widget.set_globe_material(_UPDATED_MATERIAL)
+    )
     canvas_assert_capture(page_session, "updated", canvas_similarity_threshold)
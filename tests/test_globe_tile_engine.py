@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import cache
 import io
 from typing import TYPE_CHECKING
 
@@ -19,43 +20,7 @@ if TYPE_CHECKING:
     from playwright.sync_api import Page
 
 
-def _wait_for_canvas_color(page_session: Page, color: str) -> None:
-    page_session.wait_for_function(
-        """
-        async ({ targetColor }) => {
-          const container = document.querySelector(".scene-container");
-          const canvas = container ? container.querySelector("canvas") : null;
-          if (!canvas) {
-            return false;
-          }
-          const dataUrl = canvas.toDataURL("image/png");
-          if (!dataUrl || dataUrl.length < 2000) {
-            return false;
-          }
-          const img = new Image();
-          img.src = dataUrl;
-          await img.decode();
-          const offscreen = document.createElement("canvas");
-          offscreen.width = img.width;
-          offscreen.height = img.height;
-          const ctx = offscreen.getContext("2d");
-          if (!ctx) {
-            return false;
-          }
-          ctx.drawImage(img, 0, 0);
-          const midX = Math.floor(img.width / 2);
-          const midY = Math.floor(img.height / 2);
-          const data = ctx.getImageData(midX, midY, 1, 1).data;
-          const hex = (value) => value.toString(16).padStart(2, "0");
-          const pixel = `#${hex(data[0])}${hex(data[1])}${hex(data[2])}`;
-          return pixel.toLowerCase() === targetColor.toLowerCase();
-        }
-        """,
-        arg={"targetColor": color},
-        timeout=20000,
-    )
-
-
+@cache
 def _make_tile_bytes(color: tuple[int, int, int]) -> bytes:
     from PIL import Image
 
@@ -73,6 +38,8 @@ def test_globe_tile_engine_cache_reset(
     canvas_compare_images,
     canvas_save_capture,
     globe_tile_server,
+    globe_wait_ready,
+    canvas_wait_center_pixel,
 ) -> None:
     base_url, set_tile_bytes = globe_tile_server
     set_tile_bytes(_make_tile_bytes((255, 0, 0)))
@@ -92,13 +59,8 @@ def test_globe_tile_engine_cache_reset(
     widget = GlobeWidget(config=base_config)
     display(widget)
 
-    page_session.wait_for_function(
-        "document.querySelector('canvas, .jupyter-widgets') !== null", timeout=20000
-    )
-    page_session.wait_for_function(
-        "window.__pyglobegl_globe_ready === true", timeout=20000
-    )
-    _wait_for_canvas_color(page_session, "#ff0000")
+    globe_wait_ready(page_session)
+    canvas_wait_center_pixel(page_session, "#ff0000")
 
     initial_image = canvas_capture(page_session)
     canvas_save_capture(
@@ -113,27 +75,24 @@ def test_globe_tile_engine_cache_reset(
 
     set_tile_bytes(_make_tile_bytes((0, 255, 0)))
 
+    # Cached tiles keep rendering, so the frame must still match the initial one.
     cached_image = canvas_capture(page_session)
-    canvas_save_capture(cached_image, "test_globe_tile_engine_cache_reset-cached", True)
-    cached_ref = canvas_reference_path("test_globe_tile_engine_cache_reset-cached")
-    if not cached_ref.exists():
-        raise AssertionError(
-            f"Reference image missing. Save the capture to {cached_ref} and re-run."
-        )
-    canvas_compare_images(cached_image, cached_ref)
+    cached_matches = canvas_compare_images(cached_image, initial_image) >= 0.99
+    canvas_save_capture(
+        cached_image, "test_globe_tile_engine_cache_reset-cached", cached_matches
+    )
+    assert cached_matches, "Expected cached tiles to keep the initial frame."
 
     widget.globe_tile_engine_clear_cache()
-    disabled_config = base_config.model_dump(
-        by_alias=True, exclude_none=True, exclude_defaults=True
-    )
-    disabled_globe = dict(disabled_config.get("globe", {}))
-    disabled_globe["globeTileEngineUrl"] = None
-    disabled_config["globe"] = disabled_globe
-    widget.config = disabled_config
-    widget.config = base_config.model_dump(
+    base_dump = base_config.model_dump(
         by_alias=True, exclude_none=True, exclude_defaults=True
     )
-    _wait_for_canvas_color(page_session, "#00ff00")
+    widget.config = {
+        **base_dump,
+        "globe": {**base_dump.get("globe", {}), "globeTileEngineUrl": None},
+    }
+    widget.config = base_dump
+    canvas_wait_center_pixel(page_session, "#00ff00")
 
     cleared_image = canvas_capture(page_session)
     canvas_save_capture(
@@ -153,6 +112,8 @@ def test_globe_tile_engine_url_setter(
     canvas_assert_capture,
     globe_flat_texture_data_url,
     globe_tile_server,
+    globe_wait_ready,
+    canvas_wait_center_pixel,
 ) -> None:
     canvas_similarity_threshold = 0.99
     base_url, set_tile_bytes = globe_tile_server
@@ -173,14 +134,9 @@ def test_globe_tile_engine_url_setter(
     widget = GlobeWidget(config=config)
     display(widget)
 
-    page_session.wait_for_function(
-        "document.querySelector('canvas, .jupyter-widgets') !== null", timeout=20000
-    )
-    page_session.wait_for_function(
-        "window.__pyglobegl_globe_ready === true", timeout=20000
-    )
+    globe_wait_ready(page_session)
 
     canvas_assert_capture(page_session, "initial", canvas_similarity_threshold)
     widget.set_globe_tile_engine_url(tile_template)
-    _wait_for_canvas_color(page_session, "#ff0000")
+    canvas_wait_center_pixel(page_session, "#ff0000")
     canvas_assert_capture(page_session, "updated", canvas_similarity_threshold)
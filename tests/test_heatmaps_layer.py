@@ -3,14 +3,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from IPython.display import display
-from pydantic import AnyUrl, TypeAdapter
 import pytest
 
 from pyglobegl import (
     GlobeConfig,
-    GlobeInitConfig,
     GlobeLayerConfig,
-    GlobeLayoutConfig,
     GlobeViewConfig,
     GlobeWidget,
     HeatmapDatum,
@@ -23,32 +20,19 @@ from pyglobegl import (
 if TYPE_CHECKING:
     from playwright.sync_api import Page
 
-_URL_ADAPTER = TypeAdapter(AnyUrl)
 
-
-def _make_config(heatmaps: HeatmapsLayerConfig, globe_texture_url: str) -> GlobeConfig:
-    return GlobeConfig(
-        init=GlobeInitConfig(
-            renderer_config={"preserveDrawingBuffer": True}, animate_in=False
-        ),
-        layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=_URL_ADAPTER.validate_python(globe_texture_url),
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
-        heatmaps=heatmaps,
-        view=GlobeViewConfig(
-            point_of_view=PointOfView(lat=0, lng=0, altitude=1.8), transition_ms=0
-        ),
-    )
-
-
-def _await_globe_ready(page_session: Page) -> None:
-    page_session.wait_for_function(
-        "window.__pyglobegl_globe_ready === true", timeout=20000
+def _make_config(
+    base_config: GlobeConfig, heatmaps: HeatmapsLayerConfig, globe: GlobeLayerConfig
+) -> GlobeConfig:
+    return base_config.model_copy(
+        update={
+            "globe": globe,
+            "heatmaps": heatmaps,
+            "view": GlobeViewConfig(
+                point_of_view=PointOfView(lat=0, lng=0, altitude=1.8), transition_ms=0
+            ),
+        }
     )
-    page_session.wait_for_timeout(1500)
 
 
 def _disable_webgpu(page_session: Page) -> None:
@@ -74,7 +58,13 @@ def _disable_webgpu(page_session: Page) -> None:
 
 @pytest.mark.usefixtures("solara_test")
 def test_heatmaps_accessors(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    canvas_wait_settled,
+    canvas_assert_capture,
+    canvas_wait_changed,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.97
     heatmaps_data = [
@@ -104,26 +94,37 @@ def test_heatmaps_accessors(
     ]
 
     config = _make_config(
+        globe_capture_config,
         HeatmapsLayerConfig(
             heatmaps_data=heatmaps_data, heatmaps_transition_duration=0
         ),
-        globe_flat_texture_data_url,
+        globe_flat_layer,
     )
     _disable_webgpu(page_session)
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
+    # The heatmap KDE lands after the ready flag; wait for the canvas to settle
+    # instead of sleeping past it.
+    globe_wait_ready(page_session)
+    canvas_wait_settled(page_session)
     canvas_assert_capture(page_session, "initial", canvas_similarity_threshold)
 
-    widget.set_heatmaps_data(updated_heatmaps)
-    page_session.wait_for_timeout(1500)
+    canvas_wait_changed(
+        page_session, lambda: widget.set_heatmaps_data(updated_heatmaps)
+    )
     canvas_assert_capture(page_session, "updated", canvas_similarity_threshold)
 
 
 @pytest.mark.usefixtures("solara_test")
 def test_heatmap_bandwidth_update(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    canvas_wait_settled,
+    canvas_assert_capture,
+    canvas_wait_changed,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.97
     heatmap = HeatmapDatum(
@@ -138,22 +139,26 @@ def test_heatmap_bandwidth_update(
     )
 
     config = _make_config(
+        globe_capture_config,
         HeatmapsLayerConfig(heatmaps_data=[heatmap], heatmaps_transition_duration=0),
-        globe_flat_texture_data_url,
+        globe_flat_layer,
     )
     _disable_webgpu(page_session)
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
+    globe_wait_ready(page_session)
+    canvas_wait_settled(page_session)
     canvas_assert_capture(page_session, "bandwidth-0.6", canvas_similarity_threshold)
 
-    widget.update_heatmap(
-        heatmap.id,
-        bandwidth=12.0,
-        color_saturation=4.0,
-        base_altitude=0.2,
-        top_altitude=0.5,
+    canvas_wait_changed(
+        page_session,
+        lambda: widget.update_heatmap(
+            heatmap.id,
+            bandwidth=12.0,
+            color_saturation=4.0,
+            base_altitude=0.2,
+            top_altitude=0.5,
+        ),
     )
-    page_session.wait_for_timeout(1500)
     canvas_assert_capture(page_session, "bandwidth-2.4", canvas_similarity_threshold)
@@ -1,20 +1,18 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from threading import Event
 import time
 from typing import Any, TYPE_CHECKING
 
 from IPython.display import display
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-from pydantic import AnyUrl
 import pytest
 
 from pyglobegl import (
     frontend_python,
     GlobeConfig,
-    GlobeInitConfig,
     GlobeLayerConfig,
-    GlobeLayoutConfig,
     GlobeViewConfig,
     GlobeWidget,
     HexBinLayerConfig,
@@ -27,82 +25,63 @@ if TYPE_CHECKING:
     from playwright.sync_api import Page
 
 
+_DEFAULT_POINTS = (
+    HexBinPointDatum(lat=0, lng=0, weight=6.0),
+    HexBinPointDatum(lat=2, lng=2, weight=4.0),
+    HexBinPointDatum(lat=-2, lng=-2, weight=3.0),
+)
+_VIEW = GlobeViewConfig(
+    point_of_view=PointOfView(lat=0, lng=0, altitude=1.6), transition_ms=0
+)
+
+
 def _hexbin_config(
-    globe_earth_texture_url: AnyUrl,
+    base_config: GlobeConfig,
+    globe: GlobeLayerConfig,
     *,
     merge: bool = False,
     hex_label: str | Any | None = None,
     points_data: list[HexBinPointDatum] | None = None,
 ) -> GlobeConfig:
-    return GlobeConfig(
-        init=GlobeInitConfig(
-            renderer_config={"preserveDrawingBuffer": True}, animate_in=False
-        ),
-        layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
-        hex_bin=HexBinLayerConfig(
-            hex_bin_points_data=points_data
-            if points_data is not None
-            else [
-                HexBinPointDatum(lat=0, lng=0, weight=6.0),
-                HexBinPointDatum(lat=2, lng=2, weight=4.0),
-                HexBinPointDatum(lat=-2, lng=-2, weight=3.0),
-            ],
-            hex_bin_resolution=0,
-            hex_altitude=0.35,
-            hex_top_color="#ffd166",
-            hex_side_color="#26547c",
-            hex_label=hex_label,
-            hex_bin_merge=merge,
-            hex_transition_duration=0,
-        ),
-        view=GlobeViewConfig(
-            point_of_view=PointOfView(lat=0, lng=0, altitude=1.6), transition_ms=0
-        ),
-    )
-
-
-def _wait_for_canvas(page_session: Page) -> None:
-    page_session.wait_for_function(
-        "window.__pyglobegl_globe_ready === true", timeout=20000
-    )
-    page_session.wait_for_function(
-        """
-        () => {
-          const canvas = document.querySelector("canvas");
-          if (!canvas) {
-            return false;
-          }
-          const dataUrl = canvas.toDataURL("image/png");
-          return dataUrl.length > 2000;
+    # Only the hex bin layer varies per test; the shared sub-configs are reused as-is.
+    return base_config.model_copy(
+        update={
+            "globe": globe,
+            "hex_bin": HexBinLayerConfig(
+                hex_bin_points_data=points_data
+                if points_data is not None
+                else list(_DEFAULT_POINTS),
+                hex_bin_resolution=0,
+                hex_altitude=0.35,
+                hex_top_color="#ffd166",
+                hex_side_color="#26547c",
+                hex_label=hex_label,
+                hex_bin_merge=merge,
+                hex_transition_duration=0,
+            ),
+            "view": _VIEW,
         }
-        """,
-        timeout=20000,
     )
 
 
 def _wait_for_tooltip_text(
     page_session: Page, globe_hoverer, expected_text: str, timeout_ms: int = 20000
 ) -> None:
+    # Each attempt hovers explicitly, then waits on a read-only check of the
+    # tooltip text, so the number of pointer moves doesn't track the poll rate.
     deadline = time.monotonic() + timeout_ms / 1000
     while time.monotonic() < deadline:
         globe_hoverer(page_session)
         try:
             page_session.wait_for_function(
-                f"""
-                () => {{
+                """
+                (expected) => {
                   const tooltip = document.querySelector(".float-tooltip-kap");
-                  if (!tooltip) {{
-                    return false;
-                  }}
-                  const html = tooltip.innerHTML || "";
-                  return html.includes({expected_text!r});
-                }}
+                  return (tooltip?.innerHTML || "").includes(expected);
+                }
                 """,
+                arg=expected_text,
+                polling="raf",
                 timeout=1000,
             )
             return
@@ -126,91 +105,82 @@ def _hex_label_fn_using_get(hexbin):
 
 
 @pytest.mark.usefixtures("solara_test")
-def test_on_hexbin_click_callback(
-    page_session: Page, globe_clicker, globe_earth_texture_url
-) -> None:
-    click_event = Event()
-    payload: dict[str, Any] = {}
-
-    def _on_click(hexbin: dict[str, Any], coords: dict[str, float]) -> None:
-        payload["hexbin"] = hexbin
-        payload["coords"] = coords
-        click_event.set()
-
-    widget = GlobeWidget(config=_hexbin_config(globe_earth_texture_url))
-    widget.on_hexbin_click(_on_click)
-    display(widget)
-
-    _wait_for_canvas(page_session)
-    globe_clicker(page_session, "left")
-
-    assert click_event.wait(5), "Expected hexbin click callback to fire."
-    assert isinstance(payload.get("hexbin"), dict)
-    assert isinstance(payload.get("coords"), dict)
-
-
-@pytest.mark.usefixtures("solara_test")
-def test_on_hexbin_right_click_callback(
-    page_session: Page, globe_clicker, globe_earth_texture_url
+def test_on_hexbin_pointer_callbacks(
+    page_session: Page,
+    globe_clicker,
+    globe_hoverer,
+    globe_capture_config,
+    globe_earth_layer,
+    canvas_wait_center_pixel,
 ) -> None:
-    click_event = Event()
-    payload: dict[str, Any] = {}
-
-    def _on_click(hexbin: dict[str, Any], coords: dict[str, float]) -> None:
-        payload["hexbin"] = hexbin
-        payload["coords"] = coords
-        click_event.set()
+    # Hover, click and right-click handlers share one widget so the page boots once.
+    events = {"left": Event(), "right": Event(), "hover": Event()}
+    payloads: dict[str, dict[str, Any]] = {"left": {}, "right": {}, "hover": {}}
 
-    widget = GlobeWidget(config=_hexbin_config(globe_earth_texture_url))
-    widget.on_hexbin_right_click(_on_click)
-    display(widget)
-
-    _wait_for_canvas(page_session)
-    globe_clicker(page_session, "right")
-
-    assert click_event.wait(5), "Expected hexbin right-click callback to fire."
-    assert isinstance(payload.get("hexbin"), dict)
-    assert isinstance(payload.get("coords"), dict)
+    def _click_handler(
+        button: str,
+    ) -> Callable[[dict[str, Any], dict[str, float]], None]:
+        def _on_click(hexbin: dict[str, Any], coords: dict[str, float]) -> None:
+            payloads[button]["hexbin"] = hexbin
+            payloads[button]["coords"] = coords
+            events[button].set()
 
-
-@pytest.mark.usefixtures("solara_test")
-def test_on_hexbin_hover_callback(
-    page_session: Page, globe_hoverer, globe_earth_texture_url
-) -> None:
-    hover_event = Event()
-    payload: dict[str, Any] = {}
+        return _on_click
 
     def _on_hover(hexbin: dict[str, Any] | None, prev: dict[str, Any] | None) -> None:
-        payload["hexbin"] = hexbin
-        payload["prev"] = prev
-        hover_event.set()
+        payloads["hover"]["hexbin"] = hexbin
+        payloads["hover"]["prev"] = prev
+        events["hover"].set()
 
-    widget = GlobeWidget(config=_hexbin_config(globe_earth_texture_url))
+    widget = GlobeWidget(config=_hexbin_config(globe_capture_config, globe_earth_layer))
+    widget.on_hexbin_click(_click_handler("left"))
+    widget.on_hexbin_right_click(_click_handler("right"))
     widget.on_hexbin_hover(_on_hover)
     display(widget)
 
-    _wait_for_canvas(page_session)
-    globe_hoverer(page_session)
+    canvas_wait_center_pixel(page_session)
 
-    assert hover_event.wait(5), "Expected hexbin hover callback to fire."
-    assert payload.get("hexbin") is None or isinstance(payload.get("hexbin"), dict)
-    assert payload.get("prev") is None or isinstance(payload.get("prev"), dict)
+    # Hover first: globe_clicker sends its own pointermove, which would otherwise
+    # fire the hover handler before the hover step runs.
+    globe_hoverer(page_session)
+    assert events["hover"].wait(5), "Expected hexbin hover callback to fire."
+    hover = payloads["hover"]
+    assert isinstance(hover.get("hexbin"), dict)
+    assert hover.get("prev") is None
+
+    for button, other in (("left", "right"), ("right", "left")):
+        events[other].clear()
+        globe_clicker(page_session, button)
+        assert events[button].wait(5), (
+            f"Expected hexbin {button}-click callback to fire."
+        )
+        assert isinstance(payloads[button].get("hexbin"), dict)
+        assert isinstance(payloads[button].get("coords"), dict)
+        assert not events[other].wait(0.5), (
+            f"A {button}-click should not fire the hexbin {other}-click callback."
+        )
 
 
 @pytest.mark.usefixtures("solara_test")
 def test_hexbin_merge_disables_click(
-    page_session: Page, globe_clicker, globe_earth_texture_url
+    page_session: Page,
+    globe_clicker,
+    globe_capture_config,
+    globe_earth_layer,
+    canvas_wait_center_pixel,
 ) -> None:
     click_event = Event()
 
     def _on_click(_: dict[str, Any], __: dict[str, float]) -> None:
         click_event.set()
 
-    widget = GlobeWidget(config=_hexbin_config(globe_earth_texture_url, merge=True))
+    widget = GlobeWidget(
+        config=_hexbin_config(globe_capture_config, globe_earth_layer, merge=True)
+    )
     widget.on_hexbin_click(_on_click)
     display(widget)
 
-    _wait_for_canvas(page_session)
+    canvas_wait_center_pixel(page_session)
     globe_clicker(page_session, "left")
 
     assert not click_event.wait(1.5), "Hexbin click should not fire when merged."
@@ -218,27 +188,37 @@ def test_hexbin_merge_disables_click(
 
 @pytest.mark.usefixtures("solara_test")
 def test_hexbin_label_frontend_python_tooltip_renders(
-    page_session: Page, globe_hoverer, globe_earth_texture_url
+    page_session: Page,
+    globe_hoverer,
+    globe_capture_config,
+    globe_earth_layer,
+    canvas_wait_center_pixel,
 ) -> None:
     widget = GlobeWidget(
-        config=_hexbin_config(globe_earth_texture_url, hex_label=_hex_label_fn)
+        config=_hexbin_config(
+            globe_capture_config, globe_earth_layer, hex_label=_hex_label_fn
+        )
     )
     display(widget)
 
-    _wait_for_canvas(page_session)
+    canvas_wait_center_pixel(page_session)
     _wait_for_tooltip_text(page_session, globe_hoverer, "HEX TEST")
 
 
 @pytest.mark.usefixtures("solara_test")
 def test_hexbin_label_frontend_python_tooltip_accepts_dict_get(
-    page_session: Page, globe_hoverer, globe_earth_texture_url
+    page_session: Page,
+    globe_hoverer,
+    globe_capture_config,
+    globe_earth_layer,
+    canvas_wait_center_pixel,
 ) -> None:
     widget = GlobeWidget(
         config=_hexbin_config(
-            globe_earth_texture_url, hex_label=_hex_label_fn_using_get
+            globe_capture_config, globe_earth_layer, hex_label=_hex_label_fn_using_get
         )
     )
     display(widget)
 
-    _wait_for_canvas(page_session)
+    canvas_wait_center_pixel(page_session)
     _wait_for_tooltip_text(page_session, globe_hoverer, "HEX GET")
@@ -3,16 +3,13 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from IPython.display import display
-from pydantic import AnyUrl, TypeAdapter
 from pydantic_extra_types.color import Color
 import pytest
 
 from pyglobegl import (
     frontend_python,
     GlobeConfig,
-    GlobeInitConfig,
     GlobeLayerConfig,
-    GlobeLayoutConfig,
     GlobeViewConfig,
     GlobeWidget,
     HexBinLayerConfig,
@@ -24,7 +21,62 @@ from pyglobegl import (
 if TYPE_CHECKING:
     from playwright.sync_api import Page
 
-_URL_ADAPTER = TypeAdapter(AnyUrl)
+
+_ACCESSOR_POINTS = (
+    HexBinPointDatum(lat=8, lng=0, weight=10.0),
+    HexBinPointDatum(lat=10, lng=2, weight=9.0),
+    HexBinPointDatum(lat=2, lng=22, weight=7.0),
+    HexBinPointDatum(lat=4, lng=24, weight=6.0),
+    HexBinPointDatum(lat=-10, lng=-20, weight=4.5),
+    HexBinPointDatum(lat=-8, lng=-18, weight=4.0),
+)
+_UPDATED_ACCESSOR_POINTS = (
+    HexBinPointDatum(lat=14, lng=-6, weight=11.0),
+    HexBinPointDatum(lat=16, lng=-4, weight=10.0),
+    HexBinPointDatum(lat=-2, lng=30, weight=8.0),
+    HexBinPointDatum(lat=0, lng=32, weight=7.0),
+    HexBinPointDatum(lat=-16, lng=-28, weight=6.0),
+    HexBinPointDatum(lat=-14, lng=-26, weight=5.5),
+)
+_CONFIG_UPDATE_POINTS = (
+    HexBinPointDatum(lat=10, lng=0, weight=12.0),
+    HexBinPointDatum(lat=12, lng=2, weight=11.0),
+    HexBinPointDatum(lat=0, lng=24, weight=8.0),
+    HexBinPointDatum(lat=2, lng=26, weight=7.0),
+    HexBinPointDatum(lat=-12, lng=-22, weight=5.0),
+    HexBinPointDatum(lat=-10, lng=-20, weight=4.0),
+)
+
+# Three front-facing, spatially separated clusters to exercise all branches:
+# - high (>18), medium (>10), and low (<=10) aggregate weights.
+_FRONTEND_PYTHON_POINTS = (
+    HexBinPointDatum(lat=8, lng=0, weight=11.0),
+    HexBinPointDatum(lat=10, lng=2, weight=10.0),
+    HexBinPointDatum(lat=2, lng=24, weight=6.0),
+    HexBinPointDatum(lat=4, lng=26, weight=5.5),
+    HexBinPointDatum(lat=-10, lng=-24, weight=2.0),
+    HexBinPointDatum(lat=-8, lng=-22, weight=2.0),
+)
+_POINT_ACCESSOR_POINTS = (
+    HexBinPointDatum(lat=14, lng=-12, weight=1.0),
+    HexBinPointDatum(lat=13, lng=-8, weight=1.0),
+    HexBinPointDatum(lat=10, lng=-4, weight=1.0),
+    HexBinPointDatum(lat=7, lng=0, weight=1.0),
+    HexBinPointDatum(lat=4, lng=4, weight=1.0),
+    HexBinPointDatum(lat=1, lng=8, weight=1.0),
+    HexBinPointDatum(lat=-2, lng=12, weight=1.0),
+    HexBinPointDatum(lat=-5, lng=16, weight=1.0),
+)
+_CURVATURE_POINTS = (
+    HexBinPointDatum(lat=3.0, lng=-2.0, weight=14.0),
+    HexBinPointDatum(lat=2.5, lng=-1.5, weight=14.0),
+    HexBinPointDatum(lat=2.0, lng=-1.0, weight=14.0),
+    HexBinPointDatum(lat=1.5, lng=-0.5, weight=14.0),
+    HexBinPointDatum(lat=1.0, lng=0.0, weight=14.0),
+    HexBinPointDatum(lat=0.5, lng=0.5, weight=14.0),
+    HexBinPointDatum(lat=0.0, lng=1.0, weight=14.0),
+    HexBinPointDatum(lat=-0.5, lng=1.5, weight=14.0),
+)
 
 
 @frontend_python
@@ -77,56 +129,34 @@ def _hex_altitude_fn_alt(hexbin):
     return float(hexbin["sumWeight"]) * 0.05
 
 
-def _make_config(hexbin: HexBinLayerConfig, globe_texture_url: str) -> GlobeConfig:
-    return GlobeConfig(
-        init=GlobeInitConfig(
-            renderer_config={"preserveDrawingBuffer": True}, animate_in=False
-        ),
-        layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=_URL_ADAPTER.validate_python(globe_texture_url),
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
-        hex_bin=hexbin,
-        view=GlobeViewConfig(
-            point_of_view=PointOfView(lat=0, lng=0, altitude=1.6), transition_ms=0
-        ),
-    )
-
-
-def _await_globe_ready(page_session: Page) -> None:
-    page_session.wait_for_function(
-        "window.__pyglobegl_globe_ready === true", timeout=20000
+def _make_config(
+    base_config: GlobeConfig, hexbin: HexBinLayerConfig, globe: GlobeLayerConfig
+) -> GlobeConfig:
+    return base_config.model_copy(
+        update={
+            "globe": globe,
+            "hex_bin": hexbin,
+            "view": GlobeViewConfig(
+                point_of_view=PointOfView(lat=0, lng=0, altitude=1.6), transition_ms=0
+            ),
+        }
     )
-    page_session.wait_for_timeout(250)
 
 
 @pytest.mark.usefixtures("solara_test")
 def test_hexbin_accessors(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    globe_render_update,
+    canvas_assert_capture,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.97
-    points = [
-        HexBinPointDatum(lat=8, lng=0, weight=10.0),
-        HexBinPointDatum(lat=10, lng=2, weight=9.0),
-        HexBinPointDatum(lat=2, lng=22, weight=7.0),
-        HexBinPointDatum(lat=4, lng=24, weight=6.0),
-        HexBinPointDatum(lat=-10, lng=-20, weight=4.5),
-        HexBinPointDatum(lat=-8, lng=-18, weight=4.0),
-    ]
-    updated_points = [
-        HexBinPointDatum(lat=14, lng=-6, weight=11.0),
-        HexBinPointDatum(lat=16, lng=-4, weight=10.0),
-        HexBinPointDatum(lat=-2, lng=30, weight=8.0),
-        HexBinPointDatum(lat=0, lng=32, weight=7.0),
-        HexBinPointDatum(lat=-16, lng=-28, weight=6.0),
-        HexBinPointDatum(lat=-14, lng=-26, weight=5.5),
-    ]
-
     config = _make_config(
+        globe_capture_config,
         HexBinLayerConfig(
-            hex_bin_points_data=points,
+            hex_bin_points_data=list(_ACCESSOR_POINTS),
             hex_bin_resolution=1,
             hex_margin=0.03,
             hex_top_color="#ffe066",
@@ -134,7 +164,7 @@ def test_hexbin_accessors(
             hex_altitude=0.18,
             hex_transition_duration=0,
         ),
-        globe_flat_texture_data_url,
+        globe_flat_layer,
     )
     config = config.model_copy(
         update={
@@ -146,31 +176,29 @@ def test_hexbin_accessors(
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
+    globe_wait_ready(page_session)
     canvas_assert_capture(page_session, "initial", canvas_similarity_threshold)
 
-    widget.set_hex_bin_points_data(updated_points)
-    page_session.wait_for_timeout(100)
+    globe_render_update(
+        page_session, lambda: widget.set_hex_bin_points_data(_UPDATED_ACCESSOR_POINTS)
+    )
     canvas_assert_capture(page_session, "updated", canvas_similarity_threshold)
 
 
 @pytest.mark.usefixtures("solara_test")
 def test_hexbin_config_updates(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    globe_render_update,
+    canvas_assert_capture,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.96
-    points = [
-        HexBinPointDatum(lat=10, lng=0, weight=12.0),
-        HexBinPointDatum(lat=12, lng=2, weight=11.0),
-        HexBinPointDatum(lat=0, lng=24, weight=8.0),
-        HexBinPointDatum(lat=2, lng=26, weight=7.0),
-        HexBinPointDatum(lat=-12, lng=-22, weight=5.0),
-        HexBinPointDatum(lat=-10, lng=-20, weight=4.0),
-    ]
-
     config = _make_config(
+        globe_capture_config,
         HexBinLayerConfig(
-            hex_bin_points_data=points,
+            hex_bin_points_data=list(_CONFIG_UPDATE_POINTS),
             hex_bin_resolution=1,
             hex_margin=0.03,
             hex_top_color="#ffcc00",
@@ -178,7 +206,7 @@ def test_hexbin_config_updates(
             hex_altitude=0.16,
             hex_transition_duration=0,
         ),
-        globe_flat_texture_data_url,
+        globe_flat_layer,
     )
     config = config.model_copy(
         update={
@@ -190,43 +218,40 @@ def test_hexbin_config_updates(
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
+    globe_wait_ready(page_session)
     canvas_assert_capture(page_session, "initial", canvas_similarity_threshold)
 
-    widget.set_hex_bin_resolution(1)
-    widget.set_hex_margin(0.02)
-    widget.set_hex_top_color(Color("#00ff99"))
-    widget.set_hex_side_color(Color("#0044ff"))
-    widget.set_hex_altitude(0.18)
-    widget.set_hex_bin_merge(True)
+    def _update() -> None:
+        widget.set_hex_bin_resolution(1)
+        widget.set_hex_margin(0.02)
+        widget.set_hex_top_color(Color("#00ff99"))
+        widget.set_hex_side_color(Color("#0044ff"))
+        widget.set_hex_altitude(0.18)
+        widget.set_hex_bin_merge(True)
+
+    globe_render_update(page_session, _update, updates=6)
     assert widget.get_hex_margin() == pytest.approx(0.02)
     assert widget.get_hex_top_color() in {"#00ff99", "#0f9"}
     assert widget.get_hex_side_color() in {"#0044ff", "#04f"}
     assert widget.get_hex_altitude() == pytest.approx(0.18)
     assert widget.get_hex_bin_merge() is True
-    page_session.wait_for_timeout(200)
     canvas_assert_capture(page_session, "updated", canvas_similarity_threshold)
 
 
 @pytest.mark.usefixtures("solara_test")
 def test_hexbin_frontend_python_accessors(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    globe_render_update,
+    canvas_assert_capture,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.96
-    # Three front-facing, spatially separated clusters to exercise all branches:
-    # - high (>18), medium (>10), and low (<=10) aggregate weights.
-    points = [
-        HexBinPointDatum(lat=8, lng=0, weight=11.0),
-        HexBinPointDatum(lat=10, lng=2, weight=10.0),
-        HexBinPointDatum(lat=2, lng=24, weight=6.0),
-        HexBinPointDatum(lat=4, lng=26, weight=5.5),
-        HexBinPointDatum(lat=-10, lng=-24, weight=2.0),
-        HexBinPointDatum(lat=-8, lng=-22, weight=2.0),
-    ]
-
     config = _make_config(
+        globe_capture_config,
         HexBinLayerConfig(
-            hex_bin_points_data=points,
+            hex_bin_points_data=list(_FRONTEND_PYTHON_POINTS),
             hex_bin_resolution=2,
             hex_margin=0.05,
             hex_top_color=_hex_top_color_fn,
@@ -234,7 +259,7 @@ def test_hexbin_frontend_python_accessors(
             hex_altitude=_hex_altitude_fn,
             hex_transition_duration=0,
         ),
-        globe_flat_texture_data_url,
+        globe_flat_layer,
     )
     config = config.model_copy(
         update={
@@ -246,18 +271,20 @@ def test_hexbin_frontend_python_accessors(
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
+    globe_wait_ready(page_session)
     canvas_assert_capture(
         page_session, "frontend-python-initial", canvas_similarity_threshold
     )
 
-    widget.set_hex_top_color(_hex_top_color_fn_alt)
-    widget.set_hex_side_color(_hex_side_color_fn_alt)
-    widget.set_hex_altitude(_hex_altitude_fn_alt)
+    def _update() -> None:
+        widget.set_hex_top_color(_hex_top_color_fn_alt)
+        widget.set_hex_side_color(_hex_side_color_fn_alt)
+        widget.set_hex_altitude(_hex_altitude_fn_alt)
+
+    globe_render_update(page_session, _update, updates=3)
     assert widget.get_hex_top_color() is not None
     assert widget.get_hex_side_color() is not None
     assert widget.get_hex_altitude() is not None
-    page_session.wait_for_timeout(120)
     canvas_assert_capture(
         page_session, "frontend-python-updated", canvas_similarity_threshold
     )
@@ -265,23 +292,18 @@ def test_hexbin_frontend_python_accessors(
 
 @pytest.mark.usefixtures("solara_test")
 def test_hexbin_frontend_python_point_accessors(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    globe_render_update,
+    canvas_assert_capture,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.96
-    points = [
-        HexBinPointDatum(lat=14, lng=-12, weight=1.0),
-        HexBinPointDatum(lat=13, lng=-8, weight=1.0),
-        HexBinPointDatum(lat=10, lng=-4, weight=1.0),
-        HexBinPointDatum(lat=7, lng=0, weight=1.0),
-        HexBinPointDatum(lat=4, lng=4, weight=1.0),
-        HexBinPointDatum(lat=1, lng=8, weight=1.0),
-        HexBinPointDatum(lat=-2, lng=12, weight=1.0),
-        HexBinPointDatum(lat=-5, lng=16, weight=1.0),
-    ]
-
     config = _make_config(
+        globe_capture_config,
         HexBinLayerConfig(
-            hex_bin_points_data=points,
+            hex_bin_points_data=list(_POINT_ACCESSOR_POINTS),
             hex_bin_resolution=1,
             hex_bin_point_weight=6.0,
             hex_margin=0.02,
@@ -290,7 +312,7 @@ def test_hexbin_frontend_python_point_accessors(
             hex_altitude=0.24,
             hex_transition_duration=0,
         ),
-        globe_flat_texture_data_url,
+        globe_flat_layer,
     )
     config = config.model_copy(
         update={
@@ -302,19 +324,21 @@ def test_hexbin_frontend_python_point_accessors(
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
+    globe_wait_ready(page_session)
     canvas_assert_capture(
         page_session, "point-accessors-initial", canvas_similarity_threshold
     )
 
-    widget.set_hex_bin_point_weight(0.2)
-    widget.set_hex_margin(0.34)
-    widget.set_hex_top_color(Color("#00e5ff"))
-    widget.set_hex_side_color(Color("#003049"))
-    widget.set_hex_altitude(0.05)
+    def _update() -> None:
+        widget.set_hex_bin_point_weight(0.2)
+        widget.set_hex_margin(0.34)
+        widget.set_hex_top_color(Color("#00e5ff"))
+        widget.set_hex_side_color(Color("#003049"))
+        widget.set_hex_altitude(0.05)
+
+    globe_render_update(page_session, _update, updates=5)
     assert widget.get_hex_bin_point_weight() == pytest.approx(0.2)
     assert widget.get_hex_margin() == pytest.approx(0.34)
-    page_session.wait_for_timeout(150)
     canvas_assert_capture(
         page_session, "point-accessors-updated", canvas_similarity_threshold
     )
@@ -322,23 +346,18 @@ def test_hexbin_frontend_python_point_accessors(
 
 @pytest.mark.usefixtures("solara_test")
 def test_hexbin_top_curvature_resolution(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    globe_render_update,
+    canvas_assert_capture,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.96
-    points = [
-        HexBinPointDatum(lat=3.0, lng=-2.0, weight=14.0),
-        HexBinPointDatum(lat=2.5, lng=-1.5, weight=14.0),
-        HexBinPointDatum(lat=2.0, lng=-1.0, weight=14.0),
-        HexBinPointDatum(lat=1.5, lng=-0.5, weight=14.0),
-        HexBinPointDatum(lat=1.0, lng=0.0, weight=14.0),
-        HexBinPointDatum(lat=0.5, lng=0.5, weight=14.0),
-        HexBinPointDatum(lat=0.0, lng=1.0, weight=14.0),
-        HexBinPointDatum(lat=-0.5, lng=1.5, weight=14.0),
-    ]
-
     config = _make_config(
+        globe_capture_config,
         HexBinLayerConfig(
-            hex_bin_points_data=points,
+            hex_bin_points_data=list(_CURVATURE_POINTS),
             hex_bin_resolution=0,
             hex_margin=0.01,
             hex_top_color="#ff4d6d",
@@ -347,7 +366,7 @@ def test_hexbin_top_curvature_resolution(
             hex_top_curvature_resolution=180.0,
             hex_transition_duration=0,
         ),
-        globe_flat_texture_data_url,
+        globe_flat_layer,
     )
     config = config.model_copy(
         update={
@@ -359,14 +378,15 @@ def test_hexbin_top_curvature_resolution(
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
+    globe_wait_ready(page_session)
     canvas_assert_capture(
         page_session, "curvature-initial", canvas_similarity_threshold
     )
 
-    widget.set_hex_top_curvature_resolution(0.25)
+    globe_render_update(
+        page_session, lambda: widget.set_hex_top_curvature_resolution(0.25)
+    )
     assert widget.get_hex_top_curvature_resolution() == pytest.approx(0.25)
-    page_session.wait_for_timeout(150)
     canvas_assert_capture(
         page_session, "curvature-updated", canvas_similarity_threshold
     )
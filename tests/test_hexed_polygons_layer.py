@@ -5,14 +5,11 @@ from typing import TYPE_CHECKING
 from geojson_pydantic import Polygon
 from geojson_pydantic.types import Position2D
 from IPython.display import display
-from pydantic import AnyUrl, TypeAdapter
 import pytest
 
 from pyglobegl import (
     GlobeConfig,
-    GlobeInitConfig,
     GlobeLayerConfig,
-    GlobeLayoutConfig,
     GlobeViewConfig,
     GlobeWidget,
     HexedPolygonsLayerConfig,
@@ -24,8 +21,6 @@ from pyglobegl import (
 if TYPE_CHECKING:
     from playwright.sync_api import Page
 
-_URL_ADAPTER = TypeAdapter(AnyUrl)
-
 
 def _make_polygon() -> Polygon:
     ring = [
@@ -39,35 +34,27 @@ def _make_polygon() -> Polygon:
 
 
 def _make_config(
-    hexed: HexedPolygonsLayerConfig, globe_texture_url: str
+    base_config: GlobeConfig, hexed: HexedPolygonsLayerConfig, globe: GlobeLayerConfig
 ) -> GlobeConfig:
-    return GlobeConfig(
-        init=GlobeInitConfig(
-            renderer_config={"preserveDrawingBuffer": True}, animate_in=False
-        ),
-        layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=_URL_ADAPTER.validate_python(globe_texture_url),
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
-        hexed_polygons=hexed,
-        view=GlobeViewConfig(
-            point_of_view=PointOfView(lat=0, lng=0, altitude=1.6), transition_ms=0
-        ),
-    )
-
-
-def _await_globe_ready(page_session: Page) -> None:
-    page_session.wait_for_function(
-        "window.__pyglobegl_globe_ready === true", timeout=20000
+    return base_config.model_copy(
+        update={
+            "globe": globe,
+            "hexed_polygons": hexed,
+            "view": GlobeViewConfig(
+                point_of_view=PointOfView(lat=0, lng=0, altitude=1.6), transition_ms=0
+            ),
+        }
     )
-    page_session.wait_for_timeout(250)
 
 
 @pytest.mark.usefixtures("solara_test")
 def test_hexed_polygons_accessors(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    globe_render_update,
+    canvas_assert_capture,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.97
     polygon = _make_polygon()
@@ -97,17 +84,17 @@ def test_hexed_polygons_accessors(
     ]
 
     config = _make_config(
+        globe_capture_config,
         HexedPolygonsLayerConfig(
             hex_polygons_data=hexed, hex_polygons_transition_duration=0
         ),
-        globe_flat_texture_data_url,
+        globe_flat_layer,
     )
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
+    globe_wait_ready(page_session)
     canvas_assert_capture(page_session, "initial", canvas_similarity_threshold)
 
-    widget.set_hex_polygons_data(updated)
-    page_session.wait_for_timeout(100)
+    globe_render_update(page_session, lambda: widget.set_hex_polygons_data(updated))
     canvas_assert_capture(page_session, "updated", canvas_similarity_threshold)
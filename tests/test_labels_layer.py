@@ -5,14 +5,11 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from IPython.display import display
-from pydantic import AnyUrl, TypeAdapter
 import pytest
 
 from pyglobegl import (
     GlobeConfig,
-    GlobeInitConfig,
     GlobeLayerConfig,
-    GlobeLayoutConfig,
     GlobeViewConfig,
     GlobeWidget,
     LabelDatum,
@@ -24,43 +21,38 @@ from pyglobegl import (
 if TYPE_CHECKING:
     from playwright.sync_api import Page
 
-_URL_ADAPTER = TypeAdapter(AnyUrl)
-_FONT_PATH = (
-    Path(__file__).resolve().parent
-    / "assets"
-    / "fonts"
-    / "optimer_regular.typeface.json"
+_TYPEFACE = json.loads(
+    (
+        Path(__file__).resolve().parent
+        / "assets"
+        / "fonts"
+        / "optimer_regular.typeface.json"
+    ).read_text(encoding="utf-8")
 )
 
 
-def _make_config(labels: LabelsLayerConfig, globe_texture_url: str) -> GlobeConfig:
-    return GlobeConfig(
-        init=GlobeInitConfig(
-            renderer_config={"preserveDrawingBuffer": True}, animate_in=False
-        ),
-        layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=_URL_ADAPTER.validate_python(globe_texture_url),
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
-        labels=labels,
-        view=GlobeViewConfig(
-            point_of_view=PointOfView(lat=0, lng=0, altitude=1.8), transition_ms=0
-        ),
+def _make_config(
+    base_config: GlobeConfig, labels: LabelsLayerConfig, globe: GlobeLayerConfig
+) -> GlobeConfig:
+    return base_config.model_copy(
+        update={
+            "globe": globe,
+            "labels": labels,
+            "view": GlobeViewConfig(
+                point_of_view=PointOfView(lat=0, lng=0, altitude=1.8), transition_ms=0
+            ),
+        }
     )
 
 
-def _await_globe_ready(page_session: Page) -> None:
-    page_session.wait_for_function(
-        "window.__pyglobegl_globe_ready === true", timeout=20000
-    )
-    page_session.wait_for_timeout(250)
-
-
 @pytest.mark.usefixtures("solara_test")
 def test_labels_accessors(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    globe_render_update,
+    canvas_assert_capture,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.96
     labels = [
@@ -114,17 +106,20 @@ def test_labels_accessors(
     ]
 
     config = _make_config(
+        globe_capture_config,
         LabelsLayerConfig(labels_data=labels, labels_transition_duration=0),
-        globe_flat_texture_data_url,
+        globe_flat_layer,
     )
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
+    globe_wait_ready(page_session)
     canvas_assert_capture(page_session, "initial", canvas_similarity_threshold)
 
-    widget.set_label_resolution(8)
-    widget.set_label_type_face(json.loads(_FONT_PATH.read_text(encoding="utf-8")))
-    widget.set_labels_data(updated)
-    page_session.wait_for_timeout(100)
+    def _update() -> None:
+        widget.set_label_resolution(8)
+        widget.set_label_type_face(_TYPEFACE)
+        widget.set_labels_data(updated)
+
+    globe_render_update(page_session, _update, updates=3)
     canvas_assert_capture(page_session, "updated", canvas_similarity_threshold)
@@ -5,13 +5,7 @@ from typing import TYPE_CHECKING
 from IPython.display import display
 import pytest
 
-from pyglobegl import (
-    GlobeConfig,
-    GlobeInitConfig,
-    GlobeLayerConfig,
-    GlobeLayoutConfig,
-    GlobeWidget,
-)
+from pyglobegl import GlobeConfig, GlobeInitConfig, GlobeLayoutConfig, GlobeWidget
 
 
 if TYPE_CHECKING:
@@ -26,7 +20,7 @@ def test_layout_background_image(
     canvas_reference_path,
     canvas_compare_images,
     canvas_save_capture,
-    globe_earth_texture_url,
+    globe_earth_layer,
     globe_background_night_sky_data_url,
 ) -> None:
     canvas_similarity_threshold = 0.99
@@ -40,11 +34,7 @@ def test_layout_background_image(
             background_color="#ff00ff",
             background_image_url=globe_background_night_sky_data_url,
         ),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
     )
     widget = GlobeWidget(config=config)
     display(widget)
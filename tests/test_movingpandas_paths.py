@@ -11,16 +11,15 @@ def test_paths_from_mpd_trajectory() -> None:
     import geopandas as gpd
     import movingpandas as mpd
     import pandas as pd
-    from shapely.geometry import Point
 
-    df = pd.DataFrame(
-        [
-            {"geometry": Point(0, 0), "t": pd.Timestamp("2023-01-01 12:00:00")},
-            {"geometry": Point(1, 1), "t": pd.Timestamp("2023-01-01 12:01:00")},
-            {"geometry": Point(2, 0), "t": pd.Timestamp("2023-01-01 12:02:00")},
-        ]
-    ).set_index("t")
-    gdf = gpd.GeoDataFrame(df, crs="EPSG:4326")
+    gdf = gpd.GeoDataFrame(
+        geometry=gpd.GeoSeries.from_xy([0, 1, 2], [0, 1, 0]).values,
+        index=pd.DatetimeIndex(
+            ["2023-01-01 12:00:00", "2023-01-01 12:01:00", "2023-01-01 12:02:00"],
+            name="t",
+        ),
+        crs="EPSG:4326",
+    )
     traj = mpd.Trajectory(gdf, 1)
 
     traj.color = "#0000ff"  # type: ignore[attr-defined]
@@ -38,37 +37,21 @@ def test_paths_from_mpd_trajectory_collection() -> None:
     import geopandas as gpd
     import movingpandas as mpd
     import pandas as pd
-    from shapely.geometry import Point
 
-    df = pd.DataFrame(
-        [
-            {
-                "geometry": Point(0, 0),
-                "t": pd.Timestamp("2023-01-01 12:00:00"),
-                "id": 1,
-                "group": "A",
-            },
-            {
-                "geometry": Point(1, 1),
-                "t": pd.Timestamp("2023-01-01 12:01:00"),
-                "id": 1,
-                "group": "A",
-            },
-            {
-                "geometry": Point(10, 10),
-                "t": pd.Timestamp("2023-01-01 12:00:00"),
-                "id": 2,
-                "group": "B",
-            },
-            {
-                "geometry": Point(11, 11),
-                "t": pd.Timestamp("2023-01-01 12:01:00"),
-                "id": 2,
-                "group": "B",
-            },
-        ]
-    ).set_index("t")
-    gdf = gpd.GeoDataFrame(df, crs="EPSG:4326")
+    gdf = gpd.GeoDataFrame(
+        {"id": [1, 1, 2, 2], "group": ["A", "A", "B", "B"]},
+        geometry=gpd.GeoSeries.from_xy([0, 1, 10, 11], [0, 1, 10, 11]).values,
+        index=pd.DatetimeIndex(
+            [
+                "2023-01-01 12:00:00",
+                "2023-01-01 12:01:00",
+                "2023-01-01 12:00:00",
+                "2023-01-01 12:01:00",
+            ],
+            name="t",
+        ),
+        crs="EPSG:4326",
+    )
     tc = mpd.TrajectoryCollection(gdf, "id")
 
     paths = paths_from_mpd(tc, include_columns=["group"])
@@ -1,17 +1,15 @@
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING
 
 from IPython.display import display
 from PIL import Image, ImageDraw
-from pydantic import AnyUrl, TypeAdapter
 import pytest
 
 from pyglobegl import (
     GlobeConfig,
-    GlobeInitConfig,
     GlobeLayerConfig,
-    GlobeLayoutConfig,
     GlobeViewConfig,
     GlobeWidget,
     ParticleDatum,
@@ -25,36 +23,22 @@ from pyglobegl.images import image_to_data_url
 if TYPE_CHECKING:
     from playwright.sync_api import Page
 
-_URL_ADAPTER = TypeAdapter(AnyUrl)
-
 
 def _make_config(
-    particles: ParticlesLayerConfig, globe_texture_url: str
+    base_config: GlobeConfig, particles: ParticlesLayerConfig, globe: GlobeLayerConfig
 ) -> GlobeConfig:
-    return GlobeConfig(
-        init=GlobeInitConfig(
-            renderer_config={"preserveDrawingBuffer": True}, animate_in=False
-        ),
-        layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=_URL_ADAPTER.validate_python(globe_texture_url),
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
-        particles=particles,
-        view=GlobeViewConfig(
-            point_of_view=PointOfView(lat=0, lng=0, altitude=1.8), transition_ms=0
-        ),
-    )
-
-
-def _await_globe_ready(page_session: Page) -> None:
-    page_session.wait_for_function(
-        "window.__pyglobegl_globe_ready === true", timeout=20000
+    return base_config.model_copy(
+        update={
+            "globe": globe,
+            "particles": particles,
+            "view": GlobeViewConfig(
+                point_of_view=PointOfView(lat=0, lng=0, altitude=1.8), transition_ms=0
+            ),
+        }
     )
-    page_session.wait_for_timeout(250)
 
 
+@cache
 def _make_particle_texture() -> str:
     image = Image.new("RGBA", (32, 32), (0, 0, 0, 0))
     draw = ImageDraw.Draw(image)
@@ -62,6 +46,7 @@ def _make_particle_texture() -> str:
     return image_to_data_url(image)
 
 
+@cache
 def _make_particle_stripe_texture() -> str:
     image = Image.new("RGBA", (48, 48), (0, 0, 0, 0))
     draw = ImageDraw.Draw(image)
@@ -72,7 +57,12 @@ def _make_particle_stripe_texture() -> str:
 
 @pytest.mark.usefixtures("solara_test")
 def test_particles_accessors(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    globe_render_update,
+    canvas_assert_capture,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.97
     particles = [
@@ -106,22 +96,28 @@ def test_particles_accessors(
     ]
 
     config = _make_config(
-        ParticlesLayerConfig(particles_data=particles), globe_flat_texture_data_url
+        globe_capture_config,
+        ParticlesLayerConfig(particles_data=particles),
+        globe_flat_layer,
     )
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
+    globe_wait_ready(page_session)
     canvas_assert_capture(page_session, "initial", canvas_similarity_threshold)
 
-    widget.set_particles_data(updated)
-    page_session.wait_for_timeout(100)
+    globe_render_update(page_session, lambda: widget.set_particles_data(updated))
     canvas_assert_capture(page_session, "updated", canvas_similarity_threshold)
 
 
 @pytest.mark.usefixtures("solara_test")
 def test_particles_texture_added_via_set_data_uses_texture_accessor(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    globe_render_update,
+    canvas_assert_capture,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.97
     initial = [
@@ -153,18 +149,19 @@ def test_particles_texture_added_via_set_data_uses_texture_accessor(
     ]
 
     config = _make_config(
-        ParticlesLayerConfig(particles_data=initial), globe_flat_texture_data_url
+        globe_capture_config,
+        ParticlesLayerConfig(particles_data=initial),
+        globe_flat_layer,
     )
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
+    globe_wait_ready(page_session)
     canvas_assert_capture(
         page_session, "texture-runtime-initial", canvas_similarity_threshold
     )
 
-    widget.set_particles_data(updated)
-    page_session.wait_for_timeout(150)
+    globe_render_update(page_session, lambda: widget.set_particles_data(updated))
     canvas_assert_capture(
         page_session, "texture-runtime-updated", canvas_similarity_threshold
     )
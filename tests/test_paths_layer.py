@@ -4,14 +4,11 @@ from typing import TYPE_CHECKING
 from uuid import uuid4
 
 from IPython.display import display
-from pydantic import AnyUrl, TypeAdapter
 import pytest
 
 from pyglobegl import (
     GlobeConfig,
-    GlobeInitConfig,
     GlobeLayerConfig,
-    GlobeLayoutConfig,
     GlobeViewConfig,
     GlobeWidget,
     PathDatum,
@@ -24,11 +21,9 @@ if TYPE_CHECKING:
     from playwright.sync_api import Page
 
 
-_URL_ADAPTER = TypeAdapter(AnyUrl)
-
-
 def _make_config(
-    globe_texture_url: str,
+    base_config: GlobeConfig,
+    globe: GlobeLayerConfig,
     paths: PathsLayerConfig,
     *,
     lat: float = 0,
@@ -37,35 +32,29 @@ def _make_config(
     width: int = 256,
     height: int = 256,
 ) -> GlobeConfig:
-    globe_url = _URL_ADAPTER.validate_python(globe_texture_url)
-    return GlobeConfig(
-        init=GlobeInitConfig(
-            renderer_config={"preserveDrawingBuffer": True}, animate_in=False
-        ),
-        layout=GlobeLayoutConfig(
-            width=width, height=height, background_color="#000000"
-        ),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_url, show_atmosphere=False, show_graticules=False
-        ),
-        paths=paths,
-        view=GlobeViewConfig(
-            point_of_view=PointOfView(lat=lat, lng=lng, altitude=altitude),
-            transition_ms=0,
-        ),
-    )
-
-
-def _await_globe_ready(page_session: Page) -> None:
-    page_session.wait_for_function(
-        "window.__pyglobegl_globe_ready === true", timeout=20000
+    return base_config.model_copy(
+        update={
+            "layout": base_config.layout.model_copy(
+                update={"width": width, "height": height}
+            ),
+            "globe": globe,
+            "paths": paths,
+            "view": GlobeViewConfig(
+                point_of_view=PointOfView(lat=lat, lng=lng, altitude=altitude),
+                transition_ms=0,
+            ),
+        }
     )
-    page_session.wait_for_timeout(250)
 
 
 @pytest.mark.usefixtures("solara_test")
 def test_paths_accessors(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    globe_render_update,
+    canvas_assert_capture,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.97
     paths_data = [
@@ -77,23 +66,28 @@ def test_paths_accessors(
     updated_paths = [PathDatum(path=[(-10, -10), (10, 10)], color="#ffcc00")]
 
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PathsLayerConfig(paths_data=paths_data, path_transition_duration=0),
     )
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
+    globe_wait_ready(page_session)
     canvas_assert_capture(page_session, "initial", canvas_similarity_threshold)
 
-    widget.set_paths_data(updated_paths)
-    page_session.wait_for_timeout(100)
+    globe_render_update(page_session, lambda: widget.set_paths_data(updated_paths))
     canvas_assert_capture(page_session, "updated", canvas_similarity_threshold)
 
 
 @pytest.mark.usefixtures("solara_test")
 def test_path_label_tooltip(
-    page_session: Page, globe_hoverer, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    globe_render_update,
+    globe_hoverer,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     paths_data = [
         PathDatum(path=[(-10, 0), (10, 0)], label="Initial path", color="#ffcc00")
@@ -103,14 +97,15 @@ def test_path_label_tooltip(
     ]
 
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PathsLayerConfig(paths_data=paths_data, path_transition_duration=0),
         altitude=1.7,
     )
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
+    globe_wait_ready(page_session)
     globe_hoverer(page_session)
     page_session.wait_for_function(
         """
@@ -129,8 +124,7 @@ def test_path_label_tooltip(
         timeout=20000,
     )
 
-    widget.set_paths_data(updated_paths)
-    page_session.wait_for_timeout(100)
+    globe_render_update(page_session, lambda: widget.set_paths_data(updated_paths))
     globe_hoverer(page_session)
     page_session.wait_for_function(
         """
@@ -152,7 +146,13 @@ def test_path_label_tooltip(
 
 @pytest.mark.usefixtures("solara_test")
 def test_path_transition_duration(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    globe_render_update,
+    canvas_wait_settled,
+    canvas_assert_capture,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.98
     # Initial: Red line along the equator (centered).
@@ -161,7 +161,8 @@ def test_path_transition_duration(
     updated_paths = [PathDatum(path=[(0, -45), (0, 45)], color="#00ff00")]
 
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PathsLayerConfig(paths_data=initial_paths, path_transition_duration=1200),
         lat=0,
         lng=0,
@@ -170,19 +171,26 @@ def test_path_transition_duration(
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
-    page_session.wait_for_timeout(1400)
+    globe_wait_ready(page_session)
+    canvas_wait_settled(page_session)
     canvas_assert_capture(page_session, "initial", canvas_similarity_threshold)
 
-    widget.set_path_transition_duration(0)
-    widget.set_paths_data(updated_paths)
-    page_session.wait_for_timeout(500)
+    def _update() -> None:
+        widget.set_path_transition_duration(0)
+        widget.set_paths_data(updated_paths)
+
+    globe_render_update(page_session, _update, updates=2)
     canvas_assert_capture(page_session, "updated", canvas_similarity_threshold)
 
 
 @pytest.mark.usefixtures("solara_test")
 def test_path_stroke(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    globe_render_update,
+    canvas_assert_capture,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.99
     path_id = uuid4()
@@ -190,24 +198,32 @@ def test_path_stroke(
         PathDatum(id=path_id, path=[(-20, 0), (0, 20), (20, 0)], color="#ffcc00")
     ]
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PathsLayerConfig(paths_data=paths_data, path_transition_duration=0),
         altitude=1.7,
     )
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
+    globe_wait_ready(page_session)
     canvas_assert_capture(page_session, "thin", canvas_similarity_threshold)
 
-    widget._set_layer_prop("paths", widget._paths_props, "pathStroke", 2.0)
-    page_session.wait_for_timeout(100)
+    globe_render_update(
+        page_session,
+        lambda: widget._set_layer_prop("paths", widget._paths_props, "pathStroke", 2.0),
+    )
     canvas_assert_capture(page_session, "thick", canvas_similarity_threshold)
 
 
 @pytest.mark.usefixtures("solara_test")
 def test_path_dash(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    globe_render_update,
+    canvas_assert_capture,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.99
     path_id = uuid4()
@@ -221,24 +237,32 @@ def test_path_dash(
         )
     ]
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PathsLayerConfig(paths_data=paths_data, path_transition_duration=0),
         altitude=1.7,
     )
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
+    globe_wait_ready(page_session)
     canvas_assert_capture(page_session, "solid", canvas_similarity_threshold)
 
-    widget.update_path(path_id, dash_length=0.1, dash_gap=0.05)
-    page_session.wait_for_timeout(100)
+    globe_render_update(
+        page_session,
+        lambda: widget.update_path(path_id, dash_length=0.1, dash_gap=0.05),
+    )
     canvas_assert_capture(page_session, "dashed", canvas_similarity_threshold)
 
 
 @pytest.mark.usefixtures("solara_test")
 def test_path_color_gradient(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    globe_render_update,
+    canvas_assert_capture,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.97
     path_id = uuid4()
@@ -258,24 +282,29 @@ def test_path_color_gradient(
     ]
 
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PathsLayerConfig(paths_data=paths_data, path_transition_duration=0),
         altitude=1.6,
     )
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
+    globe_wait_ready(page_session)
     canvas_assert_capture(page_session, "gradient-initial", canvas_similarity_threshold)
 
-    widget.set_paths_data(updated_paths)
-    page_session.wait_for_timeout(100)
+    globe_render_update(page_session, lambda: widget.set_paths_data(updated_paths))
     canvas_assert_capture(page_session, "gradient-updated", canvas_similarity_threshold)
 
 
 @pytest.mark.usefixtures("solara_test")
 def test_path_3d_coordinates(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    globe_render_update,
+    canvas_assert_capture,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.98
     path_id = uuid4()
@@ -295,49 +324,58 @@ def test_path_3d_coordinates(
     ]
 
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PathsLayerConfig(paths_data=paths_data, path_transition_duration=0),
         altitude=1.8,
     )
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
+    globe_wait_ready(page_session)
     canvas_assert_capture(page_session, "3d-initial", canvas_similarity_threshold)
 
-    widget.set_paths_data(updated_paths)
-    page_session.wait_for_timeout(100)
+    globe_render_update(page_session, lambda: widget.set_paths_data(updated_paths))
     canvas_assert_capture(page_session, "3d-updated", canvas_similarity_threshold)
 
 
 @pytest.mark.usefixtures("solara_test")
 def test_path_resolution(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    globe_render_update,
+    canvas_assert_capture,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.97
     paths_data = [PathDatum(path=[(-45, -20), (45, 20)], color="#00ffcc")]
 
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PathsLayerConfig(paths_data=paths_data, path_transition_duration=0),
         altitude=1.7,
     )
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
-    widget.set_path_resolution(1)
-    page_session.wait_for_timeout(100)
+    globe_wait_ready(page_session)
+    globe_render_update(page_session, lambda: widget.set_path_resolution(1))
     canvas_assert_capture(page_session, "resolution-low", canvas_similarity_threshold)
 
-    widget.set_path_resolution(8)
-    page_session.wait_for_timeout(100)
+    globe_render_update(page_session, lambda: widget.set_path_resolution(8))
     canvas_assert_capture(page_session, "resolution-high", canvas_similarity_threshold)
 
 
 @pytest.mark.usefixtures("solara_test")
 def test_path_dash_initial_gap(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    globe_render_update,
+    canvas_assert_capture,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.98
     path_id = uuid4()
@@ -353,24 +391,31 @@ def test_path_dash_initial_gap(
     ]
 
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PathsLayerConfig(paths_data=paths_data, path_transition_duration=0),
         altitude=1.7,
     )
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
+    globe_wait_ready(page_session)
     canvas_assert_capture(page_session, "gap-0", canvas_similarity_threshold)
 
-    widget.update_path(path_id, dash_initial_gap=0.3)
-    page_session.wait_for_timeout(100)
+    globe_render_update(
+        page_session, lambda: widget.update_path(path_id, dash_initial_gap=0.3)
+    )
     canvas_assert_capture(page_session, "gap-0.3", canvas_similarity_threshold)
 
 
 @pytest.mark.usefixtures("solara_test")
 def test_path_multilinestring_source(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    globe_render_update,
+    canvas_assert_capture,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.98
     geopandas = pytest.importorskip("geopandas")
@@ -393,20 +438,20 @@ def test_path_multilinestring_source(
     updated_paths = paths_from_gdf(updated_gdf)
 
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PathsLayerConfig(paths_data=paths_data, path_transition_duration=0),
         altitude=1.6,
     )
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
+    globe_wait_ready(page_session)
     canvas_assert_capture(
         page_session, "multiline-initial", canvas_similarity_threshold
     )
 
-    widget.set_paths_data(updated_paths)
-    page_session.wait_for_timeout(100)
+    globe_render_update(page_session, lambda: widget.set_paths_data(updated_paths))
     canvas_assert_capture(
         page_session, "multiline-updated", canvas_similarity_threshold
     )
@@ -414,7 +459,12 @@ def test_path_multilinestring_source(
 
 @pytest.mark.usefixtures("solara_test")
 def test_path_dash_animate_time(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page,
+    globe_wait_ready,
+    canvas_wait_changed,
+    canvas_assert_capture,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.96
     path_id = uuid4()
@@ -431,16 +481,20 @@ def test_path_dash_animate_time(
     ]
 
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PathsLayerConfig(paths_data=paths_data, path_transition_duration=0),
         altitude=1.7,
     )
     widget = GlobeWidget(config=config)
     display(widget)
 
-    _await_globe_ready(page_session)
+    globe_wait_ready(page_session)
     canvas_assert_capture(page_session, "animate-off", canvas_similarity_threshold)
 
-    widget.update_path(path_id, dash_animate_time=400.0)
-    page_session.wait_for_timeout(300)
+    # The dashes cycle every 72 ms (dash plus gap of 0.18 of the path at 400 ms
+    # per path length), so any frame after the animation starts will do.
+    canvas_wait_changed(
+        page_session, lambda: widget.update_path(path_id, dash_animate_time=400.0)
+    )
     canvas_assert_capture(page_session, "animate-on", canvas_similarity_threshold)
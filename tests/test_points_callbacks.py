@@ -9,7 +9,6 @@ import pytest
 from pyglobegl import (
     GlobeConfig,
     GlobeInitConfig,
-    GlobeLayerConfig,
     GlobeLayoutConfig,
     GlobeViewConfig,
     GlobeWidget,
@@ -25,7 +24,7 @@ if TYPE_CHECKING:
 
 @pytest.mark.usefixtures("solara_test")
 def test_on_point_click_callback(
-    page_session: Page, globe_clicker, globe_earth_texture_url
+    page_session: Page, globe_clicker, globe_earth_layer
 ) -> None:
     click_event = Event()
     payload: dict[str, Any] = {}
@@ -40,11 +39,7 @@ def test_on_point_click_callback(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         points=PointsLayerConfig(
             points_data=[
                 PointDatum(
@@ -90,7 +85,7 @@ def test_on_point_click_callback(
 
 @pytest.mark.usefixtures("solara_test")
 def test_on_point_right_click_callback(
-    page_session: Page, globe_clicker, globe_earth_texture_url
+    page_session: Page, globe_clicker, globe_earth_layer
 ) -> None:
     click_event = Event()
     payload: dict[str, Any] = {}
@@ -105,11 +100,7 @@ def test_on_point_right_click_callback(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         points=PointsLayerConfig(
             points_data=[
                 PointDatum(
@@ -155,7 +146,7 @@ def test_on_point_right_click_callback(
 
 @pytest.mark.usefixtures("solara_test")
 def test_on_point_hover_callback(
-    page_session: Page, globe_hoverer, globe_earth_texture_url
+    page_session: Page, globe_hoverer, globe_earth_layer
 ) -> None:
     hover_event = Event()
     payload: dict[str, Any] = {}
@@ -170,11 +161,7 @@ def test_on_point_hover_callback(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         points=PointsLayerConfig(
             points_data=[
                 PointDatum(
@@ -206,7 +193,7 @@ def test_on_point_hover_callback(
 
 @pytest.mark.usefixtures("solara_test")
 def test_points_merge_disables_click(
-    page_session: Page, globe_clicker, globe_earth_texture_url
+    page_session: Page, globe_clicker, globe_earth_layer
 ) -> None:
     click_event = Event()
 
@@ -218,11 +205,7 @@ def test_points_merge_disables_click(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         points=PointsLayerConfig(
             points_data=[
                 PointDatum(
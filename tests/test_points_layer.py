@@ -8,7 +8,6 @@ import pytest
 from pyglobegl import (
     GlobeConfig,
     GlobeInitConfig,
-    GlobeLayerConfig,
     GlobeLayoutConfig,
     GlobeViewConfig,
     GlobeWidget,
@@ -24,7 +23,7 @@ if TYPE_CHECKING:
 
 @pytest.mark.usefixtures("solara_test")
 def test_points_accessors(
-    page_session: Page, canvas_assert_capture, globe_earth_texture_url
+    page_session: Page, canvas_assert_capture, globe_earth_layer
 ) -> None:
     canvas_similarity_threshold = 0.99
     points_data = [
@@ -42,11 +41,7 @@ def test_points_accessors(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         points=PointsLayerConfig(points_data=points_data),
         view=GlobeViewConfig(
             point_of_view=PointOfView(lat=0, lng=0, altitude=1.8), transition_ms=0
@@ -70,7 +65,7 @@ def test_points_accessors(
 
 @pytest.mark.usefixtures("solara_test")
 def test_point_resolution(
-    page_session: Page, canvas_assert_capture, globe_earth_texture_url
+    page_session: Page, canvas_assert_capture, globe_earth_layer
 ) -> None:
     canvas_similarity_threshold = 0.98
     initial_resolution = 3
@@ -84,11 +79,7 @@ def test_point_resolution(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         points=PointsLayerConfig(
             points_data=points_data, point_resolution=initial_resolution
         ),
@@ -114,7 +105,7 @@ def test_point_resolution(
 
 @pytest.mark.usefixtures("solara_test")
 def test_point_label_tooltip(
-    page_session: Page, globe_hoverer, globe_earth_texture_url
+    page_session: Page, globe_hoverer, globe_earth_layer
 ) -> None:
     points_data = [
         PointDatum(
@@ -141,11 +132,7 @@ def test_point_label_tooltip(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         points=PointsLayerConfig(points_data=points_data),
         view=GlobeViewConfig(
             point_of_view=PointOfView(lat=0, lng=0, altitude=1.6), transition_ms=0
@@ -198,7 +185,7 @@ def test_point_label_tooltip(
 
 @pytest.mark.usefixtures("solara_test")
 def test_points_transition_duration(
-    page_session: Page, canvas_assert_capture, globe_earth_texture_url
+    page_session: Page, canvas_assert_capture, globe_earth_layer
 ) -> None:
     canvas_similarity_threshold = 0.99
     initial_points = [
@@ -213,11 +200,7 @@ def test_points_transition_duration(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         points=PointsLayerConfig(
             points_data=initial_points, points_transition_duration=0
         ),
@@ -241,7 +224,7 @@ def test_points_transition_duration(
 
 @pytest.mark.usefixtures("solara_test")
 def test_points_merge(
-    page_session: Page, canvas_assert_capture, globe_earth_texture_url
+    page_session: Page, canvas_assert_capture, globe_earth_layer
 ) -> None:
     canvas_similarity_threshold = 0.99
     points_data = [
@@ -253,11 +236,7 @@ def test_points_merge(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         points=PointsLayerConfig(points_data=points_data, points_merge=False),
         view=GlobeViewConfig(
             point_of_view=PointOfView(lat=0, lng=0, altitude=1.6), transition_ms=0
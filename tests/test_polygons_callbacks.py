@@ -11,7 +11,6 @@ import pytest
 from pyglobegl import (
     GlobeConfig,
     GlobeInitConfig,
-    GlobeLayerConfig,
     GlobeLayoutConfig,
     GlobeViewConfig,
     GlobeWidget,
@@ -40,7 +39,7 @@ def _polygon() -> Polygon:
 
 @pytest.mark.usefixtures("solara_test")
 def test_on_polygon_click_callback(
-    page_session: Page, globe_clicker, globe_earth_texture_url
+    page_session: Page, globe_clicker, globe_earth_layer
 ) -> None:
     click_event = Event()
     payload: dict[str, Any] = {}
@@ -57,11 +56,7 @@ def test_on_polygon_click_callback(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         polygons=PolygonsLayerConfig(
             polygons_data=[
                 PolygonDatum(
@@ -105,7 +100,7 @@ def test_on_polygon_click_callback(
 
 @pytest.mark.usefixtures("solara_test")
 def test_on_polygon_right_click_callback(
-    page_session: Page, globe_clicker, globe_earth_texture_url
+    page_session: Page, globe_clicker, globe_earth_layer
 ) -> None:
     click_event = Event()
     payload: dict[str, Any] = {}
@@ -122,11 +117,7 @@ def test_on_polygon_right_click_callback(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         polygons=PolygonsLayerConfig(
             polygons_data=[
                 PolygonDatum(
@@ -170,7 +161,7 @@ def test_on_polygon_right_click_callback(
 
 @pytest.mark.usefixtures("solara_test")
 def test_on_polygon_hover_callback(
-    page_session: Page, globe_hoverer, globe_earth_texture_url
+    page_session: Page, globe_hoverer, globe_earth_layer
 ) -> None:
     hover_event = Event()
     payload: dict[str, Any] = {}
@@ -187,11 +178,7 @@ def test_on_polygon_hover_callback(
             renderer_config={"preserveDrawingBuffer": True}, animate_in=False
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
         polygons=PolygonsLayerConfig(
             polygons_data=[
                 PolygonDatum(
@@ -7,14 +7,11 @@ from uuid import uuid4
 from geojson_pydantic import Polygon
 from geojson_pydantic.types import Position2D, Position3D
 from IPython.display import display
-from pydantic import AnyUrl, TypeAdapter
 import pytest
 
 from pyglobegl import (
     GlobeConfig,
-    GlobeInitConfig,
     GlobeLayerConfig,
-    GlobeLayoutConfig,
     GlobeMaterialSpec,
     GlobeViewConfig,
     GlobeWidget,
@@ -79,11 +76,9 @@ def _circle_polygon(
     return Polygon(type="Polygon", coordinates=[coords])
 
 
-_URL_ADAPTER = TypeAdapter(AnyUrl)
-
-
 def _make_config(
-    globe_texture_url: str,
+    base_config: GlobeConfig,
+    globe: GlobeLayerConfig,
     polygons: PolygonsLayerConfig,
     *,
     lat: float = 0,
@@ -92,22 +87,18 @@ def _make_config(
     width: int = 256,
     height: int = 256,
 ) -> GlobeConfig:
-    globe_url = _URL_ADAPTER.validate_python(globe_texture_url)
-    return GlobeConfig(
-        init=GlobeInitConfig(
-            renderer_config={"preserveDrawingBuffer": True}, animate_in=False
-        ),
-        layout=GlobeLayoutConfig(
-            width=width, height=height, background_color="#000000"
-        ),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_url, show_atmosphere=False, show_graticules=False
-        ),
-        polygons=polygons,
-        view=GlobeViewConfig(
-            point_of_view=PointOfView(lat=lat, lng=lng, altitude=altitude),
-            transition_ms=0,
-        ),
+    return base_config.model_copy(
+        update={
+            "layout": base_config.layout.model_copy(
+                update={"width": width, "height": height}
+            ),
+            "globe": globe,
+            "polygons": polygons,
+            "view": GlobeViewConfig(
+                point_of_view=PointOfView(lat=lat, lng=lng, altitude=altitude),
+                transition_ms=0,
+            ),
+        }
     )
 
 
@@ -173,7 +164,8 @@ def test_polygons_accessors(
     canvas_reference_path,
     canvas_compare_images,
     canvas_save_capture,
-    globe_flat_texture_data_url,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.97
     polygons_data = [
@@ -206,7 +198,8 @@ def test_polygons_accessors(
     ]
 
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PolygonsLayerConfig(
             polygons_data=polygons_data, polygons_transition_duration=0
         ),
@@ -239,7 +232,7 @@ def test_polygons_accessors(
 
 @pytest.mark.usefixtures("solara_test")
 def test_polygon_label_tooltip(
-    page_session: Page, globe_hoverer, globe_flat_texture_data_url
+    page_session: Page, globe_hoverer, globe_flat_layer, globe_capture_config
 ) -> None:
     polygons_data = [
         PolygonDatum(
@@ -261,7 +254,8 @@ def test_polygon_label_tooltip(
     ]
 
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PolygonsLayerConfig(
             polygons_data=polygons_data, polygons_transition_duration=0
         ),
@@ -317,7 +311,8 @@ def test_polygons_transition_duration(
     canvas_reference_path,
     canvas_compare_images,
     canvas_save_capture,
-    globe_flat_texture_data_url,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.975
     initial_polygons = [
@@ -340,7 +335,8 @@ def test_polygons_transition_duration(
     ]
 
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PolygonsLayerConfig(
             polygons_data=initial_polygons, polygons_transition_duration=1200
         ),
@@ -381,7 +377,8 @@ def test_polygon_cap_material(
     canvas_reference_path,
     canvas_compare_images,
     canvas_save_capture,
-    globe_flat_texture_data_url,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.99
     polygon_id = uuid4()
@@ -395,7 +392,8 @@ def test_polygon_cap_material(
         )
     ]
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PolygonsLayerConfig(
             polygons_data=polygons_data, polygons_transition_duration=0
         ),
@@ -439,7 +437,8 @@ def test_polygon_side_material(
     canvas_reference_path,
     canvas_compare_images,
     canvas_save_capture,
-    globe_flat_texture_data_url,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.99
     polygons_data = [
@@ -451,7 +450,8 @@ def test_polygon_side_material(
         )
     ]
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PolygonsLayerConfig(
             polygons_data=polygons_data, polygons_transition_duration=0
         ),
@@ -497,7 +497,8 @@ def test_polygon_cap_color(
     canvas_reference_path,
     canvas_compare_images,
     canvas_save_capture,
-    globe_flat_texture_data_url,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.99
     initial_cap_color = "#ff66cc"
@@ -505,7 +506,8 @@ def test_polygon_cap_color(
     polygon_id = uuid4()
     polygon = _polygon(-20, -5, 20, 5)
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PolygonsLayerConfig(
             polygons_data=[
                 PolygonDatum(
@@ -556,7 +558,8 @@ def test_polygon_side_color(
     canvas_reference_path,
     canvas_compare_images,
     canvas_save_capture,
-    globe_flat_texture_data_url,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.99
     initial_side_color = "#66ccff"
@@ -564,7 +567,8 @@ def test_polygon_side_color(
     polygon_id = uuid4()
     polygon = _polygon(-15, 5, 15, 20)
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PolygonsLayerConfig(
             polygons_data=[
                 PolygonDatum(
@@ -615,7 +619,8 @@ def test_polygon_stroke_color(
     canvas_reference_path,
     canvas_compare_images,
     canvas_save_capture,
-    globe_flat_texture_data_url,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.99
     initial_stroke_color = "#ffffff"
@@ -623,7 +628,8 @@ def test_polygon_stroke_color(
     polygon_id = uuid4()
     polygon = _polygon(-20, -5, 20, 5)
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PolygonsLayerConfig(
             polygons_data=[
                 PolygonDatum(
@@ -672,7 +678,8 @@ def test_polygon_altitude(
     canvas_reference_path,
     canvas_compare_images,
     canvas_save_capture,
-    globe_flat_texture_data_url,
+    globe_flat_layer,
+    globe_capture_config,
 ) -> None:
     canvas_similarity_threshold = 0.99
     initial_altitude = 0.02
@@ -680,7 +687,8 @@ def test_polygon_altitude(
     polygon_id = uuid4()
     polygon = _polygon(-20, -5, 20, 5)
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PolygonsLayerConfig(
             polygons_data=[
                 PolygonDatum(
@@ -724,7 +732,7 @@ def test_polygon_altitude(
 
 @pytest.mark.usefixtures("solara_test")
 def test_polygon_cap_curvature_resolution(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page, canvas_assert_capture, globe_flat_layer, globe_capture_config
 ) -> None:
     canvas_similarity_threshold = 0.99
     initial_curvature = 2.0
@@ -732,7 +740,8 @@ def test_polygon_cap_curvature_resolution(
     polygon_id = uuid4()
     polygon = _circle_polygon(0, 0, 37.5, steps=96)
     config = _make_config(
-        globe_flat_texture_data_url,
+        globe_capture_config,
+        globe_flat_layer,
         PolygonsLayerConfig(
             polygons_data=[
                 PolygonDatum(
@@ -3,14 +3,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from IPython.display import display
-from pydantic import AnyUrl, TypeAdapter
 import pytest
 
 from pyglobegl import (
     GlobeConfig,
-    GlobeInitConfig,
     GlobeLayerConfig,
-    GlobeLayoutConfig,
     GlobeViewConfig,
     GlobeWidget,
     PointOfView,
@@ -22,24 +19,18 @@ from pyglobegl import (
 if TYPE_CHECKING:
     from playwright.sync_api import Page
 
-_URL_ADAPTER = TypeAdapter(AnyUrl)
 
-
-def _make_config(rings: RingsLayerConfig, globe_texture_url: str) -> GlobeConfig:
-    return GlobeConfig(
-        init=GlobeInitConfig(
-            renderer_config={"preserveDrawingBuffer": True}, animate_in=False
-        ),
-        layout=GlobeLayoutConfig(width=256, height=256, background_color="#000000"),
-        globe=GlobeLayerConfig(
-            globe_image_url=_URL_ADAPTER.validate_python(globe_texture_url),
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
-        rings=rings,
-        view=GlobeViewConfig(
-            point_of_view=PointOfView(lat=0, lng=0, altitude=1.8), transition_ms=0
-        ),
+def _make_config(
+    base_config: GlobeConfig, rings: RingsLayerConfig, globe: GlobeLayerConfig
+) -> GlobeConfig:
+    return base_config.model_copy(
+        update={
+            "globe": globe,
+            "rings": rings,
+            "view": GlobeViewConfig(
+                point_of_view=PointOfView(lat=0, lng=0, altitude=1.8), transition_ms=0
+            ),
+        }
     )
 
 
@@ -52,7 +43,7 @@ def _await_globe_ready(page_session: Page) -> None:
 
 @pytest.mark.usefixtures("solara_test")
 def test_rings_accessors(
-    page_session: Page, canvas_assert_capture, globe_flat_texture_data_url
+    page_session: Page, canvas_assert_capture, globe_flat_layer, globe_capture_config
 ) -> None:
     canvas_similarity_threshold = 0.96
     rings = [
@@ -79,8 +70,9 @@ def test_rings_accessors(
     ]
 
     config = _make_config(
+        globe_capture_config,
         RingsLayerConfig(rings_data=rings, ring_resolution=32),
-        globe_flat_texture_data_url,
+        globe_flat_layer,
     )
     widget = GlobeWidget(config=config)
     display(widget)
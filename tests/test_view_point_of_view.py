@@ -8,7 +8,6 @@ import pytest
 from pyglobegl import (
     GlobeConfig,
     GlobeInitConfig,
-    GlobeLayerConfig,
     GlobeLayoutConfig,
     GlobeViewConfig,
     GlobeWidget,
@@ -42,7 +41,8 @@ def test_view_point_of_view(
     canvas_reference_path,
     canvas_compare_images,
     canvas_save_capture,
-    globe_earth_texture_url,
+    globe_wait_ready,
+    globe_earth_layer,
     pov,
     expected_altitude,
 ) -> None:
@@ -53,29 +53,12 @@ def test_view_point_of_view(
         ),
         layout=GlobeLayoutConfig(width=256, height=256, background_color="#ff00ff"),
         view=GlobeViewConfig(point_of_view=pov),
-        globe=GlobeLayerConfig(
-            globe_image_url=globe_earth_texture_url,
-            show_atmosphere=False,
-            show_graticules=False,
-        ),
+        globe=globe_earth_layer,
     )
     widget = GlobeWidget(config=config)
     display(widget)
 
-    page_session.wait_for_function(
-        "document.querySelector('canvas, .jupyter-widgets') !== null", timeout=20000
-    )
-    page_session.wait_for_function(
-        "window.__pyglobegl_globe_ready === true", timeout=20000
-    )
-    page_session.wait_for_function(
-        (
-            "expected => window.__pyglobegl_pov && "
-            "Math.abs(window.__pyglobegl_pov.altitude - expected) < 0.001"
-        ),
-        arg=expected_altitude,
-        timeout=20000,
-    )
+    globe_wait_ready(page_session, pov_altitude=expected_altitude)
 
     captured_image = canvas_capture(page_session)
     test_label = canvas_label